@@ -0,0 +1,81 @@
+# 재예측 엔진(shiitake.forecast) 처리량: 프로세스 수별 초당 시계열 수
+#   python benchmarks/bench_forecast.py                      # 도 100개(900 시계열), 6년치
+#   python benchmarks/bench_forecast.py --regions 50 --workers 1 2 4 --out forecast.json
+# 합성 final.csv 로 단가 프레임을 한 번 만든 뒤, 같은 시계열 집합을 workers 값마다 repeat 번 맞춘다.
+# workers=1 은 프로세스 풀 없이 현재 프로세스에서 실행한 기준값이다.
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_pages import _git_commit  # noqa: E402
+from shiitake.config import CSV_MACRO  # noqa: E402
+from shiitake.forecast import MODELS, run_forecasts  # noqa: E402
+from shiitake.prices import build_price_data  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재예측 엔진 프로세스 수별 처리량")
+    parser.add_argument("--regions", type=int, default=100)
+    parser.add_argument("--years", type=int, default=6)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--horizon", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    from synthetic import DISTS, GRADES, write_macro_csv
+
+    workdir = tempfile.mkdtemp(prefix="shiitake-forecast-")
+    try:
+        n_keys = args.regions * len(GRADES) * len(DISTS)
+        path = os.path.join(workdir, CSV_MACRO)
+        rows = write_macro_csv(path, n_keys * 365 * args.years, n_regions=args.regions)
+        prices = build_price_data(path)
+
+        results = []
+        print(f"{'workers':>8}{'series':>8}{'median s':>10}{'series/s':>10}{'speedup':>9}")
+        for workers in args.workers:
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                df, n_series = run_forecasts(prices, args.horizon, workers)
+                timings.append(time.perf_counter() - started)
+            median = statistics.median(timings)
+            results.append({
+                "workers": workers, "series": n_series, "rows": len(df),
+                "seconds": [round(t, 4) for t in timings], "series_per_sec": round(n_series / median, 1),
+            })
+            baseline = statistics.median(results[0]["seconds"])
+            print(f"{workers:>8}{n_series:>8}{median:>10.3f}{n_series / median:>10.1f}{baseline / median:>9.2f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "macro_rows": rows,
+        "horizon": args.horizon,
+        "models": list(MODELS),
+        "results": results,
+    }
+    out = args.out or os.path.join(ROOT, "benchmarks", "results", f"forecast-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
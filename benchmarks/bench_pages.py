@@ -0,0 +1,140 @@
+# 페이지별 헤드리스 벤치마크 (streamlit.testing AppTest)
+#   python benchmarks/bench_pages.py                         # 10k / 1M / 10M 행
+#   python benchmarks/bench_pages.py --rows 10000 --reruns 5 --out bench.json
+# 크기마다 합성 final.csv / 예측 CSV 를 만들고, 페이지마다 새 프로세스에서
+# 첫 실행(콜드, 컬럼 캐시 생성 포함)과 이후 rerun 의 벽시계 시간, 구간별(shiitake.perf) 시간,
+# 최대 RSS 를 기록해 JSON 으로 저장한다. 커밋 간 결과 파일을 비교해 회귀를 확인한다.
+import argparse
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from shiitake.columnar import CACHE_DIRNAME  # noqa: E402
+from shiitake.config import CSV_MACRO, CSV_PRED  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+DASHBOARD = "💼 유통 정보 대시보드"
+PAGES = {
+    "social": ("📊 소셜 빅데이터 분석", None),
+    "socioecon": (DASHBOARD, "📈 사회경제 지표"),
+    "price_trend": (DASHBOARD, "💰 단가 트렌드"),
+    "future": (DASHBOARD, "🔮 미래 단가 예측"),
+}
+
+
+def run_page(page, reruns):
+    # 현재 작업 디렉터리의 CSV 로 page 를 (1 + reruns) 번 실행한다.
+    from streamlit.testing.v1 import AppTest
+
+    from shiitake import perf
+
+    perf.enable()
+    main_page, tab = PAGES[page]
+    at = AppTest.from_file(APP, default_timeout=3600)
+    at.session_state["entered"] = True
+    at.session_state["user_type"] = "생산자"
+    at.session_state["main_page"] = main_page
+    if tab:
+        at.session_state["producer_tab"] = tab
+
+    runs = []
+    for _ in range(reruns + 1):
+        started = time.perf_counter()
+        at.run()
+        wall = time.perf_counter() - started
+        errors = [str(e.value) for e in at.exception]
+        stages = perf.recent_runs()[-1]["stages"] if perf.recent_runs() else {}
+        runs.append({"wall": round(wall, 6), "stages": stages, "errors": errors})
+
+    warm = [r["wall"] for r in runs[1:]]
+    return {
+        "page": page,
+        "cold": runs[0],
+        "reruns": runs[1:],
+        "rerun_wall_median": round(statistics.median(warm), 6) if warm else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_size(rows, regions, reruns, pages):
+    from synthetic import write_macro_csv, write_pred_csv
+
+    workdir = tempfile.mkdtemp(prefix="shiitake-bench-")
+    try:
+        started = time.perf_counter()
+        n_rows = write_macro_csv(os.path.join(workdir, CSV_MACRO), rows)
+        n_pred = write_pred_csv(os.path.join(workdir, CSV_PRED), regions)
+        generated = time.perf_counter() - started
+        results = []
+        for page in pages:
+            # 페이지마다 컬럼 캐시를 지우고 새 프로세스에서 측정한다 (콜드 스타트 + 페이지별 최대 RSS).
+            shutil.rmtree(os.path.join(workdir, CACHE_DIRNAME), ignore_errors=True)
+            proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--page", page, "--reruns", str(reruns)],
+                cwd=workdir, capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                results.append({"page": page, "failed": proc.stderr.strip().splitlines()[-1:]})
+                continue
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            print(f"  rows={n_rows:,} page={page} cold={results[-1]['cold']['wall']:.3f}s "
+                  f"rerun={results[-1]['rerun_wall_median']}s rss={results[-1]['peak_rss_mb']}MB", file=sys.stderr)
+        return {
+            "rows": n_rows,
+            "pred_rows": n_pred,
+            "csv_bytes": os.path.getsize(os.path.join(workdir, CSV_MACRO)),
+            "generate_seconds": round(generated, 3),
+            "pages": results,
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지별 헤드리스 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--regions", type=int, default=200, help="예측 CSV 의 도(지역) 수")
+    parser.add_argument("--reruns", type=int, default=3)
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    parser.add_argument("--out", default=None)
+    parser.add_argument("--page", choices=list(PAGES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.page:
+        print(json.dumps(run_page(args.page, args.reruns), ensure_ascii=False))
+        return
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "sizes": [run_size(rows, args.regions, args.reruns, args.pages) for rows in args.rows],
+    }
+    out = args.out or os.path.join(ROOT, "benchmarks", "results", f"pages-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
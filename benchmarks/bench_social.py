@@ -0,0 +1,98 @@
+# 소셜 집계(shiitake.social) 처리량: 프로세스 수별 초당 행 수와 최대 RSS
+#   python benchmarks/bench_social.py                        # 4개 파일 × 50만 행, 원문(text) 포함
+#   python benchmarks/bench_social.py --rows 2000000 --files 8 --workers 1 2 4 --out social.json
+# 합성 원본 내보내기를 파일(샤드) 단위로 한 번 쓴 뒤, 같은 파일 집합을 workers 값마다 repeat 번 집계한다.
+# workers=1 은 프로세스 풀 없이 현재 프로세스에서 실행한 기준값이고, RSS 는 각 실행을 새 프로세스에서 재서 얻는다.
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_pages import _git_commit  # noqa: E402
+from shiitake.social import CHUNK_ROWS  # noqa: E402
+
+# 자식 프로세스: 한 번 집계하고 걸린 시간·행 수·최대 RSS(자신 + 풀 프로세스 중 큰 값, KB)를 JSON 한 줄로 출력
+RUN = """
+import json, resource, sys, time
+from shiitake.social import aggregate_exports
+paths, chunk_rows, workers = json.loads(sys.argv[1])
+started = time.perf_counter()
+counts, rows, summary = aggregate_exports(paths, chunk_rows, workers)
+seconds = time.perf_counter() - started
+rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+print(json.dumps({"seconds": seconds, "rows": rows, "max_rss_kb": rss}))
+"""
+
+
+def run_once(paths, chunk_rows, workers):
+    proc = subprocess.run([sys.executable, "-c", RUN, json.dumps([paths, chunk_rows, workers])],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소셜 집계 프로세스 수별 처리량")
+    parser.add_argument("--rows", type=int, default=2_000_000, help="전체 행 수 (파일들에 고르게 나눔)")
+    parser.add_argument("--files", type=int, default=4)
+    parser.add_argument("--no-text", action="store_true", help="원문(text) 없이 keyword 만 센다")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    from synthetic import write_social_csv
+
+    workdir = tempfile.mkdtemp(prefix="shiitake-social-")
+    try:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(workdir, f"export_{i:02d}.csv")
+            write_social_csv(path, args.rows // args.files, seed=i, text=not args.no_text)
+            paths.append(path)
+
+        results = []
+        print(f"{'workers':>8}{'rows':>10}{'median s':>10}{'rows/s':>12}{'speedup':>9}{'max RSS MB':>12}")
+        for workers in args.workers:
+            runs = [run_once(paths, args.chunk_rows, workers) for _ in range(args.repeat)]
+            timings = [r["seconds"] for r in runs]
+            median = statistics.median(timings)
+            rows = runs[0]["rows"]
+            rss_mb = max(r["max_rss_kb"] for r in runs) / 1024
+            results.append({
+                "workers": workers, "rows": rows, "seconds": [round(t, 4) for t in timings],
+                "rows_per_sec": round(rows / median), "max_rss_mb": round(rss_mb, 1),
+            })
+            baseline = statistics.median(results[0]["seconds"])
+            print(f"{workers:>8}{rows:>10}{median:>10.3f}{rows / median:>12.0f}{baseline / median:>9.2f}{rss_mb:>12.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    commit = _git_commit()
+    report = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "cpus": os.cpu_count(),
+        "files": args.files,
+        "text": not args.no_text,
+        "chunk_rows": args.chunk_rows,
+        "results": results,
+    }
+    out = args.out or os.path.join(ROOT, "benchmarks", "results", f"social-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# 콜드 스타트 import 비용 비교 (python -X importtime)
+#   python benchmarks/importtime.py
+# 예전 app.py 처럼 모든 페이지 의존성을 맨 위에서 import 하는 경우와,
+# 페이지 모듈을 필요할 때만 import 하는 지금 구조(인트로/각 페이지)를 새 프로세스에서 각각 측정한다.
+# 지금 구조의 시나리오는 app.py 의 최상위 import 문을 그대로 읽어 와 그 뒤에 main() 의 지연 import 를 붙인다.
+import ast
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def app_imports(path=os.path.join(ROOT, "app.py")):
+    # app.py 최상위의 import 문 (소스 그대로)
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    return [ast.get_source_segment(source, node) for node in ast.parse(source).body
+            if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+APP = app_imports()
+# main() 에서 인트로를 지나 페이지를 그릴 때 import 하는 것들
+ENTERED = APP + ["from views.common import no_permission_page, sidebar_header", "from shiitake import memory"]
+
+SCENARIOS = [
+    ("모든 의존성 (기존 app.py)", ["import streamlit", "import plotly.express", "import plotly.graph_objects",
+                                "import pandas", "import numpy", "import matplotlib.pyplot",
+                                "import koreanize_matplotlib", "import qrcode"]),
+    ("app 기본 (최상위 import)", APP),
+    ("인트로", APP + ["from views.intro import main_intro_page"]),
+    ("소셜 빅데이터", ENTERED + ["from views.social import social_bigdata_page"]),
+    ("사회경제 지표", ENTERED + ["from views.producer import producer_page", "from views.socioecon import socioecon_page"]),
+    ("단가 트렌드", ENTERED + ["from views.producer import producer_page", "from views.price_trend import price_trend_page"]),
+    ("미래 단가 예측", ENTERED + ["from views.producer import producer_page", "from views.future import future_page"]),
+]
+
+
+def import_time_us(statements):
+    # 최상위 import 들의 cumulative 시간 합 (마이크로초)
+    code = "; ".join(statements)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total
+
+
+def main(repeat=3):
+    print(f"{'시나리오':<28}{'import (ms)':>12}")
+    for label, modules in SCENARIOS:
+        best = min(import_time_us(modules) for _ in range(repeat))
+        print(f"{label:<28}{best / 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# 벤치마크용 합성 데이터 생성
+#   final.csv: (조사일 × 도 × 등급 × 유통구분) 단가 행 + 날짜별 사회경제 지표
+#   예측 CSV : CSV_PRED 와 같은 스키마, 도(지역) 수를 늘린 버전
+#   소셜 CSV : 소셜 언급 원본 내보내기 (shiitake.social 입력)
+import numpy as np
+import pandas as pd
+
+from shiitake.indicators import INDICATORS
+
+REGIONS = ["강원도", "경기도", "경상남도", "경상북도", "전라남도", "전라북도", "충청남도", "제주특별자치도"]
+GRADES = {1: "1 (보통)", 2: "2 (상)", 3: "3 (특)"}
+DISTS = {1: "1 (생산지)", 2: "2 (도매지)", 3: "3 (소비지)"}
+MODELS = ["Prophet", "SARIMAX", "LSTM", "XGBoost"]
+CHUNK_ROWS = 1_000_000
+
+
+def _macro_chunk(dates, keys, rng):
+    n_keys = len(keys)
+    n = len(dates) * n_keys
+    day = np.repeat(np.arange(len(dates)), n_keys)
+    key = np.tile(np.arange(n_keys), len(dates))
+    base = 10000 + keys["등급"].to_numpy()[key] * 1500 + keys["유통구분"].to_numpy()[key] * 700
+    season = 800 * np.sin(2 * np.pi * dates.dayofyear.to_numpy()[day] / 365.25)
+    price = (base + season + rng.normal(0, 400, n)).round().astype("int64")
+    df = pd.DataFrame({
+        "조사일": dates.strftime("%Y-%m-%d").to_numpy()[day],
+        "도": keys["도"].to_numpy()[key],
+        "등급": keys["등급"].to_numpy()[key],
+        "유통구분": keys["유통구분"].to_numpy()[key],
+        "당일": pd.Series(price).map("{:,}".format).to_numpy(),
+    })
+    t = np.arange(len(dates))
+    trend = {
+        "소비자물가지수": 105 + 0.01 * t,
+        "시간당 최저임금(원)": 9160 + 460 * (dates.year.to_numpy() - 2022),
+        "평균유가": 1650 + 120 * np.sin(t / 60),
+        "산업용 전기 (₩/kWh)": 120 + 0.05 * t,
+        "LPG (₩/L)": 1000 + 50 * np.cos(t / 90),
+        "LNG (₩/MMBtu)": 20 + 3 * np.sin(t / 45),
+    }
+    for name in INDICATORS:
+        df[name] = np.round(np.asarray(trend[name], dtype="float64"), 2)[day]
+    return df
+
+
+def write_macro_csv(path, rows, n_regions=8, seed=0):
+    # rows 개 이상이 되도록 날짜 수를 정하고 CHUNK_ROWS 단위로 나눠 쓴다.
+    rng = np.random.default_rng(seed)
+    regions = (REGIONS * (n_regions // len(REGIONS) + 1))[:n_regions]
+    regions = [r if i < len(REGIONS) else f"{r}{i}" for i, r in enumerate(regions)]
+    keys = pd.MultiIndex.from_product([regions, list(GRADES), list(DISTS)],
+                                      names=["도", "등급", "유통구분"]).to_frame(index=False)
+    n_days = max(-(-rows // len(keys)), 1)
+    dates = pd.date_range("2010-01-01", periods=n_days, freq="D")
+    days_per_chunk = max(CHUNK_ROWS // len(keys), 1)
+    for i in range(0, n_days, days_per_chunk):
+        chunk = _macro_chunk(dates[i:i + days_per_chunk], keys, rng)
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    return n_days * len(keys)
+
+
+def write_pred_csv(path, n_regions=200, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for r in range(n_regions):
+        region = REGIONS[r] if r < len(REGIONS) else f"지역{r:04d}"
+        for g, g_label in GRADES.items():
+            for u, u_label in DISTS.items():
+                model = MODELS[rng.integers(len(MODELS))]
+                rows.append(_pred_row(rng, region, g, g_label, u, u_label, model))
+    pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8-sig")
+    return len(rows)
+
+
+def _pred_row(rng, region, g, g_label, u, u_label, model):
+    pred = int(9000 + g * 2000 + u * 800 + rng.normal(0, 1500))
+    actual = int(pred + rng.normal(0, 800))
+    last = int(pred + rng.normal(0, 1200))
+    return {
+        "도": region, "등급": g_label, "등급_num": g, "유통구분": u_label, "유통_num": u,
+        "예상단가(원)": pred, "모델": model,
+        "테스트_RMSE": round(float(rng.uniform(500, 4000)), 2),
+        "실제평균단가": actual, "예측-실제평균(원)": pred - actual,
+        "마지막판매단가": last, "예측-마지막판매(원)": pred - last,
+    }
+
+
+SOCIAL_KEYWORDS = ["표고버섯", "면역력", "볶음", "육수", "비타민D", "채식", "콜레스테롤", "재배", "베타글루칸", "표고전",
+                   "샐러드", "다이어트", "비건", "국물", "가격", "건조표고"]
+SOCIAL_TOPICS = ["요리/레시피", "건강/효능", "생산/재배", "유통/가격"]
+SOCIAL_FILLERS = ["오늘", "저녁", "반찬", "마트", "정말", "맛있어요", "추천", "레시피", "건강", "가족", "주말", "시장"]
+SOCIAL_PARTICLES = ["", "", "은", "는", "이", "을", "를", "으로", "도", "와"]
+WORDS_PER_POST = 6
+
+
+def _social_text(keyword, rng):
+    # 키워드 하나 + 흔한 단어들에 조사를 붙인 짧은 게시글
+    n = len(keyword)
+    words = rng.choice(SOCIAL_FILLERS + SOCIAL_KEYWORDS, (n, WORDS_PER_POST - 1))
+    particles = rng.choice(SOCIAL_PARTICLES, (n, WORDS_PER_POST))
+    cols = [keyword] + [words[:, i] for i in range(WORDS_PER_POST - 1)]
+    text = pd.Series(cols[0]).str.cat(pd.Series(particles[:, 0]))
+    for i in range(1, WORDS_PER_POST):
+        text = text.str.cat(pd.Series(cols[i]).str.cat(pd.Series(particles[:, i])), sep=" ")
+    return text.to_numpy()
+
+
+def write_social_csv(path, rows, seed=0, text=True):
+    # 소셜 언급 원본 내보내기 (date, keyword, text, sentiment, topic, age), CHUNK_ROWS 단위로 나눠 쓴다.
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2019-01-01")
+    days = (np.datetime64("2024-01-01") - start).astype(int)
+    weights = 1 / np.arange(1, len(SOCIAL_KEYWORDS) + 1)
+    for i in range(0, rows, CHUNK_ROWS):
+        n = min(CHUNK_ROWS, rows - i)
+        # 뒤 연도일수록 언급이 많도록 날짜를 기울여 뽑는다.
+        day = (np.sqrt(rng.random(n)) * days).astype(int)
+        keyword = rng.choice(SOCIAL_KEYWORDS, n, p=weights / weights.sum())
+        df = pd.DataFrame({
+            "date": (start + day).astype(str),
+            "keyword": keyword,
+            "sentiment": rng.choice(["긍정", "중립", "부정"], n, p=[0.76, 0.16, 0.08]),
+            "topic": rng.choice(SOCIAL_TOPICS, n, p=[0.38, 0.32, 0.18, 0.12]),
+            "age": rng.choice(["20대", "30대", "40대", "50대", "60대", "70대"], n, p=[0.15, 0.16, 0.2, 0.22, 0.17, 0.1]),
+        })
+        if text:
+            df.insert(2, "text", _social_text(keyword, rng))
+        df.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+    return rows
@@ -0,0 +1 @@
+# 표고버섯 대시보드 데이터/연산 계층 (Streamlit UI 와 분리)
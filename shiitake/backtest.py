@@ -0,0 +1,285 @@
+# 일괄 백테스트: 테스트_RMSE / 테스트_MAPE 재계산.
+# 월별 집계(PriceData.monthly)의 (도, 등급, 유통구분) 시계열을 끝을 맞춘 2차원 배열(앞쪽은 NaN 패딩)과
+# 관측 마스크로 쌓고, 모든 시계열을 한꺼번에 rolling-origin 으로 평가한다.
+# 원점(origin)은 모든 시계열에 공통인 열 위치이고, 원점마다 1..horizon 개월 앞을 예측해 관측된 값과만 비교한다.
+# 시계열 축으로는 Python 반복이 없다 (Holt-Winters 만 시간 축으로 반복).
+#   python -m shiitake.backtest --horizon 12 --origins 12
+import argparse
+import logging
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from shiitake.config import CSV_MACRO
+from shiitake.forecast import RIDGE_LAGS, RIDGE_LAMBDA, SEASON, output_path, write_forecasts
+from shiitake.index import KEY_COLUMNS
+from shiitake.predictions import DIST_LABELS, GRADE_LABELS, PRED_SCHEMA
+
+log = logging.getLogger(__name__)
+
+N_ORIGINS = 12
+# 예측 엔진(forecast)의 같은 이름 모델 행과 겹쳐 덮어쓰지 않도록 백테스트 결과의 모델 이름에 붙인다.
+MODEL_SUFFIX = "(백테스트)"
+HW_GRID = np.array([(a, b, g) for a in (0.2, 0.5, 0.8) for b in (0.05, 0.2) for g in (0.1, 0.3)])
+
+
+@dataclass(frozen=True)
+class SeriesStack:
+    keys: pd.DataFrame
+    # (시계열 수, T) 월 평균, 끝을 맞추고 앞은 NaN. 안쪽 빈 달은 직전 값으로 채움
+    values: np.ndarray
+    # values 중 실제로 관측된 칸
+    observed: np.ndarray
+    # 시계열별 첫 관측 열
+    starts: np.ndarray
+
+
+def _ffill(y):
+    n, t = y.shape
+    idx = np.where(np.isnan(y), 0, np.arange(t))
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    return y[np.arange(n)[:, None], idx]
+
+
+def stack_series(table):
+    # 월별 집계 테이블(키·기간순)을 끝을 맞춘 2차원 배열로 쌓는다.
+    gid = table.groupby(KEY_COLUMNS, observed=True, sort=False).ngroup().to_numpy()
+    month = (table["기간"].dt.year * 12 + table["기간"].dt.month).to_numpy()
+    n = gid.max() + 1 if len(gid) else 0
+    first = np.full(n, np.iinfo(np.int64).max)
+    last = np.full(n, np.iinfo(np.int64).min)
+    np.minimum.at(first, gid, month)
+    np.maximum.at(last, gid, month)
+    length = last - first + 1
+    t = int(length.max()) if n else 0
+    starts = t - length
+    values = np.full((n, t), np.nan)
+    values[gid, month - first[gid] + starts[gid]] = table["평균"].to_numpy(dtype="float64")
+    observed = ~np.isnan(values)
+    keys = table[KEY_COLUMNS].iloc[np.unique(gid, return_index=True)[1]].reset_index(drop=True)
+    return SeriesStack(keys, _ffill(values), observed, starts)
+
+
+def _leads(horizon):
+    return np.arange(1, horizon + 1)
+
+
+def naive(stack, origins, horizon):
+    return np.repeat(stack.values[:, origins][:, :, None], horizon, axis=2)
+
+
+def seasonal_naive(stack, origins, horizon):
+    h = _leads(horizon)
+    idx = origins[:, None] + h[None, :] - SEASON * np.ceil(h / SEASON).astype(int)[None, :]
+    return np.where(idx >= 0, stack.values[:, np.clip(idx, 0, None)], np.nan)
+
+
+def drift(stack, origins, horizon):
+    # 최근 한 해의 기울기로 직선 연장
+    last = stack.values[:, origins]
+    prev = np.where(origins >= SEASON, stack.values[:, np.clip(origins - SEASON, 0, None)], np.nan)
+    slope = (last - prev) / SEASON
+    return last[:, :, None] + slope[:, :, None] * _leads(horizon)[None, None, :]
+
+
+def ridge_lags(stack, origins, horizon, lags=RIDGE_LAGS, lam=RIDGE_LAMBDA):
+    # 원점마다, 원점까지의 창(window)으로 시계열별 ridge 정규방정식을 한꺼번에 풀고 재귀적으로 예측한다.
+    # 창의 합·곱의 합(S1, S2)은 원점이 뒤로 갈 때 새 창만 더하고, 원점까지의 평균·표준편차로 표준화한
+    # 정규방정식은 그 합에서 바로 만든다 (원점마다 창 전체를 다시 곱하지 않음).
+    n, t = stack.values.shape
+    out = np.full((n, len(origins), horizon), np.nan)
+    if t <= lags:
+        # 창 하나도 만들 수 없을 만큼 짧으면 모두 NaN (비교한 칸 수 0 으로 결과에서 빠진다)
+        return out
+    ref = np.nan_to_num(stack.values[np.arange(n), np.clip(stack.starts, 0, t - 1)])[:, None]
+    y = stack.values - ref  # 큰 값끼리 빼며 자릿수를 잃지 않도록 시계열별 첫 값을 빼 둔다
+    windows = np.lib.stride_tricks.sliding_window_view(y, lags + 1, axis=1)  # (n, t-lags, lags+1)
+    complete = ~np.isnan(windows).any(axis=2)
+    filled = np.where(complete[:, :, None], windows, 0.0)
+    seen = ~np.isnan(y)
+    csum = np.cumsum(np.where(seen, y, 0.0), axis=1)
+    csq = np.cumsum(np.where(seen, y * y, 0.0), axis=1)
+    cnt = np.cumsum(seen, axis=1)
+
+    penalty = lam * np.eye(lags + 1)
+    penalty[-1, -1] = 0.0
+    pick = list(range(lags)) + [lags + 1]
+    s1 = np.zeros((n, lags + 1))
+    s2 = np.zeros((n, lags + 1, lags + 1))
+    used = np.zeros(n)
+    done = 0
+    for k, o in enumerate(origins):
+        stop = max(o - lags + 1, 0)
+        if stop > done:
+            new = filled[:, done:stop]
+            s1 += new.sum(axis=1)
+            s2 += new.transpose(0, 2, 1) @ new
+            used += complete[:, done:stop].sum(axis=1)
+            done = stop
+        enough = used >= 2 * lags + 1
+        if not enough.any():
+            continue
+        c = np.maximum(cnt[:, o], 1)
+        mu = csum[:, o] / c
+        sd = np.sqrt(np.maximum(csq[:, o] / c - mu * mu, 0.0))
+        sd[~(sd > 0)] = 1.0
+        # 표준화한 창 z = (w - mu) / sd 의 합과 곱의 합
+        zsum = (s1 - used[:, None] * mu[:, None]) / sd[:, None]
+        zz = (s2 - mu[:, None, None] * (s1[:, :, None] + s1[:, None, :])
+              + used[:, None, None] * (mu * mu)[:, None, None]) / (sd * sd)[:, None, None]
+        gram = np.empty((n, lags + 2, lags + 2))
+        gram[:, :-1, :-1] = zz
+        gram[:, :-1, -1] = zsum
+        gram[:, -1, :-1] = zsum
+        gram[:, -1, -1] = used
+        A = gram[:, pick][:, :, pick] + penalty
+        b = gram[:, pick, lags]
+        A[~enough] = np.eye(lags + 1)
+        coef = np.linalg.solve(A, b[:, :, None])[:, :, 0]
+        window = (y[:, o - lags + 1: o + 1] - mu[:, None]) / sd[:, None]
+        for h in range(horizon):
+            nxt = np.einsum("ni,ni->n", window, coef[:, :-1]) + coef[:, -1]
+            out[:, k, h] = nxt
+            window = np.concatenate([window[:, 1:], nxt[:, None]], axis=1)
+        out[:, k] = np.where(enough[:, None], out[:, k] * sd[:, None] + mu[:, None] + ref, np.nan)
+    return out
+
+
+def holt_winters(stack, origins, horizon, grid=HW_GRID):
+    # 가법 Holt-Winters 를 모든 시계열 × 매개변수 격자에 대해 시간 축으로 한 번 돌린다.
+    # 원점마다 그때까지의 한 단계 예측 SSE 가 가장 작은 매개변수의 예측을 고른다 (미래 정보 없음).
+    y = stack.values
+    n, t = y.shape
+    rows = np.arange(n)
+    alpha, beta, gamma = (grid[:, i][None, :] for i in range(3))
+    s0 = stack.starts
+    first = y[rows[:, None], np.clip(s0[:, None] + np.arange(SEASON), 0, t - 1)]
+    second = y[rows[:, None], np.clip(s0[:, None] + SEASON + np.arange(SEASON), 0, t - 1)]
+    level = np.repeat(np.nanmean(first, axis=1)[:, None], len(grid), axis=1)
+    trend = np.repeat(((np.nanmean(second, axis=1) - level[:, 0]) / SEASON)[:, None], len(grid), axis=1)
+    season = np.repeat((first - level[:, :1])[:, None, :], len(grid), axis=1)  # (n, G, SEASON)
+    sse = np.zeros((n, len(grid)))
+    out = np.full((n, len(origins), horizon), np.nan)
+    at_origin = {int(o): k for k, o in enumerate(origins)}
+    h = _leads(horizon)
+    for step in range(t):
+        active = step >= s0 + SEASON
+        if active.any():
+            phase = (step - s0) % SEASON
+            s = season[rows, :, phase]
+            obs = y[:, step][:, None]
+            err = obs - (level + trend + s)
+            prev = level
+            new_level = alpha * (obs - s) + (1 - alpha) * (level + trend)
+            new_trend = beta * (new_level - prev) + (1 - beta) * trend
+            new_season = gamma * (obs - new_level) + (1 - gamma) * s
+            upd = active[:, None]
+            sse = np.where(upd, sse + np.nan_to_num(err) ** 2, sse)
+            level = np.where(upd, new_level, level)
+            trend = np.where(upd, new_trend, trend)
+            season[rows, :, phase] = np.where(upd, new_season, s)
+        k = at_origin.get(step)
+        if k is not None:
+            phases = (step + h[None, :] - s0[:, None]) % SEASON  # (n, H)
+            path = level[:, :, None] + trend[:, :, None] * h + np.take_along_axis(season, phases[:, None, :].repeat(len(grid), 1), axis=2)
+            best = np.argmin(sse, axis=1)
+            ready = step >= s0 + 2 * SEASON
+            out[:, k] = np.where(ready[:, None], path[rows, best], np.nan)
+    return out
+
+
+MODELS = {
+    "Naive": naive,
+    "SeasonalNaive": seasonal_naive,
+    "Drift": drift,
+    "HoltWinters": holt_winters,
+    "RidgeLags": ridge_lags,
+}
+
+
+def evaluate(stack, horizon=12, n_origins=N_ORIGINS, models=tuple(MODELS)):
+    # {모델: (마지막 원점에서의 horizon 개월 후 예측, RMSE, MAPE, 비교한 칸 수)} — 모두 (시계열 수,) 배열
+    t = stack.values.shape[1]
+    if t == 0:
+        empty = np.empty(0)
+        return {name: (empty, empty, empty, np.zeros(0, dtype=int)) for name in models}
+    test_origins = np.arange(t - 1 - horizon - n_origins + 1, t - horizon)
+    test_origins = test_origins[test_origins >= 0]
+    origins = np.append(test_origins, t - 1)
+    targets = test_origins[:, None] + _leads(horizon)[None, :]
+    actual = np.where(stack.observed[:, targets], stack.values[:, targets], np.nan)
+    results = {}
+    for name in models:
+        forecast = MODELS[name](stack, origins, horizon)
+        err = forecast[:, :-1] - actual
+        valid = ~np.isnan(err)
+        count = valid.sum(axis=(1, 2))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rmse = np.sqrt(np.where(valid, err ** 2, 0).sum(axis=(1, 2)) / count)
+            ape = np.where(valid & (actual != 0), np.abs(err) / np.abs(actual), 0)
+            mape = 100 * ape.sum(axis=(1, 2)) / count
+        results[name] = (forecast[:, -1, horizon - 1], rmse, mape, count)
+    return results
+
+
+def backtest_table(prices, horizon=12, n_origins=N_ORIGINS, models=tuple(MODELS)):
+    # 시계열 × 모델별 결과를 CSV_PRED 스키마(+ 테스트_MAPE)로 돌려준다.
+    stack = stack_series(prices.monthly.table())
+    results = evaluate(stack, horizon, n_origins, models)
+    keys = stack.keys
+    recent = stack.values[:, -SEASON:]
+    actual = np.nanmean(np.where(stack.observed[:, -SEASON:], recent, np.nan), axis=1)
+    last_daily = prices.daily.table().groupby(KEY_COLUMNS, observed=True, sort=False)["평균"].last()
+    last = last_daily.reindex(pd.MultiIndex.from_frame(keys)).to_numpy()
+    frames = []
+    for name, (pred, rmse, mape, count) in results.items():
+        ok = (count > 0) & np.isfinite(pred)
+        frames.append(pd.DataFrame({
+            "도": keys["도"].astype(str).to_numpy()[ok],
+            "등급": keys["등급"].map(GRADE_LABELS).fillna(keys["등급"].astype(str)).to_numpy()[ok],
+            "등급_num": keys["등급"].to_numpy()[ok],
+            "유통구분": keys["유통구분"].map(DIST_LABELS).fillna(keys["유통구분"].astype(str)).to_numpy()[ok],
+            "유통_num": keys["유통구분"].to_numpy()[ok],
+            "예상단가(원)": np.round(pred[ok]),
+            "모델": f"{name}{MODEL_SUFFIX}",
+            "테스트_RMSE": np.round(rmse[ok], 2),
+            "실제평균단가": np.round(actual[ok]),
+            "예측-실제평균(원)": np.round(pred[ok] - actual[ok]),
+            "마지막판매단가": np.round(last[ok]),
+            "예측-마지막판매(원)": np.round(pred[ok] - last[ok]),
+            "테스트_MAPE": np.round(mape[ok], 2),
+        }))
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=PRED_SCHEMA + ["테스트_MAPE"])
+    return df.sort_values(["도", "등급_num", "유통_num", "모델"], kind="stable").reset_index(drop=True), len(keys)
+
+
+def main():
+    from shiitake.prices import build_price_data
+
+    parser = argparse.ArgumentParser(description="월별 단가 시계열 일괄 rolling-origin 백테스트")
+    parser.add_argument("--csv", default=CSV_MACRO)
+    parser.add_argument("--horizon", type=int, nargs="+", default=[12], help="예측 기간 (개월)")
+    parser.add_argument("--origins", type=int, default=N_ORIGINS, help="평가할 원점 수")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=list(MODELS))
+    parser.add_argument("--out-dir", default=".")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    prices = build_price_data(args.csv)
+    for horizon in args.horizon:
+        started = time.perf_counter()
+        df, n_series = backtest_table(prices, horizon, args.origins, args.models)
+        seconds = time.perf_counter() - started
+        path = output_path(horizon, args.out_dir, prefix="backtest")
+        if df.empty:
+            log.warning("backtest horizon=%d: 평가할 수 있는 시계열이 없어 %s 를 쓰지 않음", horizon, path)
+            continue
+        write_forecasts(df, path)
+        log.info("backtest horizon=%d origins=%d series=%d rows=%d seconds=%.2f series_per_sec=%.1f path=%s",
+                 horizon, args.origins, n_series, len(df), seconds, n_series / seconds if seconds else 0.0, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# 차트 렌더링 계층.
+# pyplot 을 거치지 않고 Figure 를 직접 만들어 PNG 바이트로 렌더링하므로 pyplot 의 figure 레지스트리에 쌓이지 않는다.
+# 렌더링 결과는 (차트 종류, 조건, 데이터 버전, 기간, 크기) 키로 프로세스 전체가 공유하는 SizedLRU 에 보관한다.
+# plot_* 는 축(ax) 하나에 그리는 부분이라 리포트(shiitake.reports)의 PDF 쪽에서도 같은 모양으로 쓴다.
+from io import BytesIO
+
+from matplotlib import colormaps
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from shiitake.downsample import chart_points, minmax_downsample
+from shiitake.fonts import register_fonts
+from shiitake.memory import SizedLRU
+
+register_fonts()
+
+SHIITAKE_COLORS = ['#8B4513', '#D2691E', '#CD853F', '#DEB887', '#228B22', '#FF8C00', '#DC143C', '#4682B4']
+
+
+_cache = SizedLRU("charts", max_entries=256, max_bytes=64 * 1024 * 1024, sizeof=len)
+
+
+def render_png(key, draw, figsize, dpi=100):
+    # 캐시에 없을 때만 draw(fig) 로 그린다. key 에는 그림을 결정하는 모든 값이 들어가야 한다.
+    key = key + (figsize, dpi)
+    png = _cache.get(key)
+    if png is None:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        try:
+            draw(fig)
+            buf = BytesIO()
+            fig.savefig(buf, format="png", bbox_inches="tight")
+        finally:
+            fig.clear()
+        png = buf.getvalue()
+        _cache.put(key, png)
+    return png
+
+
+def plot_indicator(ax, x, y, title, points):
+    xs, ys = minmax_downsample(x, y, points)
+    ax.plot(xs, ys, color="brown", linewidth=2)
+
+    # 배경 및 시각 요소 복원
+    ax.set_facecolor("#fafafa")
+    ax.grid(True, which='major', axis='y', linestyle='--', linewidth=0.5, alpha=0.7)
+    ax.tick_params(axis='x', rotation=15, labelsize=8)
+    ax.tick_params(axis='y', labelsize=8)
+    ax.set_title(title, fontsize=11, weight='bold')
+
+    for spine in ax.spines.values():
+        spine.set_visible(True)
+        spine.set_linewidth(0.5)
+        spine.set_color('#999999')
+
+
+def indicator_chart(key, x, y, title, figsize=(5.5, 3), dpi=100):
+    def draw(fig):
+        plot_indicator(fig.subplots(), x, y, title, chart_points(figsize, dpi))
+
+    return render_png(("indicator",) + key, draw, figsize, dpi)
+
+
+def plot_monthly(ax, labels, values):
+    ax.plot(labels, values, marker="o", color='#8B4513', linewidth=3, markersize=8)
+    ax.set_xlabel("년월", fontsize=12)
+    ax.set_ylabel("실제평균단가 (원)", fontsize=12)
+    ax.tick_params(axis="x", rotation=45)
+    ax.grid(True, alpha=0.3)
+    ax.set_facecolor('#fafafa')  # 배경색 유지
+
+
+def monthly_chart(key, labels, values, figsize=(12, 6)):
+    def draw(fig):
+        plot_monthly(fig.subplots(), labels, values)
+        fig.tight_layout()
+
+    return render_png(("monthly",) + key, draw, figsize)
+
+
+def daily_chart(key, dates, values, figsize=(12, 6), dpi=100):
+    def draw(fig):
+        ax = fig.subplots()
+        xs, ys = minmax_downsample(dates, values, chart_points(figsize, dpi))
+        ax.plot(xs, ys, marker="o", color='#D2691E', linewidth=3, markersize=6)
+        ax.set_xlabel("Date", fontsize=12)
+        ax.set_ylabel("단가 (평균, 원)", fontsize=12)
+        ax.tick_params(axis="x", rotation=45)
+        ax.grid(True, alpha=0.3)
+        ax.set_facecolor('#fafafa')
+        fig.tight_layout()
+
+    return render_png(("daily",) + key, draw, figsize, dpi)
+
+
+def plot_forecast_bar(ax, regions, prices):
+    bars = ax.bar(regions, prices, color=SHIITAKE_COLORS[:len(regions)])
+    ax.set_ylabel("예상단가(원)", fontsize=12)
+    ax.set_xlabel("도", fontsize=12)
+    ax.tick_params(axis="x", rotation=45, labelsize=10)
+    ax.grid(True, alpha=0.3, axis='y')
+    ax.set_facecolor('#fafafa')
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
+                f'{height:,.0f}원', ha='center', va='bottom', fontsize=9)
+
+
+def forecast_bar_chart(key, regions, prices, figsize=(10, 6)):
+    def draw(fig):
+        plot_forecast_bar(fig.subplots(), regions, prices)
+        fig.tight_layout()
+
+    return render_png(("forecast_bar",) + key, draw, figsize)
+
+
+def comparison_chart(key, wide, labels, figsize=(12, 6)):
+    # (기간 × 조합) 넓은 표의 열마다 선 하나 (빠진 달은 끊어서 그림)
+    def draw(fig):
+        ax = fig.subplots()
+        colors = SHIITAKE_COLORS + [c for c in colormaps["tab20"].colors]
+        for i, label in enumerate(labels):
+            ax.plot(wide.index, wide.iloc[:, i], marker="o", color=colors[i % len(colors)],
+                    linewidth=2, markersize=4, label=label)
+        ax.set_xlabel("년월", fontsize=12)
+        ax.set_ylabel("실제평균단가 (원)", fontsize=12)
+        ax.tick_params(axis="x", rotation=45)
+        ax.grid(True, alpha=0.3)
+        ax.set_facecolor('#fafafa')
+        ax.legend(fontsize=9, ncol=max(1, len(labels) // 8), loc="upper left", bbox_to_anchor=(1.01, 1))
+        fig.tight_layout()
+
+    return render_png(("comparison",) + key, draw, figsize)
+
+
+def plot_table(ax, df, title, colors=None, text_colors=None, highlight=None):
+    # 이미 문자열로 서식을 맞춘 DataFrame 을 표로 그린다.
+    # colors / text_colors: 같은 모양의 셀 배경색·글자색("" 이면 기본), highlight: 강조할 행(인덱스 값)
+    ax.axis("off")
+    ax.set_title(title, fontsize=12, weight="bold", loc="left")
+    table = ax.table(cellText=df.to_numpy(), rowLabels=df.index.astype(str).tolist(),
+                     colLabels=df.columns.tolist(), loc="upper center", cellLoc="right")
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 1.4)
+    table.auto_set_column_width(range(-1, len(df.columns)))
+    for (r, c), cell in table.get_celld().items():
+        cell.set_edgecolor("#cccccc")
+        if r == 0:
+            cell.set_facecolor("#8B4513")
+            cell.set_text_props(color="white", weight="bold")
+            continue
+        if highlight is not None and df.index[r - 1] == highlight:
+            cell.set_facecolor("#FFE4B5")
+            cell.set_text_props(weight="bold")
+        if c >= 0 and colors is not None and colors.iat[r - 1, c]:
+            cell.set_facecolor(colors.iat[r - 1, c])
+        if c >= 0 and text_colors is not None and text_colors.iat[r - 1, c]:
+            cell.get_text().set_color(text_colors.iat[r - 1, c])
+
+
+def render_pdf(pages, figsize=(11.69, 8.27)):
+    # pages: draw(fig) 함수 목록 -> 한 쪽에 하나씩 그린 PDF 바이트 (기본 A4 가로)
+    buf = BytesIO()
+    with PdfPages(buf) as pdf:
+        for draw in pages:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            try:
+                draw(fig)
+                pdf.savefig(fig)
+            finally:
+                fig.clear()
+    return buf.getvalue()
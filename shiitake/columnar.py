@@ -0,0 +1,242 @@
+# 원본 CSV 를 Arrow IPC(Feather v2) 컬럼 캐시로 한 번만 변환해 두고,
+# 이후 rerun 에서는 파싱 없이 memory-map 으로 읽는다.
+# 캐시는 원본 파일의 mtime 과 sha256 해시를 기준으로 하며, 내용이 바뀐 경우에만 다시 만든다.
+#
+# final.csv 처럼 뒤에 행이 덧붙여지기만 하는 파일은 이미 읽은 바이트 위치(offset) 이후의 꼬리만 파싱해
+# 새 part 파일로 추가한다 (파싱 비용은 새 행 수에 비례). offset 직전 구간의 지문으로 덧붙이기가 아닌 경우를 먼저 거르고,
+# 덧붙일 때마다 [0, offset) 의 sha256 을 다시 계산해 앞쪽이 바뀌지 않았는지 확인한 뒤 같은 해시를 꼬리까지 이어
+# 새 sha256 을 얻는다 (파싱 없이 해시만, 파일을 한 번 읽는다). 그래서 sha256 은 늘 [0, offset) 의 실제 해시다.
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from shiitake.ingest import read_csv
+
+CACHE_DIRNAME = ".cache"
+DATE_COLUMNS = ("date", "조사일", "일자", "날짜")
+# final.csv 의 알려진 컬럼 타입 (당일은 천 단위 쉼표가 있어 문자열로 읽은 뒤 숫자로 바꾼다)
+MACRO_DTYPES = {
+    "조사일": "string",
+    "도": "category",
+    "등급": "Int16",
+    "유통구분": "Int16",
+    "당일": "string",
+}
+FINGERPRINT_SIZE = 4096
+# part 가 이보다 많아지면 하나로 합친다
+MAX_PARTS = 32
+
+
+def _update(h, path, start, stop, chunk_size=1 << 20):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            h.update(chunk)
+            remaining -= len(chunk)
+    return h
+
+
+def _hash_range(path, start, stop):
+    return _update(hashlib.sha256(), path, start, stop).hexdigest()
+
+
+def file_hash(path):
+    return _hash_range(path, 0, os.path.getsize(path))
+
+
+def _extended_hash(path, offset, stop, expected):
+    # [0, offset) 의 sha256 이 expected 와 같으면 [0, stop) 의 sha256, 다르면 None (앞쪽이 바뀜)
+    h = _update(hashlib.sha256(), path, 0, offset)
+    if h.hexdigest() != expected:
+        return None
+    return _update(h, path, offset, stop).hexdigest()
+
+
+def _fingerprint(path, offset):
+    return _hash_range(path, max(0, offset - FINGERPRINT_SIZE), offset)
+
+
+def cache_dir(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIRNAME)
+
+
+def _meta_path(path):
+    return os.path.join(cache_dir(path), os.path.basename(path) + ".json")
+
+
+def _part_path(path, name):
+    return os.path.join(cache_dir(path), name)
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path, write):
+    # 다른 세션이 읽는 도중에 파일이 바뀌지 않도록 임시 파일에 쓰고 교체한다.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_meta(meta_path, meta):
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+    _write_atomic(meta_path, write)
+
+
+def _write_part(path, name, table):
+    # memory-map 으로 바로 읽을 수 있도록 압축하지 않는다.
+    _write_atomic(_part_path(path, name), lambda tmp: feather.write_feather(table, tmp, compression="uncompressed"))
+
+
+def _remove_stale_parts(path, keep):
+    prefix = os.path.basename(path) + "."
+    for name in os.listdir(cache_dir(path)):
+        if name.startswith(prefix) and name.endswith(".arrow") and name not in keep:
+            try:
+                os.remove(_part_path(path, name))
+            except OSError:
+                pass
+
+
+def _to_typed(df):
+    # 날짜 컬럼은 datetime, "1,234" 같은 숫자 문자열은 숫자,
+    # 반복되는 문자열 컬럼은 category(dictionary) 로 저장한다.
+    for col in df.columns:
+        s = df[col]
+        if col in DATE_COLUMNS:
+            df[col] = pd.to_datetime(s, errors="coerce")
+        elif pd.api.types.is_string_dtype(s):
+            number = pd.to_numeric(s.str.replace(",", "", regex=False), errors="coerce")
+            if number.notna().sum() == s.notna().sum():
+                df[col] = number
+            elif s.nunique(dropna=True) <= max(len(df) // 2, 1):
+                df[col] = s.astype("category")
+    return df
+
+
+def _parse(source, label, encoding=None):
+    try:
+        return read_csv(source, dtype=MACRO_DTYPES, encoding=encoding)
+    except (UnicodeDecodeError, pd.errors.ParserError, pa.ArrowInvalid) as e:
+        raise ValueError(f"CSV 파싱 실패: {label}") from e
+
+
+def _build(path, meta_path, st):
+    df, stats = _parse(path, path)
+    table = pa.Table.from_pandas(_to_typed(df), preserve_index=False)
+    sha = file_hash(path)
+    os.makedirs(cache_dir(path), exist_ok=True)
+    part = f"{os.path.basename(path)}.{sha[:16]}.0.arrow"
+    _write_part(path, part, table)
+    meta = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha,
+            "base": sha[:16], "offset": st.st_size, "boundaries": [st.st_size],
+            "fingerprint": _fingerprint(path, st.st_size),
+            "encoding": stats.encoding, "rows": table.num_rows, "parts": [part],
+            "bytes_read": stats.bytes_read, "parse_seconds": round(stats.seconds, 4)}
+    _write_meta(meta_path, meta)
+    _remove_stale_parts(path, meta["parts"])
+    return meta
+
+
+def _append(path, meta_path, meta, st):
+    # offset 이후 덧붙여진 완전한 줄만 헤더와 함께 파싱해 새 part 로 추가한다.
+    # 기존 스키마로 맞출 수 없으면 None (전체 재빌드).
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(meta["offset"])
+        tail = f.read(st.st_size - meta["offset"])
+    end = tail.rfind(b"\n") + 1
+    meta = dict(meta, mtime_ns=st.st_mtime_ns, size=st.st_size)
+    if end == 0:
+        # 아직 끝나지 않은 줄만 있음 -> 다음 갱신 때 읽는다
+        _write_meta(meta_path, meta)
+        return meta
+
+    df, stats = _parse(io.BytesIO(header + tail[:end]), path, encoding=meta["encoding"])
+    schema = feather.read_table(_part_path(path, meta["parts"][0]), memory_map=True).schema
+    try:
+        table = pa.Table.from_pandas(_to_typed(df), schema=schema, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, KeyError):
+        return None
+
+    offset = meta["offset"] + end
+    # 지문은 offset 직전 구간만 보므로 앞쪽을 고친 뒤 덧붙인 경우는 여기서 잡아 전체 재빌드한다.
+    sha = _extended_hash(path, meta["offset"], offset, meta["sha256"])
+    if sha is None:
+        return None
+    boundaries = meta["boundaries"] + [offset]
+    compact = len(meta["parts"]) + 1 > MAX_PARTS
+    part = f"{os.path.basename(path)}.{meta['base']}.{len(meta['boundaries'])}.arrow"
+    _write_part(path, part, table)
+    meta.update(sha256=sha, offset=offset, boundaries=boundaries,
+                fingerprint=_fingerprint(path, offset),
+                rows=meta["rows"] + table.num_rows, parts=meta["parts"] + [part],
+                bytes_read=stats.bytes_read, parse_seconds=round(stats.seconds, 4))
+    if compact:
+        meta = _compact(path, meta)
+    _write_meta(meta_path, meta)
+    _remove_stale_parts(path, meta["parts"])
+    return meta
+
+
+def _compact(path, meta):
+    # 다시 파싱하지 않고 덧붙인 part 들만 이어 붙여 한 파일로 쓴다.
+    # 합친 크기가 첫 part 만큼 커졌을 때만 첫 part 까지 합친다 (index.compact_segments 와 같은 규칙).
+    first, appended = meta["parts"][0], meta["parts"][1:]
+    table = _read_parts(path, appended)
+    parts = [first]
+    if table.num_rows >= meta["rows"] - table.num_rows:
+        table, parts = _read_parts(path, meta["parts"]), []
+    part = f"{os.path.basename(path)}.{meta['base']}.{meta['sha256'][:16]}.arrow"
+    _write_part(path, part, table.combine_chunks())
+    return dict(meta, parts=parts + [part])
+
+
+def ensure_cache(path):
+    # 캐시가 최신이면 메타데이터만 돌려주고, 덧붙여졌으면 꼬리만, 그 밖에 내용이 바뀌었으면 전체를 다시 만든다.
+    meta_path = _meta_path(path)
+    st = os.stat(path)
+    meta = _read_meta(meta_path)
+    if meta and meta.get("parts") and all(os.path.exists(_part_path(path, p)) for p in meta["parts"]):
+        if meta["mtime_ns"] == st.st_mtime_ns and meta["size"] == st.st_size:
+            return meta
+        if st.st_size > meta["size"] and _fingerprint(path, meta["offset"]) == meta["fingerprint"]:
+            appended = _append(path, meta_path, meta, st)
+            if appended is not None:
+                return appended
+        elif st.st_size == meta["size"] and _hash_range(path, 0, meta["offset"]) == meta["sha256"]:
+            # touch 등으로 mtime 만 바뀐 경우
+            meta.update(mtime_ns=st.st_mtime_ns)
+            _write_meta(meta_path, meta)
+            return meta
+    return _build(path, meta_path, st)
+
+
+def _read_parts(path, parts, columns=None):
+    tables = [feather.read_table(_part_path(path, p), columns=columns, memory_map=True) for p in parts]
+    return pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+
+def load_table(path, columns=None, start=0, meta=None):
+    # start 번째 행부터만 pandas 로 바꾼다 (덧붙여진 행만 필요할 때).
+    meta = meta or ensure_cache(path)
+    table = _read_parts(path, meta["parts"], columns)
+    if start:
+        table = table.slice(start)
+    return table.to_pandas()
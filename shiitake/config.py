@@ -0,0 +1,23 @@
+# 경로/환경 설정
+import os
+
+# 환경변수/QR 주소
+if "STREAMLIT_SERVER_URL" in os.environ:
+    QR_URL = os.environ["STREAMLIT_SERVER_URL"]
+else:
+    QR_URL = "http://localhost:8501"
+
+# 파일 경로 (사용중인 파일명에 맞게 수정)
+CSV_MACRO = "final.csv"
+CSV_PRED = "12개월후_예측_vs_실제_비교.csv"
+# 모델·기간별 예측 결과 (파일명 앞의 N개월후 가 예측 기간, CSV_PRED 포함)
+PRED_GLOB = "*개월후_예측_vs_실제_비교.csv"
+# 소셜 언급 원본 내보내기와 그 집계 결과 (python -m shiitake.social 로 만든다)
+SOCIAL_EXPORTS = "social/*.csv"
+SOCIAL_STORE = "social_aggregates.json"
+# 맞춤형 리포트 캐시 (python -m shiitake.reports 로 미리 만들 수 있다)
+REPORT_DIR = os.path.join(".cache", "reports")
+# 구매자·비회원용 공개 정적 사이트 (python -m shiitake.static 로 만든다).
+# 정적 파일 서버 주소를 SHIITAKE_STATIC_URL 로 주면 권한 없음 페이지에 링크를 보여준다.
+STATIC_DIR = "site"
+STATIC_URL = os.environ.get("SHIITAKE_STATIC_URL", "")
@@ -0,0 +1,27 @@
+# 시계열 다운샘플링 (버킷별 min/max).
+# 차트의 픽셀 폭만큼 버킷을 나누고 버킷마다 최솟값·최댓값 지점만 남겨, 기간이 길어도 그릴 점 수는 일정하고 봉우리는 보존된다.
+import numpy as np
+
+
+def minmax_downsample(x, y, max_points):
+    # x 순으로 정렬된 (x, y) 를 최대 max_points 개 (+ 양 끝점) 로 줄인다.
+    x = np.asarray(x)
+    y = np.asarray(y, dtype="float64")
+    n = len(y)
+    buckets = max(max_points // 2, 1)
+    if n <= max_points or n <= 2:
+        return x, y
+
+    size = -(-n // buckets)
+    pad = size * buckets - n
+    lows = np.concatenate((np.where(np.isnan(y), np.inf, y), np.full(pad, np.inf))).reshape(buckets, size)
+    highs = np.concatenate((np.where(np.isnan(y), -np.inf, y), np.full(pad, -np.inf))).reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    keep = np.concatenate(([0, n - 1], offsets + lows.argmin(axis=1), offsets + highs.argmax(axis=1)))
+    keep = np.unique(keep[keep < n])
+    return x[keep], y[keep]
+
+
+def chart_points(figsize, dpi):
+    # 차트 가로 픽셀 수 = 그릴 최대 점 수
+    return int(figsize[0] * dpi)
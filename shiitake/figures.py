@@ -0,0 +1,181 @@
+# Plotly 그림 정의.
+# 소셜 분석 페이지(views.social)와 공개용 정적 빌드(shiitake.static)가 같은 집계 표로 같은 그림을 만든다.
+import plotly.express as px
+import plotly.graph_objects as go
+
+SHIITAKE_COLORS = ['#8B4513', '#D2691E', '#CD853F', '#DEB887', '#228B22', '#FF8C00', '#DC143C', '#4682B4']
+
+
+def yearly_figure(yearly_data):
+    fig_yearly = px.bar(yearly_data, x='Year', y='Mentions',
+                       color='Year', color_discrete_sequence=SHIITAKE_COLORS[:5])
+    fig_yearly.update_layout(
+        showlegend=False,
+        height=220,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        yaxis_title="언급량 (회)",
+        xaxis_title="연도",
+        margin=dict(t=20, b=40, l=40, r=20)
+    )
+    fig_yearly.update_traces(
+        hovertemplate='<b>%{x}년</b><br>언급량: %{y:,}회<extra></extra>',
+        texttemplate='%{y:,.0f}',
+        textposition='outside'
+    )
+    return fig_yearly
+
+
+def seasonal_figure(seasonal_data):
+    fig_seasonal = px.pie(seasonal_data, values='Percentage', names='Season',
+                         color_discrete_sequence=SHIITAKE_COLORS[:4])
+    fig_seasonal.update_layout(
+        height=220,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        margin=dict(t=20, b=20, l=20, r=20)
+    )
+    fig_seasonal.update_traces(
+        hovertemplate='<b>%{label}</b><br>비율: %{percent}<extra></extra>',
+        textinfo='label+percent',
+        textfont_size=11
+    )
+    return fig_seasonal
+
+
+def sentiment_figure(sentiment_data):
+    fig_sentiment = px.bar(sentiment_data, x='Percentage', y='Sentiment',
+                          orientation='h', color='Sentiment',
+                          color_discrete_map={'긍정': '#228B22', '중립': '#CD853F', '부정': '#DC143C'})
+    fig_sentiment.update_layout(
+        showlegend=False,
+        height=180,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        xaxis_title="비율 (%)",
+        yaxis_title="",
+        margin=dict(t=20, b=40, l=60, r=20)
+    )
+    fig_sentiment.update_traces(
+        hovertemplate='<b>%{y}</b><br>비율: %{x}%<br>언급량: %{customdata:,}회<extra></extra>',
+        customdata=sentiment_data['Count'],
+        texttemplate='%{x}%',
+        textposition='inside'
+    )
+    return fig_sentiment
+
+
+def topic_figure(topic_data):
+    fig_topic = px.bar(topic_data, x='Topic', y='Percentage',
+                      color='Topic', color_discrete_sequence=SHIITAKE_COLORS[:4])
+    fig_topic.update_layout(
+        showlegend=False,
+        height=220,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        yaxis_title="비율 (%)",
+        xaxis_title="토픽",
+        margin=dict(t=20, b=50, l=40, r=20)
+    )
+    fig_topic.update_traces(
+        hovertemplate='<b>%{x}</b><br>비율: %{y}%<extra></extra>',
+        texttemplate='%{y}%',
+        textposition='outside'
+    )
+    fig_topic.update_xaxes(tickangle=45)
+    return fig_topic
+
+
+def age_figure(age_data):
+    fig_age = px.bar(age_data, x='Age_Group', y='Percentage',
+                    color='Age_Group', color_discrete_sequence=SHIITAKE_COLORS[:3])
+    fig_age.update_layout(
+        showlegend=False,
+        height=180,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        yaxis_title="비율 (%)",
+        xaxis_title="연령대",
+        margin=dict(t=20, b=40, l=40, r=20)
+    )
+    fig_age.update_traces(
+        hovertemplate='<b>%{x}</b><br>비율: %{y}%<br>언급량: %{customdata:,}회<extra></extra>',
+        customdata=age_data['Count'],
+        texttemplate='%{y}%',
+        textposition='outside'
+    )
+    return fig_age
+
+
+def usage_figure(usage_data):
+    fig_usage = go.Figure()
+    cooking_data = usage_data[usage_data['Category'] == '요리']
+    health_data = usage_data[usage_data['Category'] == '건강']
+
+    fig_usage.add_trace(go.Bar(
+        name='요리',
+        x=cooking_data['Usage'],
+        y=cooking_data['Percentage'],
+        marker_color=SHIITAKE_COLORS[1],
+        hovertemplate='<b>%{x}</b><br>요리: %{y}%<extra></extra>'
+    ))
+    fig_usage.add_trace(go.Bar(
+        name='건강',
+        x=health_data['Usage'],
+        y=health_data['Percentage'],
+        marker_color=SHIITAKE_COLORS[0],
+        hovertemplate='<b>%{x}</b><br>건강: %{y}%<extra></extra>'
+    ))
+    fig_usage.update_layout(
+        height=260,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        yaxis_title="비율 (%)",
+        xaxis_title="용도",
+        barmode='group',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(t=40, b=50, l=40, r=20)
+    )
+    fig_usage.update_xaxes(tickangle=45)
+    return fig_usage
+
+
+# 표 이름 -> 그림 함수 (SocialData.tables 의 같은 이름 표를 받는다)
+SOCIAL_FIGURES = {
+    "yearly": yearly_figure,
+    "seasonal": seasonal_figure,
+    "sentiment": sentiment_figure,
+    "topic": topic_figure,
+    "age": age_figure,
+    "usage": usage_figure,
+}
+
+
+def forecast_figure(prices):
+    # 도별 예상단가 막대 (예측 표의 prices, 도 인덱스)
+    regions = prices.index.astype(str)
+    fig = go.Figure(go.Bar(
+        x=regions,
+        y=prices["예상단가(원)"],
+        marker_color=[SHIITAKE_COLORS[i % len(SHIITAKE_COLORS)] for i in range(len(regions))],
+        texttemplate='%{y:,.0f}원',
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>예상단가: %{y:,.0f}원<extra></extra>',
+    ))
+    fig.update_layout(
+        height=360,
+        plot_bgcolor='#fafafa',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Noto Sans KR", size=11),
+        yaxis_title="예상단가(원)",
+        xaxis_title="도",
+        margin=dict(t=30, b=60, l=60, r=20)
+    )
+    fig.update_xaxes(tickangle=45)
+    return fig
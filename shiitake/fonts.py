@@ -0,0 +1,24 @@
+# matplotlib 한글 폰트 설정.
+# 저장소에 포함된 NanumGothic TTF 를 등록하고 koreanize_matplotlib 설정을 적용한다. 프로세스당 한 번만 실행된다.
+import glob
+import os
+
+from matplotlib import font_manager, rcParams
+
+FONT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_registered = False
+
+
+def register_fonts():
+    global _registered
+    if _registered:
+        return
+    for path in sorted(glob.glob(os.path.join(FONT_DIR, "NanumGothic*.ttf"))):
+        font_manager.fontManager.addfont(path)
+    try:
+        import koreanize_matplotlib  # noqa: F401  (import 시 NanumGothic 과 마이너스 기호 설정을 적용)
+    except ImportError:
+        rcParams["font.family"] = "NanumGothic"
+        rcParams["axes.unicode_minus"] = False
+    _registered = True
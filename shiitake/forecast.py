@@ -0,0 +1,196 @@
+# 배치 재예측 엔진.
+# 단가 트렌드의 월별 집계(PriceData.monthly)에서 (도, 등급, 유통구분) 시계열을 꺼내
+# NumPy 로 구현한 가벼운 모델(계절 naive, Holt-Winters 가법, 시차 ridge)을 시계열마다 맞추고,
+# ProcessPoolExecutor 로 시계열을 여러 프로세스에 나눠 처리한다.
+# 결과는 future_page 가 읽는 CSV_PRED 스키마로, 모델마다 한 행씩 "engine_{N}개월후_예측_vs_실제_비교.csv" 에 쓴다
+# (테스트_RMSE 는 마지막 test 개월을 남겨 두고 맞춘 뒤 계산).
+#   python -m shiitake.forecast --horizon 12 --workers 4
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from shiitake.config import CSV_MACRO
+from shiitake.index import KEY_COLUMNS, group_offsets
+from shiitake.predictions import DIST_LABELS, GRADE_LABELS, PRED_SCHEMA
+
+log = logging.getLogger(__name__)
+
+SEASON = 12
+TEST_MONTHS = 12
+HW_GRID = [(a, b, g) for a in (0.2, 0.5, 0.8) for b in (0.05, 0.2) for g in (0.1, 0.3)]
+RIDGE_LAGS = 12
+RIDGE_LAMBDA = 1.0
+
+
+def seasonal_naive(y, steps):
+    # 마지막 한 해를 그대로 반복
+    if len(y) < SEASON:
+        return None
+    last = y[-SEASON:]
+    return last[np.arange(steps) % SEASON]
+
+
+def _holt_winters(y, alpha, beta, gamma, steps):
+    # 가법 Holt-Winters. (한 단계 예측 SSE, steps 개 예측) 을 돌려준다.
+    m = SEASON
+    level = y[:m].mean()
+    trend = (y[m:2 * m].mean() - level) / m
+    season = y[:m] - level
+    sse = 0.0
+    for t in range(m, len(y)):
+        s = season[t % m]
+        err = y[t] - (level + trend + s)
+        sse += err * err
+        prev = level
+        level = alpha * (y[t] - s) + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev) + (1 - beta) * trend
+        season[t % m] = gamma * (y[t] - level) + (1 - gamma) * s
+    h = np.arange(1, steps + 1)
+    n = len(y)
+    return sse, level + h * trend + season[(n + h - 1) % m]
+
+
+def holt_winters(y, steps):
+    # 두 계절 이상 있어야 맞춘다. 매개변수는 작은 격자에서 한 단계 예측 SSE 가 가장 작은 것.
+    if len(y) < 2 * SEASON:
+        return None
+    best = min((_holt_winters(y, *params, steps) for params in HW_GRID), key=lambda r: r[0])
+    return best[1]
+
+
+def ridge_lags(y, steps, lags=RIDGE_LAGS, lam=RIDGE_LAMBDA):
+    # 직전 lags 개월 값으로 다음 달을 맞추는 ridge 회귀 (닫힌 해), 예측은 재귀적으로.
+    if len(y) < 2 * lags + 1:
+        return None
+    mu, sd = y.mean(), y.std() or 1.0
+    z = (y - mu) / sd
+    X = np.lib.stride_tricks.sliding_window_view(z[:-1], lags)
+    X = np.hstack([X, np.ones((len(X), 1))])
+    target = z[lags:]
+    penalty = lam * np.eye(lags + 1)
+    penalty[-1, -1] = 0.0
+    coef = np.linalg.solve(X.T @ X + penalty, X.T @ target)
+    window = list(z[-lags:])
+    out = np.empty(steps)
+    for i in range(steps):
+        nxt = float(np.dot(window[-lags:], coef[:-1]) + coef[-1])
+        out[i] = nxt
+        window.append(nxt)
+    return out * sd + mu
+
+
+MODELS = {
+    "SeasonalNaive": seasonal_naive,
+    "HoltWinters": holt_winters,
+    "RidgeLags": ridge_lags,
+}
+
+
+def fit_series(task):
+    # 시계열 하나에 모든 모델을 맞춰 모델별 결과 행을 돌려준다 (프로세스 풀에서 실행).
+    key, y, last_price, horizon, test, models = task
+    rows = []
+    for name in models:
+        fn = MODELS[name]
+        backtest = fn(y[:-test], test) if len(y) > test else None
+        forecast = fn(y, horizon)
+        if backtest is None or forecast is None:
+            continue
+        rows.append((*key, name, float(forecast[horizon - 1]), float(np.sqrt(np.mean((backtest - y[-test:]) ** 2)))))
+    return rows, y[-SEASON:].mean(), last_price
+
+
+def monthly_series(prices):
+    # {(도, 등급, 유통구분): 월 평균 배열} (빠진 달은 앞뒤 값으로 선형 보간) 과 마지막 일별 단가
+    table = prices.monthly.table()
+    daily = prices.daily.table()
+    last_daily = daily.groupby(KEY_COLUMNS, observed=True, sort=False)["평균"].last()
+    series = {}
+    for key, (lo, hi) in group_offsets(table).items():
+        s = table["평균"].iloc[lo:hi].set_axis(table["기간"].iloc[lo:hi])
+        s = s.asfreq("MS").interpolate(limit_direction="both")
+        series[key] = s.to_numpy(dtype="float64")
+    return series, last_daily
+
+
+def _tasks(series, last_daily, horizon, test, models):
+    for key, y in series.items():
+        yield key, y, float(last_daily.get(key, y[-1])), horizon, test, tuple(models)
+
+
+def run_forecasts(prices, horizon=12, workers=None, test=TEST_MONTHS, models=tuple(MODELS)):
+    # 모든 시계열을 맞춰 CSV_PRED 스키마 DataFrame 을 돌려준다. workers=1 이면 현재 프로세스에서 실행.
+    series, last_daily = monthly_series(prices)
+    tasks = list(_tasks(series, last_daily, horizon, test, models))
+    if workers == 1 or len(tasks) < 2:
+        results = list(map(fit_series, tasks))
+    else:
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(tasks) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fit_series, tasks, chunksize=chunksize))
+
+    records = []
+    for rows, actual, last in results:
+        for region, grade, dist, model, pred, rmse in rows:
+            records.append({
+                "도": region,
+                "등급": GRADE_LABELS.get(grade, str(grade)), "등급_num": grade,
+                "유통구분": DIST_LABELS.get(dist, str(dist)), "유통_num": dist,
+                "예상단가(원)": round(pred), "모델": model, "테스트_RMSE": round(rmse, 2),
+                "실제평균단가": round(actual), "예측-실제평균(원)": round(pred - actual),
+                "마지막판매단가": round(last), "예측-마지막판매(원)": round(pred - last),
+            })
+    return pd.DataFrame(records, columns=PRED_SCHEMA), len(tasks)
+
+
+def output_path(horizon, directory=".", prefix="engine"):
+    # 오프라인 예측 파일(CSV_PRED)을 덮어쓰지 않도록 접두어를 붙인다. 이름은 여전히 PRED_GLOB 에 맞아 앱이 함께 읽고,
+    # 파일끼리 (도, 등급, 유통구분, 모델, 호라이즌) 가 겹치면 정렬 순서상 뒤 파일의 행을 쓴다.
+    # 백테스트 결과는 모델 이름에 backtest.MODEL_SUFFIX 를 붙여 엔진 결과와 겹치지 않는다.
+    return os.path.join(directory, f"{prefix}_{horizon}개월후_예측_vs_실제_비교.csv")
+
+
+def write_forecasts(df, path):
+    # 앱의 백그라운드 워커가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체한다.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    df.to_csv(tmp, index=False, encoding="utf-8-sig")
+    os.replace(tmp, path)
+
+
+def main():
+    from shiitake.prices import build_price_data
+
+    parser = argparse.ArgumentParser(description="final.csv 에서 (도, 등급, 유통구분) 별 단가 재예측")
+    parser.add_argument("--csv", default=CSV_MACRO)
+    parser.add_argument("--horizon", type=int, nargs="+", default=[12], help="예측 기간 (개월)")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=list(MODELS))
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--test", type=int, default=TEST_MONTHS, help="테스트_RMSE 에 쓸 마지막 개월 수")
+    parser.add_argument("--out-dir", default=".")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    prices = build_price_data(args.csv)
+    for horizon in args.horizon:
+        started = time.perf_counter()
+        df, n_series = run_forecasts(prices, horizon, args.workers, args.test, args.models)
+        path = output_path(horizon, args.out_dir)
+        if df.empty:
+            # 시계열이 너무 짧으면 기존 파일을 빈 파일로 덮어쓰지 않는다.
+            log.warning("forecast horizon=%d: 맞출 수 있는 시계열이 없어 %s 를 쓰지 않음 (최소 %d개월 필요)",
+                        horizon, path, args.test + SEASON)
+            continue
+        write_forecasts(df, path)
+        seconds = time.perf_counter() - started
+        log.info("forecast horizon=%d series=%d rows=%d seconds=%.2f series_per_sec=%.1f path=%s",
+                 horizon, n_series, len(df), seconds, n_series / seconds if seconds else 0.0, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# (도, 등급, 유통구분) 그룹 인덱스.
+# 키와 날짜 순으로 정렬된 프레임에서 그룹별 [start, stop) 구간을 구해 두고,
+# 조회는 dict 조회 + 그룹 안 날짜 searchsorted 로 처리한다.
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+KEY_COLUMNS = ["도", "등급", "유통구분"]
+
+
+def group_offsets(df):
+    # 정렬된 프레임에서 키가 바뀌는 위치를 찾아 {(도, 등급, 유통구분): (start, stop)} 을 만든다.
+    if df.empty:
+        return {}
+    codes = df["도"].cat.codes.to_numpy()
+    grade = df["등급"].to_numpy()
+    dist = df["유통구분"].to_numpy()
+    changed = (np.diff(codes) != 0) | (np.diff(grade) != 0) | (np.diff(dist) != 0)
+    starts = np.concatenate(([0], np.flatnonzero(changed) + 1))
+    stops = np.append(starts[1:], len(df))
+    categories = df["도"].cat.categories
+    return {
+        (categories[codes[a]], int(grade[a]), int(dist[a])): (int(a), int(b))
+        for a, b in zip(starts, stops)
+    }
+
+
+def slice_bounds(offsets, dates, key, start=None, end=None):
+    # key 그룹 안에서 start <= 날짜 <= end 인 구간의 [lo, hi) 를 돌려준다. 그룹이 없으면 None.
+    region, grade, dist = key
+    bounds = offsets.get((region, int(grade), int(dist)))
+    if bounds is None:
+        return None
+    lo, hi = bounds
+    group_dates = dates[lo:hi]
+    if start is not None:
+        lo += int(np.searchsorted(group_dates, np.datetime64(pd.Timestamp(start)), side="left"))
+    if end is not None:
+        hi = bounds[0] + int(np.searchsorted(group_dates, np.datetime64(pd.Timestamp(end)), side="right"))
+    return lo, max(lo, hi)
+
+
+def concat_groups(frames):
+    # 도 category 를 하나로 맞춘 뒤 이어 붙인다 (문자열로 바꾸지 않음).
+    categories = union_categoricals([f["도"] for f in frames], ignore_order=True).categories
+    return pd.concat([f.assign(도=f["도"].cat.set_categories(categories)) for f in frames], ignore_index=True)
+
+
+def compact_segments(segments, merge, size):
+    # 델타 세그먼트가 많아지면 델타끼리만 합치고, 합친 델타가 기준 세그먼트만큼 커졌을 때만 전체를 합친다.
+    # 한 행이 다시 합쳐지는 횟수가 로그 수준으로 제한되어 갱신 비용이 새 행 수에 비례한다.
+    delta = merge(segments[1:])
+    if size(delta) >= size(segments[0]):
+        return (merge((segments[0], delta)),)
+    return (segments[0], delta)
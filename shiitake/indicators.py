@@ -0,0 +1,72 @@
+# 사회경제 지표 프레임.
+# 데이터 버전마다 한 번, 날짜별 한 행으로 정리해 날짜순으로 정렬해 두고,
+# 여러 지표의 기간 조회를 searchsorted 한 번으로 처리해 복사 없는 구간(view)으로 돌려준다.
+# 행이 덧붙여지면 새 행의 날짜만 정리해 이어 붙인다 (이미 있는 날짜는 그대로).
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from shiitake.columnar import DATE_COLUMNS, ensure_cache, load_table
+
+INDICATORS = [
+    "소비자물가지수",
+    "시간당 최저임금(원)",
+    "평균유가",
+    "산업용 전기 (₩/kWh)",
+    "LPG (₩/L)",
+    "LNG (₩/MMBtu)",
+]
+
+
+@dataclass(frozen=True)
+class IndicatorData:
+    version: str
+    base: str
+    rows: int
+    df: pd.DataFrame
+    dates: np.ndarray
+    columns: list
+
+    def slices(self, ranges):
+        # ranges: {지표: (시작일, 종료일)} -> {지표: 날짜 인덱스 Series (view)}, 종료일 포함
+        names = list(ranges)
+        starts = np.array([np.datetime64(pd.Timestamp(ranges[n][0])) for n in names])
+        ends = np.array([np.datetime64(pd.Timestamp(ranges[n][1])) for n in names])
+        lo = np.searchsorted(self.dates, starts, side="left")
+        hi = np.searchsorted(self.dates, ends, side="right")
+        return {n: self.df[n].iloc[a:max(a, b)] for n, a, b in zip(names, lo, hi)}
+
+
+def _by_date(raw):
+    date_col = next((c for c in raw.columns if c.lower() in DATE_COLUMNS), raw.columns[0])
+    columns = [c for c in INDICATORS if c in raw.columns]
+    # final.csv 는 단가 행마다 같은 날짜의 지표가 반복되므로 날짜별 한 행으로 줄인다.
+    return (
+        raw[columns]
+        .set_index(pd.to_datetime(raw[date_col], errors="coerce").rename("date"))
+        .loc[lambda d: d.index.notna()]
+        .groupby(level=0)
+        .mean()
+        .sort_index()
+    )
+
+
+def build_indicator_data(path, meta=None):
+    meta = meta or ensure_cache(path)
+    df = _by_date(load_table(path, meta=meta))
+    return IndicatorData(meta["sha256"][:16], meta["base"], meta["rows"], df, df.index.to_numpy(), list(df.columns))
+
+
+def refresh_indicator_data(path, previous=None):
+    # prices.refresh_price_data 와 같은 규칙: 같은 버전이면 그대로, 덧붙여졌으면 새 날짜만 추가.
+    meta = ensure_cache(path)
+    version = meta["sha256"][:16]
+    if previous is not None and previous.version == version:
+        return previous
+    if previous is None or previous.base != meta["base"] or meta["rows"] < previous.rows:
+        return build_indicator_data(path, meta)
+    tail = _by_date(load_table(path, start=previous.rows, meta=meta))
+    tail = tail.loc[~tail.index.isin(previous.df.index), previous.columns]
+    df = previous.df if tail.empty else pd.concat([previous.df, tail]).sort_index()
+    return IndicatorData(version, previous.base, meta["rows"], df, df.index.to_numpy(), previous.columns)
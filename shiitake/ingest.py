@@ -0,0 +1,83 @@
+# CSV 수집 모듈.
+# 파일 앞부분(최대 64KB)만 읽어 BOM 또는 시험 디코딩으로 인코딩을 판별한 뒤,
+# dtype 맵과 usecols 를 지정해 한 번만 파싱한다. 가능하면 pyarrow 엔진을 쓴다.
+import codecs
+import csv
+import io
+import logging
+import os
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+SAMPLE_SIZE = 64 * 1024
+ENCODINGS = ("utf-8", "cp949", "euc-kr")
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+try:
+    import pyarrow  # noqa: F401
+    ENGINE = "pyarrow"
+except ImportError:
+    ENGINE = "c"
+
+
+@dataclass(frozen=True)
+class IngestStats:
+    path: str
+    encoding: str
+    engine: str
+    bytes_read: int
+    rows: int
+    seconds: float
+
+
+def sniff_encoding(sample, complete=False):
+    # complete=False 이면 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않는다.
+    for bom, enc in BOMS:
+        if sample.startswith(bom):
+            return enc
+    for enc in ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(enc)().decode(sample, final=complete)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("CSV 인코딩을 판별할 수 없습니다.")
+
+
+def _read_header(sample, encoding):
+    text = codecs.getincrementaldecoder(encoding)(errors="ignore").decode(sample)
+    return next(csv.reader(io.StringIO(text)), [])
+
+
+def read_csv(source, dtype=None, usecols=None, encoding=None):
+    # (DataFrame, IngestStats) 를 돌려준다. dtype/usecols 중 파일에 없는 컬럼은 무시한다.
+    # source 는 경로 또는 BytesIO (덧붙여진 꼬리만 파싱할 때는 헤더 + 꼬리 바이트, encoding 은 이미 알고 있음).
+    started = time.perf_counter()
+    if isinstance(source, io.BytesIO):
+        size = source.getbuffer().nbytes
+        sample = source.getvalue()[:SAMPLE_SIZE]
+        label = "<buffer>"
+    else:
+        size = os.path.getsize(source)
+        with open(source, "rb") as f:
+            sample = f.read(SAMPLE_SIZE)
+        label = source
+    encoding = encoding or sniff_encoding(sample, complete=len(sample) >= size)
+    header = _read_header(sample, encoding)
+    if dtype:
+        dtype = {c: t for c, t in dtype.items() if c in header}
+    if usecols:
+        usecols = [c for c in usecols if c in header]
+    df = pd.read_csv(source, encoding=encoding, dtype=dtype or None, usecols=usecols or None, engine=ENGINE)
+    stats = IngestStats(label, encoding, ENGINE, size, len(df), time.perf_counter() - started)
+    log.info("csv ingest path=%s encoding=%s engine=%s bytes=%d rows=%d seconds=%.3f",
+             stats.path, stats.encoding, stats.engine, stats.bytes_read, stats.rows, stats.seconds)
+    return df, stats
@@ -0,0 +1,168 @@
+# 메모리 계측과 프로세스 공용 캐시.
+# 세션 상태(st.session_state)에는 필터 선택값 같은 가벼운 값만 두고, 무거운 데이터(DataFrame, 배열, 이미지 바이트)는
+# 모든 세션이 공유하는 SizedLRU (항목 수·바이트 상한, 넘치면 오래 안 쓴 것부터 제거) 에 둔다.
+# rerun 이 끝날 때마다 세션 상태를 점검해 무거운 값은 지우고, 세션별 크기를 장부에 남겨 개발자 패널에서 본다.
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dtime
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# 세션 상태 한 값의 상한 (넘으면 가벼운 타입이라도 지운다)
+SESSION_VALUE_BYTES = 64 * 1024
+SESSION_TTL = 3600
+MAX_SESSIONS = 1024
+CACHE_COLUMNS = ("cache", "entries", "max_entries", "bytes", "max_bytes", "hits", "misses", "evictions")
+LIGHT_TYPES = (str, int, float, bool, date, datetime, dtime, type(None))
+
+_registry = []
+_registry_lock = threading.Lock()
+_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+
+
+def sizeof(obj, _seen=None):
+    # 깊은 크기 추정 (바이트). pandas/NumPy 는 자체 계산을 쓰고, 컨테이너는 한 번씩만 센다.
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return len(obj)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, _seen) + sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(v, _seen) for v in obj)
+    return size
+
+
+class SizedLRU:
+    def __init__(self, name, max_entries=256, max_bytes=64 * 1024 * 1024, sizeof=sizeof):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._items.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                # 한 항목이 상한보다 크면 다른 항목을 다 밀어내지 않도록 보관하지 않는다.
+                return value
+            self._items[key] = (value, size)
+            self._bytes += size
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._items.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cache": self.name, "entries": len(self._items), "max_entries": self.max_entries,
+                "bytes": self._bytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def cache_stats():
+    with _registry_lock:
+        caches = list(_registry)
+    return [cache.stats() for cache in caches]
+
+
+def rss_bytes():
+    # 현재 프로세스 RSS (리눅스 /proc, 그 외에는 최대 RSS)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def is_light(value):
+    if isinstance(value, LIGHT_TYPES):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(v, LIGHT_TYPES) for v in value)
+    return False
+
+
+def slim_session_state(state):
+    # 가볍지 않은 값(또는 상한을 넘는 값)을 세션 상태에서 지우고 {키: 바이트} 를 돌려준다.
+    removed = {}
+    for key in list(state.keys()):
+        try:
+            value = state[key]
+        except KeyError:
+            continue
+        size = sizeof(value)
+        if not is_light(value) or size > SESSION_VALUE_BYTES:
+            del state[key]
+            removed[key] = size
+    if removed:
+        log.warning("session_state slimmed %s", removed)
+    return removed
+
+
+def record_session(session_id, state):
+    # 세션별 상태 크기를 장부에 남긴다. 오래 갱신되지 않은 세션과 상한을 넘는 세션은 지운다.
+    keys = list(state.keys())
+    size = sum(sizeof(k) + sizeof(state[k]) for k in keys if k in state)
+    now = time.time()
+    with _sessions_lock:
+        _sessions.pop(session_id, None)
+        _sessions[session_id] = {"session": session_id, "keys": len(keys), "bytes": size, "updated": now}
+        while _sessions and (len(_sessions) > MAX_SESSIONS or next(iter(_sessions.values()))["updated"] < now - SESSION_TTL):
+            _sessions.popitem(last=False)
+    return size
+
+
+def session_stats():
+    with _sessions_lock:
+        return list(_sessions.values())
@@ -0,0 +1,101 @@
+# 페이지 구간별(load / clean / filter / aggregate / render) 실행 시간 측정.
+# SHIITAKE_PROFILE=1 일 때만 켜지며, 꺼져 있으면 stage() 가 재사용 가능한 nullcontext 를 돌려주므로 비용이 거의 없다.
+# rerun 하나가 끝나면 구간별 합계를 구조화된 로그 한 줄로 남기고, (페이지, 구간)별 최근 WINDOW 개 기록으로 p50/p95 를 계산한다.
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+
+log = logging.getLogger(__name__)
+
+WINDOW = 200
+_NULL = nullcontext()
+_enabled = os.environ.get("SHIITAKE_PROFILE", "").lower() in ("1", "true", "yes", "on")
+# Streamlit 은 세션마다 별도 스레드에서 스크립트를 실행하므로 rerun 단위 기록은 스레드별로 모은다.
+_local = threading.local()
+_lock = threading.Lock()
+_windows = defaultdict(lambda: deque(maxlen=WINDOW))
+_recent = deque(maxlen=WINDOW)
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = flag
+
+
+def enabled():
+    return _enabled
+
+
+@contextmanager
+def _timed(page, name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        records = getattr(_local, "records", None)
+        if records is not None:
+            records.append((page, name, time.perf_counter() - started))
+
+
+def stage(page, name):
+    if not _enabled:
+        return _NULL
+    return _timed(page, name)
+
+
+def begin_run():
+    _local.records = []
+    _local.started = time.perf_counter()
+
+
+def end_run(session_id):
+    # 이번 rerun 의 구간별 합계를 돌려주고 rolling window 와 로그에 반영한다.
+    records = getattr(_local, "records", None)
+    if records is None:
+        return None
+    _local.records = None
+    total = time.perf_counter() - _local.started
+    page = records[0][0] if records else "intro"
+    stages = {}
+    for _, name, seconds in records:
+        stages[name] = stages.get(name, 0.0) + seconds
+    summary = {
+        "session": session_id,
+        "page": page,
+        "total": round(total, 6),
+        "stages": {name: round(seconds, 6) for name, seconds in stages.items()},
+    }
+    with _lock:
+        _windows[(page, "total")].append(total)
+        for name, seconds in stages.items():
+            _windows[(page, name)].append(seconds)
+        _recent.append(summary)
+    log.info("rerun %s", json.dumps(summary, ensure_ascii=False))
+    return summary
+
+
+def _percentile(values, q):
+    # nearest-rank 백분위: 정렬해 ceil(q/100 × n) 번째 값 (q 와 n 을 먼저 곱해 부동소수 오차를 피한다)
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered) / 100) - 1))]
+
+
+def percentiles():
+    with _lock:
+        windows = {key: list(values) for key, values in _windows.items()}
+    return [
+        {"page": page, "stage": name, "n": len(values),
+         "p50_ms": round(_percentile(values, 50) * 1000, 2),
+         "p95_ms": round(_percentile(values, 95) * 1000, 2)}
+        for (page, name), values in sorted(windows.items())
+    ]
+
+
+def recent_runs():
+    with _lock:
+        return list(_recent)
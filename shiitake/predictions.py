@@ -0,0 +1,197 @@
+# 예측 결과 CSV (CSV_PRED 및 PRED_GLOB 에 맞는 모델·기간별 파일) 로더.
+# 예측 파일 버전마다 한 번, 여러 파일을 (도, 등급_num, 유통_num, 모델, 호라이즌) 키로 합치고
+# 갭 컬럼을 표 전체에 대해 계산한다. (도, 등급_num, 유통_num, 호라이즌) 별 테스트_RMSE 최저 행을 한 번의 정렬로 고르고,
+# (등급_num, 유통_num, 모델 또는 BEST, 호라이즌) 조합별 표와 갭 색상(CSS)을 미리 만들어 조회는 dict 한 번이다.
+import os
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from shiitake.ingest import read_csv
+from shiitake.memory import SizedLRU
+
+PRED_DTYPES = {
+    "도": "category",
+    "등급": "category",
+    "등급_num": "Int64",
+    "유통구분": "category",
+    "유통_num": "Int64",
+    "예상단가(원)": "float64",
+    "모델": "category",
+    "테스트_RMSE": "float64",
+    "실제평균단가": "float64",
+    "마지막판매단가": "float64",
+    # 선택 컬럼: shiitake.backtest 가 쓰는 파일에만 있다
+    "테스트_MAPE": "float64",
+}
+PRED_COLUMNS = list(PRED_DTYPES)
+# 예측 CSV 전체 컬럼 순서 (shiitake.forecast 가 쓰는 파일)
+PRED_SCHEMA = [
+    "도", "등급", "등급_num", "유통구분", "유통_num", "예상단가(원)", "모델", "테스트_RMSE",
+    "실제평균단가", "예측-실제평균(원)", "마지막판매단가", "예측-마지막판매(원)",
+]
+PRED_REQUIRED = ["도", "등급_num", "유통_num", "예상단가(원)"]
+KEY_COLUMNS = ["도", "등급_num", "유통_num"]
+STORE_KEY = KEY_COLUMNS + ["모델", "호라이즌"]
+HORIZON_PATTERN = re.compile(r"(\d+)\s*개월후")
+DEFAULT_HORIZON = 12
+# 모델 선택값: BEST 이면 도별로 테스트_RMSE 가 가장 낮은 모델
+BEST = "best"
+UNKNOWN_MODEL = "미지정"
+# 등급_num / 유통_num 의 표시 이름 (예측 CSV 의 등급·유통구분 컬럼)
+GRADE_LABELS = {1: "1 (보통)", 2: "2 (상)", 3: "3 (특)"}
+DIST_LABELS = {1: "1 (생산지)", 2: "2 (도매지)", 3: "3 (소비지)"}
+# 갭 표에 보여줄 컬럼 (원본 -> 표시 이름)
+GAP_COLUMNS = {
+    "실제평균단가": "실제평균(원)",
+    "예상단가(원)": "예측단가(원)",
+    "갭_평균": "갭(평균)",
+    "마지막판매단가": "마지막실제(원)",
+    "갭_마지막": "갭(마지막)",
+}
+# 표시 서식 (예측 페이지, 리포트, 정적 빌드가 같이 쓴다)
+PRICE_FORMATS = {"예상단가(원)": "{:,.0f}원", "테스트_RMSE": "{:,.1f}", "테스트_MAPE": "{:.1f}%"}
+GAP_FORMATS = {
+    "실제평균(원)": "{:,.0f}원",
+    "예측단가(원)": "{:,.0f}원",
+    "갭(평균)": "{:+,.0f}원",
+    "마지막실제(원)": "{:,.0f}원",
+    "갭(마지막)": "{:+,.0f}원",
+}
+GRADIENT_COLUMNS = ["갭(평균)", "갭(마지막)"]
+
+_html = SizedLRU("forecast_tables", max_entries=256, max_bytes=32 * 1024 * 1024, sizeof=len)
+GRADIENT_CMAP = "RdYlBu_r"
+
+
+@dataclass(frozen=True)
+class ForecastTable:
+    prices: pd.DataFrame
+    gaps: pd.DataFrame
+    # gaps 와 같은 모양의 셀별 CSS (갭 컬럼만 배경색, 나머지는 빈 문자열)
+    gap_css: pd.DataFrame
+
+
+@dataclass(frozen=True)
+class PredictionData:
+    version: str
+    df: pd.DataFrame
+    grades: list
+    dists: list
+    models: list
+    horizons: list
+    # {(등급_num, 유통_num, 모델 또는 BEST, 호라이즌): ForecastTable}
+    tables: dict
+
+
+def horizon_of(path):
+    # "6개월후_예측_vs_실제_비교.csv" -> 6 (숫자가 없으면 12)
+    m = HORIZON_PATTERN.search(os.path.basename(path))
+    return int(m.group(1)) if m else DEFAULT_HORIZON
+
+
+def load_predictions(path):
+    df, _ = read_csv(path, dtype=PRED_DTYPES, usecols=PRED_COLUMNS)
+    return df
+
+
+def load_forecasts(paths):
+    # 파일마다 한 번 파싱해 호라이즌 컬럼을 붙여 합친다.
+    frames = []
+    for path in paths:
+        df = load_predictions(path)
+        df["호라이즌"] = horizon_of(path)
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _relative_luminance(rgb):
+    rgb = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return rgb @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def gradient_css(values, cmap=GRADIENT_CMAP, text_color_threshold=0.408):
+    # Styler.background_gradient 와 같은 규칙(컬럼별 min-max 정규화, 어두운 배경은 흰 글자)으로 CSS 를 만든다.
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
+
+    v = values.to_numpy(dtype="float64")
+    lo, hi = np.nanmin(v, initial=np.inf), np.nanmax(v, initial=-np.inf)
+    norm = (v - lo) / (hi - lo) if hi > lo else np.zeros_like(v)
+    rgba = colormaps[cmap](norm)
+    dark = _relative_luminance(rgba[:, :3]) < text_color_threshold
+    css = [
+        f"background-color: {to_hex(c)}; color: {'#f1f1f1' if d else '#000000'};"
+        for c, d in zip(rgba, dark)
+    ]
+    return pd.Series(np.where(np.isnan(v), "", css), index=values.index)
+
+
+def styled_html(df, formats, css=None, uuid=None):
+    # 서식(과 셀별 CSS)을 입힌 HTML 표. Streamlit 에 Styler 를 넘기면 rerun 마다 스타일을 다시 계산하므로 HTML 로 한 번 만든다.
+    styler = df.style if css is None else df.style.apply(lambda _: css, axis=None)
+    if uuid is not None:
+        styler = styler.set_uuid(uuid)
+    return styler.format(formats, na_rep="-").to_html()
+
+
+def gaps_html(version, key, table):
+    # 갭 표 HTML 을 (예측 버전, 조합) 키로 캐시한다. 셀 CSS 선택자가 겹치지 않도록 uuid 는 조합에서 만든다.
+    html = _html.get((version, key))
+    if html is None:
+        uuid = "gap_" + re.sub(r"\W", "_", "_".join(map(str, key)))
+        html = _html.put((version, key), styled_html(table.gaps, GAP_FORMATS, table.gap_css, uuid))
+    return html
+
+
+def _forecast_table(group):
+    prices = group[["도", "예상단가(원)", "모델", "테스트_RMSE", "테스트_MAPE"]].set_index("도")
+    gaps = group[["도", *GAP_COLUMNS]].rename(columns=GAP_COLUMNS).set_index("도")
+    gap_css = pd.DataFrame("", index=gaps.index, columns=gaps.columns)
+    for col in GRADIENT_COLUMNS:
+        gap_css[col] = gradient_css(gaps[col])
+    return ForecastTable(prices, gaps, gap_css)
+
+
+def prepare_predictions(df, version):
+    df = df.dropna(subset=PRED_REQUIRED)
+    if "호라이즌" not in df.columns:
+        df = df.assign(호라이즌=DEFAULT_HORIZON)
+    if "테스트_MAPE" not in df.columns:
+        df = df.assign(테스트_MAPE=np.nan)
+    df = df.assign(
+        도=df["도"].astype(str),
+        등급_num=df["등급_num"].astype("int64"),
+        유통_num=df["유통_num"].astype("int64"),
+        모델=df["모델"].astype("string").fillna(UNKNOWN_MODEL).astype(str),
+        # 갭은 표 전체에 대해 한 번에 계산한다.
+        갭_평균=df["예상단가(원)"] - df["실제평균단가"],
+        갭_마지막=df["예상단가(원)"] - df["마지막판매단가"],
+    )
+    # 같은 키가 여러 번 나오면 마지막 행을 쓰고, 키·RMSE 순으로 정렬해 그룹 첫 행이 argmin 이 되게 한다.
+    df = (
+        df.drop_duplicates(subset=STORE_KEY, keep="last")
+        .sort_values(KEY_COLUMNS + ["호라이즌", "테스트_RMSE"], na_position="last", kind="stable")
+        .reset_index(drop=True)
+    )
+    # (도, 등급, 유통구분, 호라이즌) 마다 테스트_RMSE 최저 행
+    best_rows = df.drop_duplicates(subset=KEY_COLUMNS + ["호라이즌"], keep="first")
+    tables = {
+        (g, u, BEST, h): _forecast_table(group)
+        for (g, u, h), group in best_rows.groupby(["등급_num", "유통_num", "호라이즌"], sort=True)
+    }
+    tables.update({
+        (g, u, m, h): _forecast_table(group)
+        for (g, u, m, h), group in df.groupby(["등급_num", "유통_num", "모델", "호라이즌"], sort=True)
+    })
+    return PredictionData(
+        version=version,
+        df=df,
+        grades=sorted(df["등급_num"].unique().tolist()),
+        dists=sorted(df["유통_num"].unique().tolist()),
+        models=sorted(df["모델"].unique().tolist()),
+        horizons=sorted(df["호라이즌"].unique().tolist()),
+        tables=tables,
+    )
@@ -0,0 +1,94 @@
+# 단가 트렌드용 집계.
+# 데이터 버전(원본 CSV 해시)마다 한 번만 정제해 월별/일별 집계(rollups)를 만들고, 정제한 원본 행은 버린다.
+# 서버 프로세스 안의 모든 세션이 같은 객체를 읽기 전용으로 공유하며, 조회는 집계의 (도, 등급, 유통구분) 인덱스로 한다.
+# final.csv 에 행이 덧붙여진 경우에는 새 행만 정제해 영향을 받는 집계만 갱신한다 (extend).
+from dataclasses import dataclass
+
+import pandas as pd
+
+from shiitake.columnar import ensure_cache, load_table
+from shiitake.rollups import Rollup, build_rollup
+
+PRICE_COLUMNS = ["조사일", "도", "등급", "유통구분", "당일"]
+
+
+@dataclass(frozen=True)
+class PriceData:
+    version: str
+    base: str
+    rows: int
+    regions: list
+    grades: list
+    dists: list
+    date_min: pd.Timestamp
+    date_max: pd.Timestamp
+    monthly: Rollup
+    daily: Rollup
+
+    def extend(self, raw, meta):
+        # 덧붙여진 원본 행(raw)을 반영한 새 PriceData. 기존 객체는 그대로 둔다 (다른 세션이 읽는 중일 수 있음).
+        df = clean_prices(raw)
+        if df.empty:
+            return PriceData(meta["sha256"][:16], self.base, meta["rows"], self.regions, self.grades, self.dists,
+                             self.date_min, self.date_max, self.monthly, self.daily)
+        return PriceData(
+            version=meta["sha256"][:16],
+            base=self.base,
+            rows=meta["rows"],
+            regions=sorted(set(self.regions) | set(df["도"].unique())),
+            grades=sorted(set(self.grades) | {int(g) for g in df["등급"].unique()}),
+            dists=sorted(set(self.dists) | {int(u) for u in df["유통구분"].unique()}),
+            date_min=min(self.date_min, df["조사일"].min()),
+            date_max=max(self.date_max, df["조사일"].max()),
+            monthly=self.monthly.extend(df),
+            daily=self.daily.extend(df),
+        )
+
+
+def _to_number(s):
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s.astype(str).str.replace(",", ""), errors="coerce")
+
+
+def clean_prices(raw):
+    df = pd.DataFrame({
+        "조사일": pd.to_datetime(raw["조사일"], errors="coerce"),
+        "도": raw["도"].astype("category"),
+        "등급": _to_number(raw["등급"]),
+        "유통구분": _to_number(raw["유통구분"]),
+        "당일": _to_number(raw["당일"]),
+    })
+    df = df.dropna(subset=PRICE_COLUMNS)
+    df["도"] = df["도"].cat.remove_unused_categories()
+    df["등급"] = df["등급"].astype("int8")
+    df["유통구분"] = df["유통구분"].astype("int8")
+    df["당일"] = df["당일"].astype("float32")
+    return df.reset_index(drop=True)
+
+
+def build_price_data(path, meta=None):
+    meta = meta or ensure_cache(path)
+    df = clean_prices(load_table(path, columns=PRICE_COLUMNS, meta=meta))
+    return PriceData(
+        version=meta["sha256"][:16],
+        base=meta["base"],
+        rows=meta["rows"],
+        regions=sorted(df["도"].unique()),
+        grades=sorted(int(g) for g in df["등급"].unique()),
+        dists=sorted(int(u) for u in df["유통구분"].unique()),
+        date_min=df["조사일"].min(),
+        date_max=df["조사일"].max(),
+        monthly=build_rollup(df, "M"),
+        daily=build_rollup(df, "D"),
+    )
+
+
+def refresh_price_data(path, previous=None):
+    # 버전이 같으면 previous 그대로, 같은 기준 파일에 행만 덧붙여졌으면 새 행만 반영, 아니면 전체를 다시 만든다.
+    meta = ensure_cache(path)
+    if previous is not None and previous.version == meta["sha256"][:16]:
+        return previous
+    if previous is not None and previous.base == meta["base"] and meta["rows"] >= previous.rows:
+        return previous.extend(load_table(path, columns=PRICE_COLUMNS, start=previous.rows, meta=meta), meta)
+    return build_price_data(path, meta)
@@ -0,0 +1,43 @@
+# 필터·집계 조회 결과 캐시.
+# 인기 있는 조합(예: 강원도 · 등급 1 · 생산지 · 기본 기간)은 여러 세션이 같은 조회를 반복하므로,
+# (데이터 버전, 도, 등급, 유통구분, 시작, 끝, 단위) 키로 결과를 모든 세션이 공유하는 SizedLRU 에 둔다.
+# 키에 버전이 들어 있으므로 버전이 바뀌어도 따로 지우지 않는다. 이전 버전 스냅샷을 아직 읽는 세션(또는 리포트 작업)과
+# 새 버전 세션이 번갈아 조회해도 서로의 결과를 지우지 않고, 더 안 쓰이는 이전 버전 결과는 LRU 에서 밀려난다
+# (결과는 복사본이라 이전 스냅샷을 붙잡지 않는다).
+from shiitake.memory import SizedLRU
+from shiitake.rollups import clip_months, wide_table
+
+MAX_ENTRIES = 1024
+MAX_BYTES = 128 * 1024 * 1024
+
+_results = SizedLRU("queries", max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES)
+
+
+def select(prices, granularity, region, grade, dist, start=None, end=None):
+    # granularity: "M" (월별 집계) 또는 "D" (일별 집계). 결과는 세션끼리 공유하므로 수정하지 않는다.
+    key = (prices.version, region, grade, dist, start, end, granularity)
+    df = _results.get(key)
+    if df is None:
+        if granularity == "M":
+            # 시작·종료일이 달 중간이면 경계 달은 일별 집계로 다시 계산한다.
+            df = clip_months(prices.monthly.select(region, grade, dist, start, end), prices.daily,
+                             [(region, int(grade), int(dist))], start, end)
+        else:
+            df = prices.daily.select(region, grade, dist, start, end)
+        df = _results.put(key, df.copy())
+    return df
+
+
+def stats():
+    return _results.stats()
+
+
+def compare(prices, regions, grades, dists, start=None, end=None):
+    # 선택한 도 × 등급 × 유통구분 조합의 월별 평균을 (기간 × 조합) 넓은 표 하나로 돌려준다.
+    key = (prices.version, tuple(regions), tuple(grades), tuple(dists), start, end, "M")
+    wide = _results.get(key)
+    if wide is None:
+        keys = [(r, int(g), int(d)) for r in regions for g in grades for d in dists]
+        rows = clip_months(prices.monthly.rows(keys, start, end), prices.daily, keys, start, end)
+        wide = _results.put(key, wide_table(rows, keys))
+    return wide
@@ -0,0 +1,319 @@
+# 맞춤형 리포트 생성.
+# 생산자가 고른 (도, 등급, 유통구분, 모델, 예측 기간) 조합을 zip 하나로 묶는다:
+# PDF (예측 표 + 막대 차트, 갭 표, 월별 추이, 사회경제 지표), Excel (같은 표와 시계열 시트; openpyxl 이 없으면 CSV), PNG 차트.
+# 앱에서는 요청 스레드 밖의 작은 스레드 풀에서 만들고, 같은 조합을 동시에 요청하면 하나의 작업을 함께 기다린다.
+# 결과는 "{데이터 버전}_{조합}.zip" 파일로 REPORT_DIR 에 두어 다시 받을 때는 파일만 읽는다. 버전이 바뀌면 이전 파일은 지운다.
+# 밤사이 모든 조합을 미리 만들어 두려면 (앱과 같은 경로 설정으로 실행해야 데이터 버전이 같다):
+#   python -m shiitake.reports --workers 4
+import argparse
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from shiitake import queries
+from shiitake.charts import (
+    forecast_bar_chart, indicator_chart, monthly_chart, plot_forecast_bar, plot_indicator, plot_monthly,
+    plot_table, render_pdf,
+)
+from shiitake.config import CSV_MACRO, PRED_GLOB, REPORT_DIR
+from shiitake.downsample import chart_points
+from shiitake.predictions import BEST, DEFAULT_HORIZON, DIST_LABELS, GAP_FORMATS, GRADE_LABELS, PRICE_FORMATS
+
+log = logging.getLogger(__name__)
+
+try:
+    import openpyxl  # noqa: F401
+    XLSX_ENGINE = "openpyxl"
+except ImportError:
+    XLSX_ENGINE = None
+
+# 앱 프로세스 안에서 동시에 만드는 리포트 수
+MAX_WORKERS = 2
+PAGE_SIZE = (11.69, 8.27)
+BACKGROUND_CSS = r"background-color:\s*(#[0-9a-fA-F]{6})"
+TEXT_CSS = r"(?<!-)color:\s*(#[0-9a-fA-F]{6})"
+
+_pool = None
+_jobs = {}
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Selection:
+    region: str
+    grade: int
+    dist: int
+    model: str = BEST
+    horizon: int = DEFAULT_HORIZON
+
+    @property
+    def slug(self):
+        return re.sub(r"[^\w.-]", "_", f"{self.region}_{self.grade}_{self.dist}_{self.model}_{self.horizon}")
+
+    @property
+    def title(self):
+        return (f"{self.region} · 등급 {GRADE_LABELS.get(self.grade, self.grade)} · "
+                f"유통 {DIST_LABELS.get(self.dist, self.dist)}")
+
+
+def data_version(snapshot):
+    # 단가·지표(final.csv)와 예측 파일의 버전을 합친 리포트 버전
+    parts = (snapshot.prices.version, snapshot.indicators.version, snapshot.predictions.version)
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def report_path(version, sel, directory=REPORT_DIR):
+    return os.path.join(directory, f"{version}_{sel.slug}.zip")
+
+
+def file_name(sel):
+    return f"표고버섯_리포트_{sel.slug}.zip"
+
+
+def _formatted(df, formats):
+    # 숫자 컬럼을 표시용 문자열로 (빈 값은 "-")
+    out = df.astype(object)
+    for col, fmt in formats.items():
+        if col in out:
+            out[col] = [fmt.format(v) if pd.notna(v) else "-" for v in df[col]]
+    return out
+
+
+def _colors(gap_css, pattern):
+    # 갭 표의 셀별 CSS (predictions.gradient_css) 에서 색만 꺼낸다.
+    return gap_css.apply(lambda col: col.str.extract(pattern, expand=False).fillna(""))
+
+
+def _tables(snapshot, sel):
+    table = snapshot.predictions.tables.get((sel.grade, sel.dist, sel.model, sel.horizon))
+    if table is None:
+        raise KeyError(f"예측 결과 없음: 등급 {sel.grade}, 유통 {sel.dist}, 모델 {sel.model}, {sel.horizon}개월")
+    monthly = queries.select(snapshot.prices, "M", sel.region, sel.grade, sel.dist)
+    return table, monthly, snapshot.indicators.df
+
+
+def _pdf(sel, table, monthly, indicators, basis):
+    def cover(fig):
+        fig.suptitle(f"표고버섯 맞춤형 리포트 — {sel.title}", fontsize=16, weight="bold")
+        model = "RMSE 최저 (도별 자동)" if sel.model == BEST else sel.model
+        fig.text(0.5, 0.91, f"모델: {model} · 예측 기간: {sel.horizon}개월 후 · 기준일: {basis}", ha="center", fontsize=10)
+        ax_table, ax_bar = fig.subplots(1, 2, width_ratios=[1, 1.4])
+        plot_table(ax_table, _formatted(table.prices, PRICE_FORMATS), "도별 예상단가", highlight=sel.region)
+        plot_forecast_bar(ax_bar, list(table.prices.index.astype(str)), table.prices["예상단가(원)"])
+        fig.subplots_adjust(top=0.85, wspace=0.35)
+
+    def gaps(fig):
+        plot_table(fig.subplots(), _formatted(table.gaps, GAP_FORMATS), "도별 예측 vs 실제 & 갭 분석",
+                   colors=_colors(table.gap_css, BACKGROUND_CSS), text_colors=_colors(table.gap_css, TEXT_CSS),
+                   highlight=sel.region)
+
+    def trend(fig):
+        ax = fig.subplots()
+        if monthly.empty:
+            ax.axis("off")
+            ax.text(0.5, 0.5, "해당 조건의 월별 데이터가 없습니다.", ha="center", fontsize=14)
+        else:
+            # PDF 에서는 날짜 축으로 그려 눈금을 줄인다 (문자열 범주 축은 달마다 눈금을 그린다).
+            plot_monthly(ax, monthly["기간"], monthly["평균"])
+        ax.set_title(f"월별 단가 트렌드 — {sel.title}", fontsize=12, weight="bold", loc="left")
+        fig.tight_layout()
+
+    def socioecon(fig):
+        axes = fig.subplots(2, 3).ravel()
+        points = chart_points((PAGE_SIZE[0] / 3, PAGE_SIZE[1] / 2), 100)
+        for ax, ind in zip(axes, indicators.columns):
+            s = indicators[ind].dropna()
+            plot_indicator(ax, s.index, s.to_numpy(), ind, points)
+        for ax in axes[len(indicators.columns):]:
+            ax.axis("off")
+        fig.suptitle("사회경제 지표", fontsize=12, weight="bold")
+        fig.subplots_adjust(left=0.06, right=0.98, top=0.9, bottom=0.1, wspace=0.25, hspace=0.45)
+
+    return render_pdf([cover, gaps, trend, socioecon], PAGE_SIZE)
+
+
+def _sheets(table, monthly, indicators):
+    return {
+        "예측": table.prices,
+        "갭": table.gaps,
+        "월별추이": monthly[["기간", "평균", "최소", "최대", "건수"]].set_index("기간"),
+        "사회경제지표": indicators,
+    }
+
+
+def build_bundle(snapshot, sel):
+    # 조합 하나의 리포트 zip 바이트
+    table, monthly, indicators = _tables(snapshot, sel)
+    key = (sel.region, sel.grade, sel.dist, snapshot.prices.version)
+    basis = snapshot.prices.date_max.strftime("%Y-%m-%d")
+    sheets = _sheets(table, monthly, indicators)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("리포트.pdf", _pdf(sel, table, monthly, indicators, basis))
+        if XLSX_ENGINE is not None:
+            xlsx = io.BytesIO()
+            with pd.ExcelWriter(xlsx, engine=XLSX_ENGINE) as writer:
+                for name, df in sheets.items():
+                    df.to_excel(writer, sheet_name=name)
+            zf.writestr("리포트.xlsx", xlsx.getvalue())
+        else:
+            for name, df in sheets.items():
+                zf.writestr(f"{name}.csv", df.to_csv(encoding="utf-8-sig"))
+        # PNG 는 페이지와 같은 차트 캐시를 거친다.
+        zf.writestr("차트/도별_예상단가.png", forecast_bar_chart(
+            (sel.grade, sel.dist, sel.model, sel.horizon, snapshot.predictions.version),
+            list(table.prices.index.astype(str)), table.prices["예상단가(원)"],
+        ))
+        if not monthly.empty:
+            zf.writestr("차트/월별_단가.png", monthly_chart(
+                key + (None, None), monthly["기간"].dt.strftime("%Y-%m"), monthly["평균"],
+            ))
+        for i, ind in enumerate(indicators.columns, 1):
+            s = indicators[ind].dropna()
+            zf.writestr(f"차트/지표{i}.png", indicator_chart(
+                (ind, snapshot.indicators.version, None, None), s.index, s.to_numpy(), ind,
+            ))
+    return buf.getvalue()
+
+
+def _prune(directory, version, before):
+    # 다른 데이터 버전의 리포트(와 그 임시 파일) 중 before 이전에 만들어진 것만 지운다.
+    # before 는 작업의 Snapshot 이 게시된 시각이라, 이전 Snapshot 으로 늦게 끝난 작업이 더 새 버전의 리포트를 지우지 않는다.
+    for name in os.listdir(directory):
+        if not name.startswith(f"{version}_"):
+            try:
+                path = os.path.join(directory, name)
+                if os.path.getmtime(path) < before:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+def generate(snapshot, sel, directory=REPORT_DIR):
+    # 리포트를 만들어 캐시 파일로 쓰고 경로를 돌려준다 (임시 파일에 쓴 뒤 교체).
+    version = data_version(snapshot)
+    path = report_path(version, sel, directory)
+    started = time.perf_counter()
+    data = build_bundle(snapshot, sel)
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    _prune(directory, version, snapshot.created)
+    log.info("report built selection=%s bytes=%d seconds=%.2f", sel.slug, len(data), time.perf_counter() - started)
+    return path
+
+
+def cached(snapshot, sel, directory=REPORT_DIR):
+    path = report_path(data_version(snapshot), sel, directory)
+    return path if os.path.exists(path) else None
+
+
+def _executor():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="shiitake-report")
+        return _pool
+
+
+def _finished(path, job):
+    # 성공한 작업은 파일 캐시가 대신하므로 잊는다. 실패한 작업은 오류를 보여줄 수 있게 다음 요청까지 남긴다.
+    if job.exception() is None:
+        with _lock:
+            if _jobs.get(path) is job:
+                del _jobs[path]
+
+
+def job(snapshot, sel, directory=REPORT_DIR):
+    # 진행 중이거나 실패한 작업 (없으면 None)
+    return _jobs.get(report_path(data_version(snapshot), sel, directory))
+
+
+def request(snapshot, sel, directory=REPORT_DIR):
+    # 풀에 리포트 생성을 올린다. 같은 조합이 이미 진행 중이면 그 작업을 돌려준다.
+    path = report_path(data_version(snapshot), sel, directory)
+    pool = _executor()
+    with _lock:
+        current = _jobs.get(path)
+        if current is not None and not (current.done() and current.exception() is not None):
+            return current
+        current = _jobs[path] = pool.submit(generate, snapshot, sel, directory)
+    current.add_done_callback(lambda done: _finished(path, done))
+    return current
+
+
+def selections(snapshot, models=(BEST,)):
+    # 예측 표가 있는 모든 (도, 등급, 유통구분, 모델, 예측 기간) 조합
+    return [
+        Selection(region, grade, dist, model, horizon)
+        for (grade, dist, model, horizon), table in sorted(
+            snapshot.predictions.tables.items(), key=lambda kv: (kv[0][0], kv[0][1], str(kv[0][2]), kv[0][3]))
+        if model in models
+        for region in table.prices.index.astype(str)
+    ]
+
+
+_batch = None
+
+
+def _load_batch(macro_path, pred_glob):
+    # 배치 워커마다 한 번: 앱과 같은 데이터 계층으로 Snapshot 을 만든다.
+    from shiitake.snapshot import Refresher
+
+    global _batch
+    _batch = Refresher(macro_path, pred_glob).refresh(wait_settle=False)
+
+
+def _batch_one(task):
+    sel, directory = task
+    started = time.perf_counter()
+    generate(_batch, sel, directory)
+    return time.perf_counter() - started
+
+
+def main():
+    from shiitake.snapshot import Refresher
+
+    global _batch
+    parser = argparse.ArgumentParser(description="모든 (도, 등급, 유통구분) 조합의 리포트를 미리 만든다")
+    parser.add_argument("--csv", default=CSV_MACRO)
+    parser.add_argument("--pred-glob", default=PRED_GLOB)
+    parser.add_argument("--models", nargs="+", default=[BEST], help=f"모델 이름 ({BEST} 이면 도별 RMSE 최저)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--out-dir", default=REPORT_DIR)
+    parser.add_argument("--force", action="store_true", help="이미 있는 리포트도 다시 만든다")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    snap = Refresher(args.csv, args.pred_glob).refresh(wait_settle=False)
+    if snap.prices is None or snap.indicators is None or snap.predictions is None:
+        parser.error(f"데이터를 읽을 수 없습니다: {snap.errors}")
+    started = time.perf_counter()
+    todo = [sel for sel in selections(snap, args.models) if args.force or cached(snap, sel, args.out_dir) is None]
+    tasks = [(sel, args.out_dir) for sel in todo]
+    if args.workers == 1 or len(tasks) < 2:
+        _batch = snap
+        seconds = list(map(_batch_one, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers or os.cpu_count(), initializer=_load_batch,
+                                 initargs=(args.csv, args.pred_glob)) as pool:
+            seconds = list(pool.map(_batch_one, tasks))
+    total = time.perf_counter() - started
+    log.info("reports built=%d skipped=%d seconds=%.2f mean_report_seconds=%.2f version=%s dir=%s",
+             len(todo), len(selections(snap, args.models)) - len(todo), total,
+             sum(seconds) / len(seconds) if seconds else 0.0, data_version(snap), args.out_dir)
+
+
+if __name__ == "__main__":
+    main()
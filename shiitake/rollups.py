@@ -0,0 +1,197 @@
+# 월별/일별 단가 집계 테이블.
+# 데이터 갱신 시 (도, 등급, 유통구분, 기간) 별 합계·건수·최소·최대·평균을 한 번만 만들어 두고,
+# 차트는 기간 범위를 잘라 읽기만 한다 (달 중간에서 시작·끝나는 월별 조회는 경계 달만 일별 집계로 다시 계산: clip_months).
+# 행이 덧붙여지면 새 행이 닿는 (키, 기간) 만 기존 값과 더해(합계·건수는 합, 최소·최대는 비교) 델타 세그먼트로 쌓고,
+# 조회 시 뒤쪽 세그먼트 값이 앞쪽을 덮는다. 세그먼트가 많아지면 하나로 합친다.
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from shiitake.index import KEY_COLUMNS, compact_segments, concat_groups, group_offsets, slice_bounds
+
+ROLLUP_COLUMNS = KEY_COLUMNS + ["기간", "합계", "건수", "최소", "최대", "평균"]
+MAX_SEGMENTS = 16
+
+
+@dataclass(frozen=True)
+class RollupSegment:
+    df: pd.DataFrame
+    periods: np.ndarray
+    offsets: dict
+
+
+@dataclass(frozen=True)
+class Rollup:
+    freq: str
+    segments: tuple
+
+    def select(self, region, grade, dist, start=None, end=None):
+        # 월별 집계는 start 가 속한 달부터 포함한다.
+        if start is not None:
+            start = period_start(pd.Series([pd.Timestamp(start)]), self.freq).iloc[0]
+        parts = []
+        for seg in self.segments:
+            bounds = slice_bounds(seg.offsets, seg.periods, (region, grade, dist), start, end)
+            if bounds is not None and bounds[1] > bounds[0]:
+                parts.append(seg.df.iloc[bounds[0]:bounds[1]])
+        if not parts:
+            return self.segments[0].df.iloc[0:0]
+        if len(parts) == 1:
+            return parts[0]
+        # 세그먼트마다 도 category 가 다를 수 있으므로 (새 도가 덧붙은 경우) 하나로 맞춰 이어 붙인다.
+        return (
+            concat_groups(parts)
+            .drop_duplicates(subset="기간", keep="last")
+            .sort_values("기간", kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def rows(self, keys, start=None, end=None):
+        # 여러 (도, 등급, 유통구분) 의 기간 구간을 인덱스로 모아 한 프레임(키·기간순)으로 돌려준다.
+        # 전체 테이블을 훑지 않으므로 비용은 결과 행 수에 비례한다.
+        if start is not None:
+            start = period_start(pd.Series([pd.Timestamp(start)]), self.freq).iloc[0]
+        frames = []
+        for seg in self.segments:
+            bounds = [slice_bounds(seg.offsets, seg.periods, key, start, end) for key in keys]
+            bounds = [b for b in bounds if b is not None and b[1] > b[0]]
+            if bounds:
+                frames.append(seg.df.take(np.concatenate([np.arange(lo, hi) for lo, hi in bounds])))
+        if not frames:
+            return self.segments[0].df.iloc[0:0]
+        return (
+            concat_groups(frames)
+            .drop_duplicates(subset=KEY_COLUMNS + ["기간"], keep="last")
+            .sort_values(KEY_COLUMNS + ["기간"], kind="stable")
+            .reset_index(drop=True)
+        )
+
+    def table(self):
+        # 세그먼트를 합친 전체 집계 테이블 (키·기간순)
+        if len(self.segments) == 1:
+            return self.segments[0].df
+        return _merge_segments(self.segments)
+
+    def extend(self, df):
+        # 정제된 새 행(df)으로 영향을 받는 (키, 기간) 만 다시 계산해 새 Rollup 을 돌려준다.
+        delta = aggregate(df, self.freq)
+        if delta.empty:
+            return self
+        merged = _combine(self._previous(delta) + [delta])
+        segments = self.segments + (_segment(merged),)
+        if len(segments) > MAX_SEGMENTS:
+            segments = compact_segments(segments, lambda segs: _segment(_merge_segments(segs)), lambda seg: len(seg.df))
+        return Rollup(self.freq, segments)
+
+    def _previous(self, delta):
+        # 새 행이 닿는 키마다 기존 세그먼트에서 같은 기간 범위의 행 위치만 모아 세그먼트당 한 번에 꺼낸다.
+        # 뒤쪽 세그먼트가 앞쪽을 덮으므로 겹치는 (키, 기간) 은 마지막 것만 남긴다.
+        spans = delta.groupby(KEY_COLUMNS, observed=True, sort=False)["기간"].agg(["min", "max"])
+        frames = []
+        for seg in self.segments:
+            rows = [
+                np.arange(*bounds)
+                for key, lo, hi in spans.itertuples(name=None)
+                if (bounds := slice_bounds(seg.offsets, seg.periods, key, lo, hi)) is not None
+            ]
+            if rows:
+                frames.append(seg.df.iloc[np.concatenate(rows)])
+        if len(frames) > 1:
+            frames = [concat_groups(frames).drop_duplicates(subset=KEY_COLUMNS + ["기간"], keep="last")]
+        return [f for f in frames if not f.empty]
+
+
+def period_start(dates, freq):
+    if freq == "M":
+        return dates.dt.to_period("M").dt.to_timestamp()
+    return dates.dt.normalize()
+
+
+def aggregate(df, freq):
+    # 정렬·정제된 단가 프레임(prices.clean_prices 결과)을 기간별로 집계한다.
+    keys = [df[c] for c in KEY_COLUMNS] + [period_start(df["조사일"], freq).rename("기간")]
+    out = (
+        df["당일"].astype("float64")
+        .groupby(keys, observed=True, sort=True)
+        .agg(합계="sum", 건수="count", 최소="min", 최대="max")
+        .reset_index()
+    )
+    out["평균"] = out["합계"] / out["건수"]
+    return out[ROLLUP_COLUMNS]
+
+
+def _combine(frames):
+    # 같은 (키, 기간) 의 부분 집계를 더한다.
+    df = concat_groups(frames)
+    out = (
+        df.groupby(KEY_COLUMNS + ["기간"], observed=True, sort=True)
+        .agg(합계=("합계", "sum"), 건수=("건수", "sum"), 최소=("최소", "min"), 최대=("최대", "max"))
+        .reset_index()
+    )
+    out["평균"] = out["합계"] / out["건수"]
+    return out[ROLLUP_COLUMNS]
+
+
+def wide_table(df, keys, value="평균"):
+    # 키·기간별 행을 (기간 × 키) 넓은 표로. 열 순서는 keys 순서를 따른다.
+    if df.empty:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="기간"), dtype="float64")
+    wide = df.assign(도=df["도"].astype(str)).pivot(index="기간", columns=KEY_COLUMNS, values=value)
+    order = [key for key in keys if key in wide.columns]
+    return wide.reindex(columns=pd.MultiIndex.from_tuples(order, names=KEY_COLUMNS)).sort_index().astype("float64")
+
+
+def _edge_spans(start, end):
+    # [start, end] 가 달의 일부만 덮는 첫/마지막 달의 (달 시작, 구간 시작, 구간 끝) 목록
+    start = None if start is None else pd.Timestamp(start).normalize()
+    end = None if end is None else pd.Timestamp(end).normalize()
+    spans = []
+    if start is not None and start.day != 1:
+        month_end = start + pd.offsets.MonthEnd(0)
+        spans.append((start.replace(day=1), start, month_end if end is None else min(month_end, end)))
+    if end is not None and not end.is_month_end:
+        month = end.replace(day=1)
+        if not spans or spans[0][0] != month:
+            spans.append((month, month if start is None else max(month, start), end))
+    return spans
+
+
+def clip_months(monthly_rows, daily, keys, start=None, end=None):
+    # 월별 집계 행에서 [start, end] 가 일부만 덮는 첫/마지막 달을 일별 집계로 다시 계산해 바꾼다.
+    # 월별 집계는 달 단위로만 자를 수 있으므로, 일 단위 시작·종료일이면 경계 달만 원본 행 기준 값으로 맞춘다.
+    spans = _edge_spans(start, end)
+    if not spans:
+        return monthly_rows
+    frames = [
+        rows.assign(기간=month)
+        for month, lo, hi in spans
+        for rows in [daily.rows(keys, lo, hi)]
+        if not rows.empty
+    ]
+    kept = monthly_rows[~monthly_rows["기간"].isin([month for month, _, _ in spans])]
+    if not frames:
+        return kept.reset_index(drop=True)
+    return (
+        concat_groups([kept, _combine(frames)])
+        .sort_values(KEY_COLUMNS + ["기간"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _merge_segments(segments):
+    # 뒤쪽 세그먼트가 앞쪽의 같은 (키, 기간) 을 덮는다.
+    df = concat_groups([seg.df for seg in segments])
+    return (
+        df.drop_duplicates(subset=KEY_COLUMNS + ["기간"], keep="last")
+        .sort_values(KEY_COLUMNS + ["기간"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _segment(df):
+    return RollupSegment(df, df["기간"].to_numpy(), group_offsets(df))
+
+
+def build_rollup(df, freq):
+    return Rollup(freq, (_segment(aggregate(df, freq)),))
@@ -0,0 +1,135 @@
+# 백그라운드 데이터 갱신.
+# 워커 스레드가 CSV_MACRO, 예측 파일들(PRED_GLOB), 소셜 집계(SOCIAL_STORE)의 mtime·크기를 주기적으로 확인하고,
+# 바뀐 원본만 요청 경로 밖에서 다시 만든 뒤(final.csv 에 행이 덧붙여진 경우는 새 행만) 새 Snapshot 으로 참조를 한 번에 바꾼다.
+# Snapshot 은 불변이므로 rerun 은 시작할 때 current() 를 한 번 읽어 끝까지 같은 객체를 쓴다.
+# 갱신 도중이거나 실패해도 이전 Snapshot 이 그대로 보인다.
+import glob
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+
+from shiitake.indicators import refresh_indicator_data
+from shiitake.predictions import load_forecasts, prepare_predictions
+from shiitake.prices import refresh_price_data
+from shiitake.social import load_social
+
+log = logging.getLogger(__name__)
+
+POLL_SECONDS = 2.0
+# 이 시간보다 최근에 수정된 파일은 아직 쓰는 중일 수 있으므로 다음 확인 때 읽는다.
+SETTLE_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    prices: object = None
+    indicators: object = None
+    predictions: object = None
+    social: object = None
+    # 원본별 ((경로, mtime_ns, size), ...). 아직 못 읽었으면 None
+    signatures: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    created: float = 0.0
+
+
+def _signature(paths):
+    # 파일 목록 전체의 서명. 하나도 없거나 읽을 수 없으면 None
+    try:
+        sig = tuple((p, st.st_mtime_ns, st.st_size) for p in paths for st in [os.stat(p)])
+    except OSError:
+        return None
+    return sig or None
+
+
+def _settled(signature):
+    newest = max(mtime for _, mtime, _ in signature)
+    return time.time() - newest / 1e9 >= SETTLE_SECONDS
+
+
+def _build_macro(paths, snap):
+    prices = refresh_price_data(paths[0], snap.prices)
+    indicators = refresh_indicator_data(paths[0], snap.indicators)
+    return {"prices": prices, "indicators": indicators}
+
+
+def _build_pred(paths, snap):
+    version = hashlib.sha1(repr(_signature(paths)).encode()).hexdigest()[:16]
+    return {"predictions": prepare_predictions(load_forecasts(paths), version)}
+
+
+def _build_social(paths, snap):
+    return {"social": load_social(paths[0])}
+
+
+class Refresher:
+    def __init__(self, macro_path, pred_glob, social_path=None, interval=POLL_SECONDS):
+        # 원본 이름 -> (파일 목록을 돌려주는 함수, 빌드 함수). macro_path 가 None 이면 단가·지표는 읽지 않는다.
+        self.sources = {}
+        if macro_path is not None:
+            self.sources["macro"] = (lambda: [macro_path], _build_macro)
+        self.sources["pred"] = (lambda: sorted(glob.glob(pred_glob)), _build_pred)
+        if social_path is not None:
+            self.sources["social"] = (lambda: [social_path], _build_social)
+        self.interval = interval
+        self._snapshot = Snapshot()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self):
+        # 참조 하나를 읽기만 하므로 잠금이 필요 없다.
+        return self._snapshot
+
+    def refresh(self, wait_settle=True):
+        # 바뀐 원본만 다시 만들어 새 Snapshot 을 게시한다. 바뀐 것이 없으면 그대로 둔다.
+        with self._lock:
+            snap = self._snapshot
+            updates, rebuilt = {}, []
+            signatures, errors = dict(snap.signatures), dict(snap.errors)
+            for name, (list_paths, build) in self.sources.items():
+                paths = list_paths()
+                sig = _signature(paths)
+                if sig is None:
+                    errors[name] = f"파일 없음: {', '.join(paths) or name}"
+                    signatures[name] = None
+                    continue
+                # 실패한 원본도 파일이 다시 바뀔 때까지는 재시도하지 않는다.
+                if sig == snap.signatures.get(name) or (wait_settle and not _settled(sig)):
+                    continue
+                try:
+                    updates.update(build(paths, snap))
+                except (OSError, ValueError, KeyError) as e:
+                    # 이전 데이터는 유지하고 오류만 기록
+                    log.warning("snapshot refresh failed source=%s error=%s", name, e)
+                    errors[name] = str(e)
+                    signatures[name] = sig
+                    continue
+                signatures[name] = sig
+                errors.pop(name, None)
+                rebuilt.append(name)
+            if not updates and errors == snap.errors and signatures == snap.signatures:
+                return snap
+            self._snapshot = replace(snap, **updates, signatures=signatures, errors=errors, created=time.time())
+            log.info("snapshot published rebuilt=%s errors=%s", ",".join(rebuilt) or "-", ",".join(errors) or "-")
+            return self._snapshot
+
+    def start(self):
+        # 첫 Snapshot 은 바로 만들고, 이후 갱신은 데몬 스레드에서 한다.
+        if self._thread is None:
+            self.refresh(wait_settle=False)
+            self._thread = threading.Thread(target=self._run, name="shiitake-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                log.exception("snapshot refresh crashed")
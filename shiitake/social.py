@@ -0,0 +1,260 @@
+# 소셜 언급 집계 저장소.
+# 원본 내보내기(date, keyword, text, sentiment, topic, age 컬럼의 CSV, 수백만 행)를 오프라인에서 CHUNK_ROWS 행씩 읽어
+# 연도·계절·감성·토픽·연령대·용도별 건수와 키워드 상위 빈도(shiitake.keywords)만 누적하고,
+# 작은 집계 표를 JSON 하나(SOCIAL_STORE)로 쓴다. 파일(샤드)별로 프로세스 풀에 나눠 읽는다.
+# 앱은 이 집계 파일만 읽고 (없으면 DEFAULT_TABLES), 만든 Plotly 그림은 데이터 버전별 JSON 으로 캐시한다.
+#   python -m shiitake.social exports/*.csv --out social_aggregates.json
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from shiitake.config import SOCIAL_EXPORTS, SOCIAL_STORE
+from shiitake.ingest import SAMPLE_SIZE, sniff_encoding
+from shiitake.keywords import TOP_K, SpaceSaving, chunk_counts, keyword_table, summarize
+from shiitake.memory import SizedLRU
+
+log = logging.getLogger(__name__)
+
+# 원문(text)은 토큰으로 펼치면 수십 배가 되므로 청크를 작게 잡는다.
+CHUNK_ROWS = 100_000
+# text (게시글 원문) 가 있으면 키워드는 원문에서 세고, 없으면 keyword 값을 센다.
+EXPORT_COLUMNS = ["date", "keyword", "text", "sentiment", "topic", "age"]
+SEASONS = {3: "봄", 4: "봄", 5: "봄", 6: "여름", 7: "여름", 8: "여름",
+           9: "가을", 10: "가을", 11: "가을", 12: "겨울", 1: "겨울", 2: "겨울"}
+SEASON_ORDER = ["봄", "여름", "가을", "겨울"]
+SENTIMENT_ORDER = ["긍정", "중립", "부정"]
+TOPIC_ORDER = ["요리/레시피", "건강/효능", "생산/재배", "유통/가격"]
+AGE_ORDER = ["20~30대", "40~50대", "60대+"]
+# 키워드 -> 용도, 용도 -> 분류 (표 순서). 분류별 비율의 분모는 해당 토픽 언급 수
+USAGE_KEYWORDS = {
+    "국물": "국물/육수", "육수": "국물/육수", "볶음": "볶음",
+    "채식": "채소대체", "비건": "채소대체", "고기대체": "채소대체", "샐러드": "샐러드",
+    "면역": "면역강화", "면역력": "면역강화", "콜레스테롤": "콜레스테롤", "비타민D": "비타민D",
+    "다이어트": "체중관리", "체중": "체중관리",
+}
+USAGE_CATEGORIES = {
+    "국물/육수": "요리", "볶음": "요리", "채소대체": "요리", "샐러드": "요리",
+    "면역강화": "건강", "콜레스테롤": "건강", "비타민D": "건강", "체중관리": "건강",
+}
+USAGE_TOPIC = {"요리": "요리/레시피", "건강": "건강/효능"}
+
+# 집계 파일이 없을 때 보여 줄 기본 표 (페이지에 하드코딩되어 있던 값)
+DEFAULT_TABLES = {
+    "yearly": {"Year": ["2019", "2020", "2021", "2022", "2023"], "Mentions": [31500, 43800, 45200, 48900, 52600]},
+    "seasonal": {"Season": SEASON_ORDER, "Percentage": [26, 17, 29, 28]},
+    "sentiment": {"Sentiment": SENTIMENT_ORDER, "Percentage": [76, 16, 8], "Count": [169100, 35600, 17800]},
+    "topic": {"Topic": TOPIC_ORDER, "Percentage": [38, 32, 18, 12]},
+    "age": {"Age_Group": AGE_ORDER, "Percentage": [31, 42, 27], "Count": [69000, 93450, 60050]},
+    "usage": {
+        "Usage": list(USAGE_CATEGORIES),
+        "Percentage": [27, 25, 18, 8, 38, 22, 18, 12],
+        "Category": list(USAGE_CATEGORIES.values()),
+    },
+    "keywords": {
+        "Keyword": ["표고버섯", "면역력", "볶음", "육수", "비타민D", "채식", "콜레스테롤", "재배", "베타글루칸", "표고전"],
+        "Count": [1000, 450, 400, 350, 180, 170, 160, 150, 140, 130],
+        "Error": [0] * 10,
+    },
+}
+# 예전 집계 파일에 없을 수 있는 표 (없으면 기본 표)
+OPTIONAL_TABLES = ("keywords",)
+DEFAULT_TOTAL = 222000
+
+_figures = SizedLRU("social_figures", max_entries=64, max_bytes=16 * 1024 * 1024, sizeof=len)
+
+
+@dataclass(frozen=True)
+class SocialData:
+    version: str
+    total: int
+    # 표 이름 -> DataFrame (DEFAULT_TABLES 와 같은 컬럼)
+    tables: dict
+
+    @property
+    def years(self):
+        yearly = self.tables["yearly"]
+        return (yearly["Year"].iloc[0], yearly["Year"].iloc[-1]) if len(yearly) else ("-", "-")
+
+    @property
+    def growth(self):
+        # 첫 해 대비 마지막 해 언급량 증가율 (%)
+        mentions = self.tables["yearly"]["Mentions"]
+        return round((mentions.iloc[-1] / mentions.iloc[0] - 1) * 100) if len(mentions) > 1 and mentions.iloc[0] else 0
+
+
+def _frames(tables):
+    return {name: pd.DataFrame(columns) for name, columns in tables.items()}
+
+
+def default_social():
+    return SocialData("default", DEFAULT_TOTAL, _frames(DEFAULT_TABLES))
+
+
+def load_social(path):
+    with open(path, encoding="utf-8") as f:
+        store = json.load(f)
+    missing = set(DEFAULT_TABLES) - set(store["tables"]) - set(OPTIONAL_TABLES)
+    if missing:
+        raise KeyError(f"집계 표 없음: {', '.join(sorted(missing))}")
+    tables = {name: DEFAULT_TABLES[name] for name in OPTIONAL_TABLES} | store["tables"]
+    return SocialData(store["version"], int(store["total"]), _frames(tables))
+
+
+def _age_group(age):
+    # "20대", "35", "60대 이상" 등 -> 연령대 (숫자가 없으면 NaN)
+    years = pd.to_numeric(age.astype("string").str.extract(r"(\d+)", expand=False), errors="coerce")
+    return pd.cut(years, [0, 40, 60, 200], right=False, labels=AGE_ORDER)
+
+
+def _count(counts, name, values, counted=False):
+    vc = values if counted else values.value_counts()
+    counts[name] = counts[name].add(vc, fill_value=0) if name in counts else vc
+
+
+def read_chunks(paths, chunk_rows=CHUNK_ROWS):
+    # 파일마다 인코딩을 판별하고 필요한 컬럼만 chunk_rows 행씩 돌려준다.
+    for path in paths:
+        with open(path, "rb") as f:
+            sample = f.read(SAMPLE_SIZE)
+        encoding = sniff_encoding(sample, complete=len(sample) < SAMPLE_SIZE)
+        yield from pd.read_csv(path, encoding=encoding, usecols=lambda c: c in EXPORT_COLUMNS,
+                               dtype="string", chunksize=chunk_rows)
+
+
+def _scan(task):
+    # 파일(샤드) 하나: 청크 -> 원본 값 건수 누적 -> 키워드 토큰 건수 -> Space-Saving 요약 (프로세스 풀에서 실행)
+    path, chunk_rows, top_k = task
+    counts, rows = {}, 0
+
+    def tally(chunks):
+        nonlocal rows
+        for chunk in chunks:
+            rows += len(chunk)
+            for column in ("date", "sentiment", "topic", "age"):
+                if column in chunk:
+                    _count(counts, column, chunk[column].str.strip())
+            if "keyword" in chunk:
+                _count(counts, "usage", chunk["keyword"].str.strip().map(USAGE_KEYWORDS).dropna())
+            yield chunk
+
+    summary = summarize(chunk_counts(tally(read_chunks([path], chunk_rows))), top_k)
+    return counts, rows, summary
+
+
+def aggregate_exports(paths, chunk_rows=CHUNK_ROWS, workers=None, top_k=TOP_K):
+    # 파일마다 건수와 키워드 요약을 만들어 합친다. 메모리는 프로세스마다 청크 하나와 서로 다른 값 수로 제한된다.
+    # 날짜 파싱·연령대 구분은 합친 뒤 서로 다른 값에만 한 번 적용한다.
+    tasks = [(path, chunk_rows, top_k) for path in paths]
+    if workers == 1 or len(tasks) < 2:
+        results = list(map(_scan, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count(), len(tasks))) as pool:
+            results = list(pool.map(_scan, tasks))
+    counts, rows, summary = {}, 0, SpaceSaving.empty(top_k)
+    for part, part_rows, part_summary in results:
+        for name, values in part.items():
+            _count(counts, name, values, counted=True)
+        rows += part_rows
+        summary = summary.merge(part_summary)
+
+    empty = pd.Series(dtype="int64")
+    dates = counts.pop("date", empty)
+    parsed = pd.to_datetime(pd.Series(dates.index, dtype="string"), errors="coerce")
+    by_date = pd.Series(dates.to_numpy(), index=parsed).loc[lambda c: c.index.notna()]
+    counts["yearly"] = by_date.groupby(by_date.index.year.astype(str)).sum()
+    counts["seasonal"] = by_date.groupby(by_date.index.month.map(SEASONS)).sum()
+    ages = counts.pop("age", empty)
+    counts["age"] = ages.groupby(_age_group(pd.Series(ages.index, index=ages.index)), observed=True).sum()
+    counts["age"].index = counts["age"].index.astype(str)
+    return counts, rows, summary
+
+
+def _percent(counts, order):
+    counts = counts.reindex(order, fill_value=0)
+    total = counts.sum()
+    return counts, (counts / total * 100).round().astype("int64") if total else counts * 0
+
+
+def build_tables(counts):
+    # 누적 건수 -> DEFAULT_TABLES 와 같은 모양의 표 (JSON 으로 쓸 수 있는 list)
+    empty = pd.Series(dtype="float64")
+    yearly = counts.get("yearly", empty).sort_index()
+    seasonal, seasonal_pct = _percent(counts.get("seasonal", empty), SEASON_ORDER)
+    sentiment, sentiment_pct = _percent(counts.get("sentiment", empty), SENTIMENT_ORDER)
+    topic, topic_pct = _percent(counts.get("topic", empty), TOPIC_ORDER)
+    age, age_pct = _percent(counts.get("age", empty), AGE_ORDER)
+    usage = counts.get("usage", empty).reindex(list(USAGE_CATEGORIES), fill_value=0)
+    category = pd.Series(USAGE_CATEGORIES)
+    # 분류별 분모: 해당 토픽 언급 수 (토픽 컬럼이 없으면 그 분류 용도 언급 수의 합)
+    base = category.map(USAGE_TOPIC).map(topic).where(lambda b: b > 0, category.map(usage.groupby(category).sum()))
+    usage_pct = (usage / base.where(base > 0) * 100).fillna(0).round().astype("int64")
+    return {
+        "yearly": {"Year": yearly.index.tolist(), "Mentions": yearly.astype("int64").tolist()},
+        "seasonal": {"Season": SEASON_ORDER, "Percentage": seasonal_pct.tolist()},
+        "sentiment": {"Sentiment": SENTIMENT_ORDER, "Percentage": sentiment_pct.tolist(),
+                      "Count": sentiment.astype("int64").tolist()},
+        "topic": {"Topic": TOPIC_ORDER, "Percentage": topic_pct.tolist()},
+        "age": {"Age_Group": AGE_ORDER, "Percentage": age_pct.tolist(), "Count": age.astype("int64").tolist()},
+        "usage": {"Usage": list(USAGE_CATEGORIES), "Percentage": usage_pct.tolist(),
+                  "Category": list(USAGE_CATEGORIES.values())},
+    }
+
+
+def write_store(tables, total, sources, path):
+    body = json.dumps({"total": int(total), "tables": tables}, ensure_ascii=False, sort_keys=True)
+    store = {
+        "version": hashlib.sha256(body.encode()).hexdigest()[:16],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sources": sources,
+        "total": int(total),
+        "tables": tables,
+    }
+    # 앱의 백그라운드 워커가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체한다.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+    return store
+
+
+def figure_spec(version, name, build):
+    # Plotly 그림 JSON 을 (데이터 버전, 그림 이름) 키로 캐시해 rerun 마다 그림을 다시 만들지 않는다.
+    key = (version, name)
+    spec = _figures.get(key)
+    if spec is None:
+        spec = _figures.put(key, build().to_json())
+    return json.loads(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="소셜 언급 원본을 청크 단위로 읽어 집계 표(JSON)를 만든다")
+    parser.add_argument("paths", nargs="*", help=f"원본 CSV (기본: {SOCIAL_EXPORTS})")
+    parser.add_argument("--out", default=SOCIAL_STORE)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수, 파일 하나당 한 프로세스까지)")
+    parser.add_argument("--top-k", type=int, default=TOP_K, help="키워드 요약 크기")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    paths = sorted(args.paths or glob.glob(SOCIAL_EXPORTS))
+    if not paths:
+        parser.error("집계할 원본 CSV 가 없습니다.")
+    started = time.perf_counter()
+    counts, rows, summary = aggregate_exports(paths, args.chunk_rows, args.workers, args.top_k)
+    tables = build_tables(counts) | {"keywords": keyword_table(summary)}
+    store = write_store(tables, rows, [os.path.basename(p) for p in paths], args.out)
+    seconds = time.perf_counter() - started
+    log.info("social aggregate files=%d rows=%d seconds=%.2f rows_per_sec=%.0f version=%s path=%s",
+             len(paths), rows, seconds, rows / seconds if seconds else 0.0, store["version"], args.out)
+
+
+if __name__ == "__main__":
+    main()
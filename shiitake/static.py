@@ -0,0 +1,261 @@
+# 공개용 정적 사이트 빌드.
+# 구매자·비회원에게 보여줄 읽기 전용 화면(소셜 빅데이터 분석, 등급·유통구분별 예측 단가 표)을
+# 앱과 같은 데이터 계층(Refresher 가 만드는 Snapshot)과 같은 그림 정의(shiitake.figures)로 HTML/JSON 파일로 쓴다.
+# Plotly 그림은 페이지 안에 JSON 으로 들어가고 plotly.js 는 사이트에 한 번만 복사하므로
+# 아무 정적 파일 서버(또는 CDN)로 제공할 수 있고, 방문자마다 드는 서버 CPU·웹소켓 세션이 없다.
+# 데이터 버전이 manifest.json 과 같으면 다시 쓰지 않는다. 파일은 임시 파일에 쓴 뒤 교체하고 manifest 를 마지막에 쓴다.
+#   python -m shiitake.static --out site
+import argparse
+import hashlib
+import html
+import json
+import logging
+import os
+import time
+
+import plotly
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from shiitake.config import PRED_GLOB, SOCIAL_STORE, STATIC_DIR
+from shiitake.figures import SOCIAL_FIGURES, forecast_figure
+from shiitake.keywords import cloud_html, keyword_tiers
+from shiitake.predictions import BEST, DIST_LABELS, GAP_FORMATS, GRADE_LABELS, PRICE_FORMATS, styled_html
+from shiitake.social import default_social
+from shiitake.theme import APP_CSS
+
+log = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+PLOTLY_JS = "plotly.min.js"
+PLOTLY_CONFIG = {"displaylogo": False, "responsive": True}
+SOCIAL_TITLES = {
+    "yearly": "📈 연도별 언급량 추이",
+    "seasonal": "📅 계절별 언급 분포",
+    "sentiment": "😊 감성 분석",
+    "topic": "📊 토픽 모델링",
+    "age": "👥 연령대별 관심도",
+    "usage": "🍳 용도별 활용 분석",
+}
+# 앱 CSS 에 더해 정적 페이지에만 필요한 배치
+STATIC_CSS = """
+<style>
+    body { background-color: #f8f5f0; margin: 0; padding: 1rem 2rem; color: #333; }
+    .static-nav { display: flex; gap: 1.5rem; margin-bottom: 1.5rem; font-weight: 700; }
+    .static-nav a { color: #8B4513; text-decoration: none; }
+    .grid { display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1.5rem; }
+    .grid-2 { display: grid; grid-template-columns: minmax(0, 1fr) minmax(0, 2fr); gap: 1.5rem; align-items: start; }
+    .card { background: white; border-radius: 15px; box-shadow: 0 10px 40px rgba(139, 69, 19, 0.15); padding: 1rem; margin-bottom: 1.5rem; overflow-x: auto; }
+    table { border-collapse: collapse; width: 100%; font-size: 0.95rem; }
+    th, td { border: 1px solid #e5d9cc; padding: 0.35rem 0.6rem; text-align: right; }
+    th { background: #8B4513; color: white; }
+    .links td, .links th { text-align: center; }
+    footer { text-align: center; color: #666; padding: 2rem 0; font-size: 0.9rem; }
+    @media (max-width: 900px) { .grid, .grid-2 { grid-template-columns: 1fr; } }
+</style>
+"""
+PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="{root}{plotly_js}"></script>
+{css}
+</head>
+<body>
+<nav class="static-nav">
+<a href="{root}index.html">🏠 홈</a>
+<a href="{root}social.html">📊 소셜 빅데이터 분석</a>
+<a href="{root}forecast/index.html">🔮 예측 단가</a>
+</nav>
+{body}
+<footer>🍄 표고버섯 종합 대시보드 · 읽기 전용 공개 화면 · 데이터 버전 {version}</footer>
+</body>
+</html>
+"""
+
+
+def data_version(snapshot, social, models=(BEST,)):
+    parts = (social.version, snapshot.predictions.version if snapshot.predictions else "-", plotly.__version__, *models)
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+
+def _page(title, body, version, root=""):
+    return PAGE.format(title=html.escape(title), root=root, plotly_js=PLOTLY_JS, css=APP_CSS + STATIC_CSS,
+                       body=body, version=version)
+
+
+def _figure(fig, div_id):
+    return pio.to_html(fig, include_plotlyjs=False, full_html=False, div_id=div_id, config=PLOTLY_CONFIG)
+
+
+def _records(df):
+    # NaN 은 null 로
+    return json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+def _header(title, subtitle):
+    return f'<div class="main-header"><h1>{title}</h1><p><strong>{subtitle}</strong></p></div>'
+
+
+def social_pages(social, version):
+    # {상대 경로: 내용}
+    tables = social.tables
+    first_year, last_year = social.years
+    positive = tables["sentiment"].set_index("Sentiment").loc["긍정"]
+    top_age = tables["age"].loc[tables["age"]["Percentage"].idxmax()]
+    cards = [
+        f'<div class="section-title">🔍 주요 키워드</div>{cloud_html(keyword_tiers(tables["keywords"]))}',
+    ] + [
+        f'<div class="section-title">{SOCIAL_TITLES[name]}</div>{_figure(build(tables[name]), f"fig-{name}")}'
+        for name, build in SOCIAL_FIGURES.items()
+    ]
+    metrics = [
+        (f"성장률: {social.growth}%", f"{len(tables['yearly'])}년간 언급량 증가"),
+        (f"긍정도: {positive['Percentage']}%", f"긍정 ({positive['Count']:,}회)"),
+        (f"핵심층: {top_age['Percentage']}%", f"{top_age['Age_Group']} 관심도 최고"),
+    ]
+    body = (
+        _header("🍄 표고버섯 소셜 빅데이터 분석",
+                f"{first_year}-{last_year}년 | 총 언급량: {social.total:,}회 | {social.growth}% 증가 추세")
+        + '<div class="grid">' + "".join(f'<div class="card">{c}</div>' for c in cards) + "</div>"
+        + '<div class="section-title">💡 핵심 인사이트</div><div class="grid">'
+        + "".join(f'<div class="metric-card"><div class="metric-number" style="font-size: 1.5rem;">{html.escape(n)}</div>'
+                  f'<div class="metric-label">{html.escape(label)}</div></div>' for n, label in metrics)
+        + "</div>"
+    )
+    data = {"version": social.version, "total": social.total,
+            "tables": {name: _records(df) for name, df in tables.items()}}
+    return {
+        "social.html": _page("표고버섯 소셜 빅데이터 분석", body, version),
+        "data/social.json": json.dumps(data, ensure_ascii=False),
+    }
+
+
+def _pair_label(grade, dist):
+    return f"등급 {GRADE_LABELS.get(grade, grade)} · 유통 {DIST_LABELS.get(dist, dist)}"
+
+
+def forecast_pages(pred, version, models=(BEST,)):
+    # (등급, 유통구분) 마다 HTML 한 쪽과 JSON 하나. 예측 기간·모델별 표와 막대 그림을 차례로 넣는다.
+    pairs = {}
+    ordered = sorted(pred.tables.items(), key=lambda kv: (kv[0][0], kv[0][1], str(kv[0][2]), kv[0][3]))
+    for (grade, dist, model, horizon), table in ordered:
+        if model in models:
+            pairs.setdefault((grade, dist), []).append((model, horizon, table))
+    files = {}
+    for (grade, dist), sections in pairs.items():
+        blocks, data = [], []
+        for model, horizon, table in sorted(sections, key=lambda s: (s[1], models.index(s[0]))):
+            name = "RMSE 최저 (도별 자동)" if model == BEST else model
+            blocks.append(
+                f'<div class="section-title">⏳ {horizon}개월 후 · 🤖 {html.escape(name)}</div>'
+                f'<div class="grid-2"><div class="card">{styled_html(table.prices, PRICE_FORMATS)}</div>'
+                f'<div class="card">{_figure(forecast_figure(table.prices), f"fig-{horizon}-{model}")}</div></div>'
+                f'<div class="card"><b>📊 도별 예측 vs 실제 & 갭 분석</b>{styled_html(table.gaps, GAP_FORMATS, table.gap_css)}</div>'
+            )
+            data.append({"horizon": horizon, "model": model,
+                         "prices": _records(table.prices.reset_index()), "gaps": _records(table.gaps.reset_index())})
+        label = _pair_label(grade, dist)
+        body = _header("🔮 미래 단가 예측", html.escape(label)) + "".join(blocks)
+        files[f"forecast/{grade}_{dist}.html"] = _page(f"미래 단가 예측 — {label}", body, version, root="../")
+        files[f"data/forecast_{grade}_{dist}.json"] = json.dumps(
+            {"grade": grade, "dist": dist, "version": pred.version, "sections": data}, ensure_ascii=False)
+
+    rows = "".join(
+        f"<tr><th>{html.escape(GRADE_LABELS.get(g, str(g)))}</th>"
+        + "".join(f'<td><a href="{g}_{d}.html">유통 {html.escape(DIST_LABELS.get(d, str(d)))}</a></td>'
+                  if (g, d) in pairs else "<td>-</td>" for d in pred.dists)
+        + "</tr>"
+        for g in pred.grades
+    )
+    index = (_header("🔮 미래 단가 예측", "등급 · 유통구분을 선택하세요")
+             + '<div class="card"><table class="links"><tr><th>등급</th>'
+             + "".join(f"<th>유통 {html.escape(DIST_LABELS.get(d, str(d)))}</th>" for d in pred.dists)
+             + f"</tr>{rows}</table></div>")
+    files["forecast/index.html"] = _page("미래 단가 예측", index, version, root="../")
+    return files
+
+
+def site_pages(snapshot, social, models=(BEST,)):
+    version = data_version(snapshot, social, models)
+    files = social_pages(social, version)
+    links = ['<li><a href="social.html">📊 소셜 빅데이터 분석</a></li>']
+    if snapshot.predictions is not None:
+        files.update(forecast_pages(snapshot.predictions, version, tuple(models)))
+        links.append('<li><a href="forecast/index.html">🔮 등급 · 유통구분별 예측 단가</a></li>')
+    body = (_header("🍄 표고버섯 종합 대시보드", "가격·트렌드·예측·소셜데이터 분석 (읽기 전용)")
+            + f'<div class="card big-feature"><ul>{"".join(links)}</ul></div>')
+    files["index.html"] = _page("표고버섯 종합 대시보드", body, version)
+    return version, files
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_site(snapshot, social, out_dir=STATIC_DIR, models=(BEST,), force=False):
+    # 바뀐 것이 없으면 None, 아니면 새 manifest
+    previous = _manifest(out_dir)
+    if not force and previous.get("version") == data_version(snapshot, social, models) and all(
+            os.path.exists(os.path.join(out_dir, name)) for name in previous.get("files", [])):
+        return None
+    version, files = site_pages(snapshot, social, models)
+    if force or previous.get("plotly") != plotly.__version__ or not os.path.exists(os.path.join(out_dir, PLOTLY_JS)):
+        _write(os.path.join(out_dir, PLOTLY_JS), get_plotlyjs())
+    for name, data in files.items():
+        _write(os.path.join(out_dir, name), data)
+    # 이전 빌드에만 있던 페이지 (없어진 등급·유통구분 등) 는 지운다.
+    for name in set(previous.get("files", [])) - set(files):
+        try:
+            os.remove(os.path.join(out_dir, name))
+        except OSError:
+            pass
+    manifest = {"version": version, "plotly": plotly.__version__, "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "files": sorted(files)}
+    _write(os.path.join(out_dir, MANIFEST), json.dumps(manifest, ensure_ascii=False, indent=1))
+    return manifest
+
+
+def main():
+    from shiitake.snapshot import Refresher
+
+    parser = argparse.ArgumentParser(description="공개용 읽기 전용 화면을 정적 HTML/JSON 으로 만든다")
+    parser.add_argument("--pred-glob", default=PRED_GLOB)
+    parser.add_argument("--social", default=SOCIAL_STORE)
+    parser.add_argument("--models", nargs="+", default=[BEST], help=f"예측 표에 넣을 모델 ({BEST} 이면 도별 RMSE 최저)")
+    parser.add_argument("--out", default=STATIC_DIR)
+    parser.add_argument("--force", action="store_true", help="데이터 버전이 같아도 다시 쓴다")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    started = time.perf_counter()
+    # 단가 원본(final.csv)은 공개 화면에 쓰지 않으므로 읽지 않는다.
+    snap = Refresher(None, args.pred_glob, args.social).refresh(wait_settle=False)
+    if snap.predictions is None:
+        log.warning("static: 예측 파일을 읽지 못해 예측 페이지는 빠집니다 (%s)", snap.errors.get("pred"))
+    manifest = build_site(snap, snap.social or default_social(), args.out, args.models, args.force)
+    seconds = time.perf_counter() - started
+    if manifest is None:
+        log.info("static unchanged seconds=%.2f dir=%s", seconds, args.out)
+        return
+    size = sum(os.path.getsize(os.path.join(args.out, name)) for name in manifest["files"])
+    log.info("static built files=%d bytes=%d seconds=%.2f version=%s dir=%s",
+             len(manifest["files"]), size, seconds, manifest["version"], args.out)
+
+
+if __name__ == "__main__":
+    main()
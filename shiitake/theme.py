@@ -0,0 +1,34 @@
+# 앱 공통 CSS. 정적 빌드(shiitake.static)의 HTML 도 같은 스타일을 쓰므로 streamlit 없이 import 할 수 있게 여기에 둔다.
+APP_CSS = """
+<style>
+    @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700;900&display=swap');
+    * { font-family: 'Noto Sans KR', sans-serif; }
+    .main { background-color: #f8f5f0; }
+    @media (max-width: 600px) {
+        .main-header h1 {font-size: 2rem !important;}
+        .section-title {font-size: 1.1rem !important;}
+        .stRadio > div {flex-direction: column !important;}
+        button {font-size: 1.15rem !important;}
+    }
+    .main-header { background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%); padding: 3rem 2rem; border-radius: 20px; margin-bottom: 2rem; text-align: center; color: white; box-shadow: 0 10px 40px rgba(139, 69, 19, 0.15);}
+    .main-header h1 { font-size: 3rem; font-weight: 900; margin-bottom: 1rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);}
+    .main-header p { font-size: 1.2rem; font-weight: 500; opacity: 0.95;}
+    .metric-card { background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%); padding: 1.5rem; border-radius: 15px; text-align: center; color: white; box-shadow: 0 8px 32px rgba(139, 69, 19, 0.2); margin-bottom: 1rem;}
+    .metric-number { font-size: 2.5rem; font-weight: 900; margin-bottom: 0.5rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.2);}
+    .metric-label { font-size: 1rem; opacity: 0.9; font-weight: 500;}
+    .insight-card { background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%); color: white; padding: 1.5rem; border-radius: 15px; margin: 1rem 0; border-left: 5px solid #FF8C00; box-shadow: 0 8px 32px rgba(139, 69, 19, 0.2);}
+    .wordcloud-container { background: white; padding: 2rem; border-radius: 15px; box-shadow: 0 10px 40px rgba(139, 69, 19, 0.15); margin-bottom: 2rem; text-align: center;}
+    .word-large { font-size: 2.5rem; font-weight: 900; color: #8B4513; background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text; margin: 0.5rem; display: inline-block;}
+    .word-medium { font-size: 1.8rem; font-weight: 700; color: #D2691E; margin: 0.3rem; display: inline-block;}
+    .word-small { font-size: 1.3rem; font-weight: 600; color: #CD853F; margin: 0.2rem; display: inline-block;}
+    .stPlotlyChart { background: white; border-radius: 15px; box-shadow: 0 10px 40px rgba(139, 69, 19, 0.15); padding: 1rem; max-height: 280px; overflow: hidden;}
+    .section-title { font-size: 1.5rem; font-weight: 700; color: #8B4513; margin-bottom: 1rem; padding-bottom: 0.5rem; border-bottom: 3px solid #CD853F;}
+    .sidebar .sidebar-content { background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%); padding: 1rem; border-radius: 15px; margin: 1rem 0;}
+    .stSelectbox>div>div>div { background: white; border-radius: 10px; border: 2px solid #CD853F;}
+    .stDateInput>div>div>input { background: white; border-radius: 10px; border: 2px solid #CD853F;}
+    .stButton>button { background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%); color: white; border-radius: 10px; border: none; font-weight: 600; height: 3em; width: 100%; box-shadow: 0 4px 15px rgba(139, 69, 19, 0.3);}
+    .stButton>button:hover { box-shadow: 0 6px 20px rgba(139, 69, 19, 0.4); transform: translateY(-2px);}
+    .stRadio>div>label { background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%); color: white; padding: 0.5rem 1rem; border-radius: 10px; margin: 0.2rem; font-weight: 600;}
+    .chart-container { background: white; padding: 2rem; border-radius: 15px; box-shadow: 0 10px 40px rgba(139, 69, 19, 0.15); margin-bottom: 2rem;}
+</style>
+"""
@@ -0,0 +1,69 @@
+# 일괄 백테스트: 짧거나 빈 시계열에서도 평가가 끝나는지, 알려진 시계열에서 오차가 맞는지,
+# 길이가 다른 시계열을 함께 쌓아도 시계열별 결과가 따로 평가한 것과 같은지 확인한다.
+import numpy as np
+import pandas as pd
+import pytest
+
+from shiitake import backtest
+from shiitake.backtest import MODELS, evaluate, stack_series
+from shiitake.forecast import RIDGE_LAGS, SEASON
+
+
+def _table(series):
+    # {도: 값 배열} -> 월별 집계 테이블 (모두 같은 달에서 끝난다)
+    frames = []
+    for region, values in series.items():
+        months = pd.period_range(end="2023-12", periods=len(values), freq="M").to_timestamp()
+        frames.append(pd.DataFrame({"도": region, "등급": 1, "유통구분": 1, "기간": months, "평균": values}))
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.mark.parametrize("t", [1, 2, 5, 12, 13, 24, 30])
+def test_short_series(t):
+    stack = stack_series(_table({"A": np.linspace(1000, 2000, t)}))
+    results = evaluate(stack, horizon=12, n_origins=12)
+    assert set(results) == set(MODELS)
+    for pred, rmse, mape, count in results.values():
+        assert pred.shape == rmse.shape == mape.shape == count.shape == (1,)
+        if t <= 12:
+            # 원점 뒤로 12개월을 관측한 칸이 없다
+            assert count[0] == 0
+
+
+def test_empty_table():
+    stack = stack_series(_table({"A": np.arange(3.0)}).iloc[0:0])
+    for pred, rmse, mape, count in evaluate(stack).values():
+        assert len(pred) == len(rmse) == len(mape) == len(count) == 0
+
+
+def test_known_series():
+    t = 60
+    linear = 1000 + 10.0 * np.arange(t)
+    seasonal = 1000 + 100 * np.sin(2 * np.pi * np.arange(t) / SEASON)
+    results = evaluate(stack_series(_table({"L": linear, "S": seasonal})), horizon=12, n_origins=12)
+    pred, rmse, _, count = results["Naive"]
+    # 직선에서 h 개월 앞 naive 오차는 -10h
+    assert rmse[0] == pytest.approx(10 * np.sqrt(np.mean(np.arange(1, 13) ** 2)))
+    assert pred[0] == linear[-1]
+    assert count[0] == 12 * 12
+    assert results["Drift"][1][0] == pytest.approx(0, abs=1e-9)
+    assert results["SeasonalNaive"][1][1] == pytest.approx(0, abs=1e-9)
+    # 12개월 뒤는 같은 달 값
+    assert results["SeasonalNaive"][0][1] == pytest.approx(seasonal[-1])
+
+
+def test_stacked_matches_alone():
+    rng = np.random.default_rng(0)
+    series = {name: 1000 + rng.normal(0, 50, t).cumsum() for name, t in [("A", 80), ("B", 40), ("C", 27)]}
+    together = evaluate(stack_series(_table(series)), horizon=6, n_origins=8)
+    for i, (name, values) in enumerate(series.items()):
+        alone = evaluate(stack_series(_table({name: values})), horizon=6, n_origins=8)
+        for model in MODELS:
+            for got, expected in zip(together[model], alone[model]):
+                np.testing.assert_allclose(got[i], expected[0], rtol=1e-6, equal_nan=True)
+
+
+def test_ridge_lags_too_short():
+    stack = stack_series(_table({"A": np.arange(float(RIDGE_LAGS))}))
+    out = backtest.ridge_lags(stack, np.array([RIDGE_LAGS - 1]), 3)
+    assert out.shape == (1, 1, 3) and np.isnan(out).all()
@@ -0,0 +1,103 @@
+# 컬럼 캐시의 덧붙이기 / 다시 쓰기 / part 합치기 결과가 처음부터 다시 만든 캐시와 같은지 확인한다.
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from shiitake import columnar
+
+REGIONS = ["강원도", "경기도", "경상남도", "전라남도"]
+
+
+def _rows(start, n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "조사일": pd.date_range("2020-01-01", periods=start + n).strftime("%Y-%m-%d")[start:],
+        "도": rng.choice(REGIONS, n),
+        "등급": rng.integers(1, 4, n),
+        "유통구분": rng.integers(1, 4, n),
+        "당일": [f"{p:,}" for p in rng.integers(10000, 30000, n)],
+    })
+
+
+def _write(path, df, mode="w"):
+    df.to_csv(path, mode=mode, header=mode == "w", index=False, encoding="utf-8")
+
+
+def _rebuilt(path, tmp_path):
+    # 같은 내용을 새 디렉터리에 복사해 처음부터 만든 캐시
+    fresh = tmp_path / "fresh"
+    fresh.mkdir(exist_ok=True)
+    copy = fresh / os.path.basename(path)
+    shutil.copyfile(path, copy)
+    return columnar.load_table(str(copy), meta=columnar.ensure_cache(str(copy)))
+
+
+def _assert_same(path, tmp_path):
+    meta = columnar.ensure_cache(str(path))
+    cached = columnar.load_table(str(path), meta=meta)
+    expected = _rebuilt(path, tmp_path)
+    assert meta["rows"] == len(expected)
+    pd.testing.assert_frame_equal(
+        cached.assign(도=cached["도"].astype(str)), expected.assign(도=expected["도"].astype(str)))
+    return meta
+
+
+def test_append_matches_rebuild(tmp_path):
+    path = tmp_path / "final.csv"
+    _write(path, _rows(0, 200, 0))
+    columnar.ensure_cache(str(path))
+    _write(path, _rows(200, 50, 1), mode="a")
+    meta = _assert_same(path, tmp_path)
+    assert len(meta["parts"]) == 2
+
+
+def test_rewrite_same_size_rebuilds(tmp_path):
+    path = tmp_path / "final.csv"
+    _write(path, _rows(0, 200, 0))
+    columnar.ensure_cache(str(path))
+    data = path.read_bytes()
+    # 첫 행의 값 한 글자만 바꿔 크기는 그대로 두고, mtime 은 확실히 바뀌게 한다.
+    pos = data.index(b"\n") + 1
+    edited = data[:pos] + data[pos:].replace(b"2020-01-01", b"2020-01-02", 1)
+    path.write_bytes(edited)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    meta = _assert_same(path, tmp_path)
+    assert len(meta["parts"]) == 1
+
+
+def test_compaction_matches_rebuild(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "MAX_PARTS", 3)
+    path = tmp_path / "final.csv"
+    _write(path, _rows(0, 200, 0))
+    columnar.ensure_cache(str(path))
+    for i in range(5):
+        _write(path, _rows(200 + 20 * i, 20, i + 1), mode="a")
+        columnar.ensure_cache(str(path))
+    meta = _assert_same(path, tmp_path)
+    assert len(meta["parts"]) <= 3
+
+
+def test_append_hash_is_file_hash(tmp_path):
+    path = tmp_path / "final.csv"
+    _write(path, _rows(0, 200, 0))
+    columnar.ensure_cache(str(path))
+    for i in range(3):
+        _write(path, _rows(200 + 20 * i, 20, i + 1), mode="a")
+        assert columnar.ensure_cache(str(path))["sha256"] == columnar.file_hash(str(path))
+
+
+def test_edit_then_append_rebuilds(tmp_path):
+    # 지문(offset 직전 구간) 밖을 고친 뒤 한 번 덧붙이면 덧붙이기로 보이지만, 앞쪽 해시를 다시 계산해 잡아낸다.
+    path = tmp_path / "final.csv"
+    _write(path, _rows(0, 400, 0))
+    columnar.ensure_cache(str(path))
+    data = path.read_bytes()
+    pos = data.index(b"\n") + 1
+    assert len(data) - pos > columnar.FINGERPRINT_SIZE
+    path.write_bytes(data[:pos] + data[pos:].replace(b"2020-01-01", b"2020-01-02", 1))
+    _write(path, _rows(400, 10, 99), mode="a")
+    meta = _assert_same(path, tmp_path)
+    assert len(meta["parts"]) == 1
+    assert meta["sha256"] == columnar.file_hash(str(path))
@@ -0,0 +1,38 @@
+# 버킷별 min/max 다운샘플링이 점 수 한도 안에서 양 끝점과 버킷마다의 최솟값·최댓값을 남기는지 확인한다.
+import numpy as np
+import pytest
+
+from shiitake.downsample import minmax_downsample
+
+
+@pytest.mark.parametrize("n, max_points", [(1000, 100), (1001, 100), (999, 7), (50, 1), (10_000, 640)])
+def test_keeps_bucket_extremes_within_budget(n, max_points):
+    rng = np.random.default_rng(n)
+    x = np.arange(n)
+    y = rng.normal(size=n).cumsum()
+    xs, ys = minmax_downsample(x, y, max_points)
+    assert len(xs) <= max(max_points, 2) + 2
+    assert xs[0] == 0 and xs[-1] == n - 1
+    assert (np.diff(xs) > 0).all()
+    np.testing.assert_array_equal(ys, y[xs])
+    # 버킷 크기는 minmax_downsample 과 같게 나눈다.
+    size = -(-n // max(max_points // 2, 1))
+    for lo in range(0, n, size):
+        bucket = y[lo:lo + size]
+        assert bucket.min() in ys and bucket.max() in ys
+
+
+def test_short_series_unchanged():
+    x, y = np.arange(5), np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+    xs, ys = minmax_downsample(x, y, 10)
+    np.testing.assert_array_equal(xs, x)
+    np.testing.assert_array_equal(ys, y)
+
+
+def test_nan_values_do_not_hide_extremes():
+    y = np.full(1000, np.nan)
+    y[::3] = np.arange(334.0)
+    y[500] = -1.0
+    xs, ys = minmax_downsample(np.arange(1000), y, 20)
+    assert -1.0 in ys and 333.0 in ys
+    assert len(xs) <= 22
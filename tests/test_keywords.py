@@ -0,0 +1,62 @@
+# 키워드 빈도 엔진: 조사 떼기·불용어 거르기, Space-Saving 요약(병합 포함)의 오차 범위와 정확한 상위 건수를 확인한다.
+import numpy as np
+import pandas as pd
+import pytest
+
+from shiitake.keywords import SpaceSaving, count_tokens, summarize
+
+
+def test_count_tokens_strips_particles():
+    texts = pd.Series(["버섯은 버섯이 버섯을, 면역력이 좋아요!", "표고버섯으로 가을 나는 1234 그리고 비타민D", None])
+    counts = count_tokens(texts).to_dict()
+    # 두 글자 이상 남을 때만 조사를 떼므로 가을·나는 은 그대로 남는다.
+    assert counts == {"버섯": 3, "면역력": 1, "표고버섯": 1, "가을": 1, "나는": 1, "비타민D": 1}
+
+
+def _stream(n, seed):
+    # Zipf 분포 단어 흐름을 청크(value_counts) 목록과 실제 건수로
+    rng = np.random.default_rng(seed)
+    words = pd.Series([f"w{i}" for i in np.minimum(rng.zipf(1.3, n), 5000)])
+    chunks = [words.iloc[i:i + 500].value_counts() for i in range(0, n, 500)]
+    return chunks, words.value_counts()
+
+
+def _assert_bounds(summary, truth):
+    true = truth.reindex(summary.counts.index, fill_value=0)
+    assert (summary.counts - summary.errors <= true).all()
+    assert (true <= summary.counts).all()
+    # 요약에 없는 항목은 floor 를 넘을 수 없다.
+    assert (truth.drop(summary.counts.index) <= summary.floor).all()
+
+
+@pytest.mark.parametrize("capacity", [20, 100])
+def test_summary_bounds(capacity):
+    chunks, truth = _stream(20_000, 0)
+    summary = summarize(chunks, capacity)
+    assert len(summary.counts) <= capacity
+    _assert_bounds(summary, truth)
+    # 전체의 1/capacity 보다 많이 나온 항목은 반드시 요약에 있다.
+    assert set(truth[truth > truth.sum() / capacity].index) <= set(summary.counts.index)
+
+
+def test_merged_shards_bounds():
+    chunks, truth = _stream(20_000, 1)
+    shards = [summarize(chunks[i::3], 50) for i in range(3)]
+    merged = shards[0].merge(shards[1]).merge(shards[2])
+    assert len(merged.counts) <= 50
+    _assert_bounds(merged, truth)
+
+
+def test_exact_when_capacity_is_enough():
+    chunks, truth = _stream(5_000, 2)
+    summary = summarize(chunks, len(truth) + 1)
+    assert (summary.errors == 0).all()
+    pd.testing.assert_series_equal(
+        summary.counts.sort_index(), truth.sort_index().astype("int64"), check_names=False)
+    top = summary.top(10)
+    assert top.tolist() == truth.head(10).tolist()
+
+
+def test_empty_merge():
+    summary = SpaceSaving.empty(5).merge(SpaceSaving.empty(5))
+    assert summary.counts.empty and summary.floor == 0
@@ -0,0 +1,16 @@
+# 개발자 패널의 p50/p95 (nearest-rank) 가 정의대로 ceil(q/100 × n) 번째 값인지 확인한다.
+import pytest
+
+from shiitake.perf import _percentile
+
+
+@pytest.mark.parametrize("n, q, rank", [
+    (1, 50, 1), (1, 95, 1),
+    (10, 50, 5), (10, 95, 10),
+    (20, 50, 10), (20, 95, 19),
+    (100, 50, 50), (100, 95, 95),
+    (200, 95, 190),
+])
+def test_nearest_rank(n, q, rank):
+    values = list(range(n, 0, -1))  # 정렬되지 않은 입력
+    assert _percentile(values, q) == rank
@@ -0,0 +1,82 @@
+# final.csv 에 행을 덧붙인 뒤 갱신한 단가 집계(PriceData.extend)로 조회한 결과가 처음부터 다시 만든 것과 같은지 확인한다.
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shiitake import queries
+from shiitake.prices import build_price_data, refresh_price_data
+
+KEYS = [(region, grade, dist) for region in ("강원도", "경기도") for grade in (1, 2) for dist in (1, 2)]
+
+
+def _rows(keys, dates, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        [(d.strftime("%Y-%m-%d"), r, g, u) for d in dates for r, g, u in keys],
+        columns=["조사일", "도", "등급", "유통구분"],
+    )
+    df["당일"] = [f"{p:,}" for p in rng.integers(10000, 30000, len(df))]
+    return df
+
+
+def _write(path, df, mode="w"):
+    df.to_csv(path, mode=mode, header=mode == "w", index=False, encoding="utf-8")
+
+
+def _plain(df):
+    return df.assign(도=df["도"].astype(str)).reset_index(drop=True)
+
+
+def _wide(df):
+    return df.T.reset_index().assign(도=lambda w: w["도"].astype(str)).set_index(["도", "등급", "유통구분"]).T
+
+
+@pytest.fixture
+def appended(tmp_path, request):
+    # 기준 파일로 만든 뒤 꼬리를 덧붙여 갱신한 PriceData 와, 같은 내용을 처음부터 만든 PriceData
+    path = tmp_path / "final.csv"
+    _write(path, _rows(KEYS, pd.date_range("2020-01-01", "2020-03-20"), 0))
+    previous = build_price_data(str(path))
+    tail_keys = [("강원도", 1, 1), ("경기도", 2, 2)] + ([("제주도", 1, 1)] if request.param else [])
+    _write(path, _rows(tail_keys, pd.date_range("2020-03-21", "2020-05-17"), 1), mode="a")
+    extended = refresh_price_data(str(path), previous)
+    assert len(extended.monthly.segments) == 2
+    fresh = tmp_path / "fresh"
+    fresh.mkdir()
+    shutil.copyfile(path, fresh / "final.csv")
+    return extended, build_price_data(str(fresh / "final.csv"))
+
+
+RANGES = [
+    (None, None),
+    ("2020-01-01", "2020-05-17"),  # 페이지 기본값: 끝이 달 중간
+    ("2020-02-10", "2020-04-03"),
+    ("2020-03-05", "2020-03-25"),  # 덧붙인 경계를 지나는 한 달 안
+    ("2020-04-01", "2020-04-30"),
+]
+
+
+@pytest.mark.parametrize("appended", [False, True], ids=["same-regions", "new-region"], indirect=True)
+@pytest.mark.parametrize("granularity", ["M", "D"])
+def test_select_after_extend_matches_rebuild(appended, granularity):
+    extended, full = appended
+    assert extended.regions == full.regions
+    keys = KEYS + [("제주도", 1, 1)] if "제주도" in full.regions else KEYS
+    for region, grade, dist in keys:
+        for start, end in RANGES:
+            got = _plain(queries.select(extended, granularity, region, grade, dist, start, end))
+            queries._results.clear()
+            expected = _plain(queries.select(full, granularity, region, grade, dist, start, end))
+            pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("appended", [False, True], ids=["same-regions", "new-region"], indirect=True)
+def test_compare_after_extend_matches_rebuild(appended):
+    extended, full = appended
+    for start, end in RANGES:
+        got = queries.compare(extended, full.regions, [1, 2], [1, 2], start, end)
+        queries._results.clear()
+        expected = queries.compare(full, full.regions, [1, 2], [1, 2], start, end)
+        pd.testing.assert_frame_equal(_wide(got), _wide(expected))
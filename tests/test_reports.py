@@ -0,0 +1,20 @@
+# 리포트 캐시 정리(_prune)가 작업의 Snapshot 보다 새 버전의 리포트를 지우지 않는지 확인한다.
+import os
+
+from shiitake import reports
+
+
+def _touch(path, mtime):
+    path.write_bytes(b"zip")
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_keeps_newer_versions(tmp_path):
+    _touch(tmp_path / "old_a.zip", 100)
+    _touch(tmp_path / "cur_a.zip", 200)
+    _touch(tmp_path / "new_a.zip", 300)
+    # 시각 150 에 게시된 Snapshot(버전 cur)으로 늦게 끝난 작업
+    reports._prune(str(tmp_path), "cur", 150)
+    assert sorted(os.listdir(tmp_path)) == ["cur_a.zip", "new_a.zip"]
+    reports._prune(str(tmp_path), "new", 250)
+    assert sorted(os.listdir(tmp_path)) == ["new_a.zip"]
@@ -0,0 +1,76 @@
+# 월별/일별 집계가 원본 행에서 바로 계산한 값과 같은지 확인한다:
+# 달 중간에서 자른 조회(clip_months)와, 행을 덧붙여 갱신한 집계(Rollup.extend / _previous).
+import numpy as np
+import pandas as pd
+import pytest
+
+from shiitake import rollups
+from shiitake.index import KEY_COLUMNS, concat_groups
+from shiitake.prices import clean_prices
+from shiitake.rollups import build_rollup, clip_months
+
+REGIONS = ["강원도", "경기도", "전라남도"]
+
+
+def _prices(n, seed, start="2020-01-01", end="2020-12-31", regions=REGIONS):
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(start, end)
+    raw = pd.DataFrame({
+        "조사일": days[rng.integers(0, len(days), n)].strftime("%Y-%m-%d"),
+        "도": rng.choice(regions, n),
+        "등급": rng.integers(1, 3, n).astype(str),
+        "유통구분": rng.integers(1, 3, n).astype(str),
+        "당일": rng.integers(10000, 30000, n).astype(str),
+    })
+    return clean_prices(raw)
+
+
+def _plain(df):
+    return (
+        df.assign(도=df["도"].astype(str))
+        .sort_values(KEY_COLUMNS + ["기간"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _expected(df, start, end):
+    # 원본 행을 [start, end] 로 자른 뒤 (키, 달) 별로 바로 집계
+    lo = pd.Timestamp(start) if start is not None else df["조사일"].min()
+    hi = pd.Timestamp(end) if end is not None else df["조사일"].max()
+    d = df[(df["조사일"] >= lo) & (df["조사일"] <= hi)]
+    month = d["조사일"].dt.to_period("M").dt.to_timestamp().rename("기간")
+    return (
+        d["당일"].astype("float64")
+        .groupby([d["도"].astype(str), d["등급"], d["유통구분"], month])
+        .agg(건수="count", 최소="min", 최대="max", 평균="mean")
+        .reset_index()
+    )
+
+
+def test_clip_months_matches_raw_rows():
+    df = _prices(3000, 0)
+    monthly, daily = build_rollup(df, "M"), build_rollup(df, "D")
+    keys = sorted({(str(r), g, u) for r, g, u in df[KEY_COLUMNS].itertuples(index=False)})
+    days = pd.date_range("2020-01-01", "2020-12-31")
+    rng = np.random.default_rng(1)
+    ranges = [(None, None), (None, "2020-06-15"), ("2020-03-10", None), ("2020-05-03", "2020-05-20")]
+    ranges += [tuple(days[np.sort(rng.choice(len(days), 2, replace=False))]) for _ in range(20)]
+    for start, end in ranges:
+        got = _plain(clip_months(monthly.rows(keys, start, end), daily, keys, start, end))
+        expected = _expected(df, start, end)
+        pd.testing.assert_frame_equal(got[expected.columns], expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("freq", ["M", "D"])
+def test_extend_matches_rebuild(freq, monkeypatch):
+    # 세그먼트 합치기까지 거치도록 MAX_SEGMENTS 를 줄이고, 기존 (키, 기간) 에 겹치는 행과 새 도를 섞어 덧붙인다.
+    monkeypatch.setattr(rollups, "MAX_SEGMENTS", 3)
+    chunks = [_prices(2000, 0, end="2020-09-30")]
+    chunks += [_prices(200, i, start="2020-09-01", end="2020-12-31") for i in range(1, 6)]
+    chunks.append(_prices(100, 9, start="2020-11-01", regions=["제주도"]))
+    rollup = build_rollup(chunks[0], freq)
+    for chunk in chunks[1:]:
+        rollup = rollup.extend(chunk)
+    assert len(rollup.segments) <= 3
+    full = build_rollup(concat_groups(chunks), freq)
+    pd.testing.assert_frame_equal(_plain(rollup.table()), _plain(full.table()), check_dtype=False)
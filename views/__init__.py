@@ -0,0 +1 @@
+# 대시보드 페이지 모듈 (app.py 에서 해당 페이지를 그릴 때만 import 한다)
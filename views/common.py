@@ -0,0 +1,53 @@
+import html
+
+import streamlit as st
+
+from shiitake.config import STATIC_URL
+
+# 사이드바(홈/로그아웃)
+def sidebar_header():
+    st.sidebar.markdown("""
+    <div style="background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
+        <h2 style="color: white; margin: 0;">🍄 표고버섯</h2>
+        <p style="color: white; margin: 0; opacity: 0.9;">종합 분석 시스템</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.sidebar.markdown(f"""
+    <div style="background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%);
+                padding: 1rem; border-radius: 10px; margin: 1rem 0; text-align: center;">
+        <p style="color: white; margin: 0; font-weight: bold;">
+            접속 유형: {st.session_state.user_type}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    col1, col2 = st.sidebar.columns(2)
+    if col1.button("🏠 홈으로", key="sidebar_home"):
+        st.session_state.entered = False
+        st.session_state.user_type = ""
+        st.rerun()
+    if col2.button("🚪 로그아웃", key="sidebar_logout"):
+        st.session_state.entered = False
+        st.session_state.user_type = ""
+        st.rerun()
+
+# 권한 없음 페이지 (공개 정적 사이트 주소가 있으면 읽기 전용 화면 링크를 함께 보여준다)
+def no_permission_page():
+    public = (
+        f'<div style="margin-top: 1.2rem; font-size: 1.1rem;"><a href="{html.escape(STATIC_URL)}" target="_blank" '
+        f'style="color: white;">👀 공개 대시보드 (소셜 분석 · 예측 단가) 보기</a></div>'
+        if STATIC_URL else ""
+    )
+    st.markdown(f"""
+    <div style="margin: 0 auto; max-width: 600px;">
+        <div style="background: linear-gradient(135deg, #D2691E 0%, #DEB887 100%);
+                    color: white; padding: 2.5rem 2rem 2rem 2rem; border-radius: 20px;
+                    text-align: center; font-weight: bold; font-size: 2rem;
+                    box-shadow: 0 10px 40px rgba(139, 69, 19, 0.13); margin: 60px auto;">
+            <span style="font-size: 2.5rem; color:#a12020;">❌</span>
+            <span style="font-size: 1.9rem;">접근 권한이 없습니다</span>
+            <span style="font-size: 2.5rem; color:#a12020;">❌</span>
+            <div style="margin-top: 1rem; font-size: 1.1rem; font-weight: normal;">로그아웃 후 생산자 ID 로 다시 로그인 해주세요.</div>
+            {public}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
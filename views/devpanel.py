@@ -0,0 +1,53 @@
+import time
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from shiitake import memory, perf
+from views.loaders import get_snapshot
+
+# 개발자용 성능 패널 (SHIITAKE_PROFILE=1 일 때만 표시)
+def perf_panel():
+    ctx = get_script_run_ctx()
+    summary = perf.end_run(ctx.session_id if ctx else "-")
+    with st.sidebar.expander("⏱️ 성능 (개발자)", expanded=False):
+        if summary:
+            st.caption(f"이번 실행: {summary['page']} · {summary['total'] * 1000:.1f} ms")
+            st.dataframe(
+                pd.DataFrame(
+                    [(name, seconds * 1000) for name, seconds in summary["stages"].items()],
+                    columns=["구간", "ms"],
+                ),
+                hide_index=True,
+                use_container_width=True,
+            )
+        st.caption(f"최근 {perf.WINDOW}회 기준 p50 / p95")
+        st.dataframe(pd.DataFrame(perf.percentiles()), hide_index=True, use_container_width=True)
+        snap = get_snapshot()
+        versions = [f"단가 {snap.prices.version}" if snap.prices else "단가 -",
+                    f"예측 {snap.predictions.version}" if snap.predictions else "예측 -",
+                    f"소셜 {snap.social.version}" if snap.social else "소셜 기본값"]
+        st.caption(f"데이터 스냅샷: {' · '.join(versions)} · {time.time() - snap.created:.0f}초 전 게시")
+        for name, error in snap.errors.items():
+            st.caption(f"⚠️ {name}: {error}")
+    with st.sidebar.expander("🧠 메모리 (개발자)", expanded=False):
+        sessions = memory.session_stats()
+        per_session = [s["bytes"] for s in sessions]
+        st.caption(
+            f"프로세스 RSS {memory.rss_bytes() / 2**20:,.1f} MB · 세션 {len(sessions)}개 · "
+            f"세션 상태 평균 {sum(per_session) / max(len(per_session), 1) / 1024:,.1f} KB / 최대 {max(per_session, default=0) / 1024:,.1f} KB"
+        )
+        st.dataframe(
+            pd.DataFrame(memory.cache_stats(), columns=list(memory.CACHE_COLUMNS)).assign(
+                MB=lambda d: d["bytes"] / 2**20, max_MB=lambda d: d["max_bytes"] / 2**20,
+                hit_rate=lambda d: d["hits"] / (d["hits"] + d["misses"]).where(lambda n: n > 0),
+            ).drop(columns=["bytes", "max_bytes"]),
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.dataframe(
+            pd.DataFrame(sorted(sessions, key=lambda s: -s["bytes"])[:10], columns=["session", "keys", "bytes"]),
+            hide_index=True,
+            use_container_width=True,
+        )
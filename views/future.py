@@ -0,0 +1,146 @@
+import streamlit as st
+
+from shiitake import reports
+from shiitake.charts import forecast_bar_chart
+from shiitake.perf import stage
+from shiitake.predictions import BEST, gaps_html
+from views.loaders import get_snapshot
+
+
+@st.fragment(run_every=1.0)
+def _report_progress(job):
+    # 리포트는 스레드 풀에서 만들어지므로 이 부분만 1초마다 다시 그려 끝났는지 본다.
+    if not job.done():
+        st.info("⏳ 리포트를 만드는 중입니다...")
+        return
+    st.rerun()
+
+
+def report_section(snap, grade, dist, model, horizon, regions):
+    # 선택한 조합의 PDF · Excel · PNG 묶음. 이미 만든 리포트(같은 데이터 버전)는 파일을 바로 내려준다.
+    st.markdown('<div class="section-title">📄 맞춤형 리포트</div>', unsafe_allow_html=True)
+    if snap.prices is None or snap.indicators is None:
+        st.caption("단가 데이터를 불러온 뒤에 리포트를 만들 수 있습니다.")
+        return
+    c1, c2 = st.columns([1, 2])
+    with c1:
+        region = st.selectbox("🏷️ 도 선택", regions, key="report_region")
+    sel = reports.Selection(region, grade, dist, model, horizon)
+    with c2:
+        path = reports.cached(snap, sel)
+        if path is not None:
+            with open(path, "rb") as f:
+                st.download_button("📦 리포트 다운로드 (PDF · Excel · PNG)", f.read(),
+                                   file_name=reports.file_name(sel), mime="application/zip", key="report_download")
+            return
+        job = reports.job(snap, sel)
+        if job is not None and job.done():
+            st.error(f"리포트를 만들지 못했습니다: {job.exception()}")
+        elif job is not None:
+            _report_progress(job)
+            return
+        if st.button("📄 리포트 만들기", key="report_build"):
+            reports.request(snap, sel)
+            st.rerun()
+
+
+def future_page():
+    st.markdown("""
+    <style>
+    .section-headline {
+        font-size: 2rem;
+        font-weight: 900;
+        color: #8B4513;
+        margin-bottom: 5px;
+        margin-top: 5px;
+        letter-spacing: -0.5px;
+    }
+    .section-desc {
+        color: #98713D;
+        font-size: 1.08rem;
+        font-weight: 500;
+        margin-bottom: 24px;
+        margin-top: -8px;
+    }
+    .gap-table { max-height: 400px; overflow: auto; }
+    .gap-table table { border-collapse: collapse; width: 100%; font-size: 0.95rem; }
+    .gap-table th, .gap-table td { border: 1px solid #e5d9cc; padding: 0.35rem 0.6rem; text-align: right; }
+    .gap-table thead th { position: sticky; top: 0; background: #8B4513; color: white; }
+    </style>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-headline">🔮 미래 단가 예측</div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-desc">AI 기반 가격 예측 및 실제 데이터 비교</div>', unsafe_allow_html=True)
+
+
+    # 예측 표 (백그라운드 워커가 읽고 조합별 표·갭 색상까지 만들어 둔 Snapshot)
+    with stage("future", "load"):
+        snap = get_snapshot()
+        pred = snap.predictions
+    if pred is None:
+        st.error("예측 데이터 파일을 불러올 수 없습니다.")
+        return
+
+    # UI: 등급 & 유통구분 & 모델 & 예측 기간 선택
+    st.markdown('<div class="section-title">🎯 조건 선택</div>', unsafe_allow_html=True)
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        sel_g = st.selectbox("🎖️ 등급 선택", pred.grades)
+    with c2:
+        sel_u = st.selectbox("🚚 유통구분 선택", pred.dists)
+    with c3:
+        sel_m = st.selectbox(
+            "🤖 모델 선택", [BEST] + pred.models,
+            format_func=lambda m: "🏆 RMSE 최저 (도별 자동)" if m == BEST else m,
+        )
+    with c4:
+        sel_h = st.selectbox("⏳ 예측 기간", pred.horizons, format_func=lambda h: f"{h}개월 후")
+
+    # 조합별 표 조회 (미리 만들어 둔 표를 dict 로 찾음)
+    with stage("future", "filter"):
+        table = pred.tables.get((sel_g, sel_u, sel_m, sel_h))
+    if table is None:
+        st.warning("해당 조합의 예측 결과가 없습니다.")
+        return
+    if sel_m == BEST:
+        st.caption("도마다 테스트_RMSE 가 가장 낮은 모델의 예측입니다.")
+
+    # 좌: 테이블, 우: 차트
+    col_table, col_chart = st.columns([1,2], gap="small")
+
+    with col_table:
+        with st.container(border=True), stage("future", "render"):
+            st.markdown('<div class="section-title">🏷️ 도별 예상단가</div>', unsafe_allow_html=True)
+            # Styler 대신 column_config 로 서식만 지정 (스타일 계산 없음)
+            st.dataframe(
+                table.prices,
+                column_config={
+                    "예상단가(원)": st.column_config.NumberColumn("예상단가(원)", format="%,d원"),
+                    "테스트_RMSE": st.column_config.NumberColumn("테스트_RMSE", format="%,.1f"),
+                    "테스트_MAPE": st.column_config.NumberColumn("테스트_MAPE", format="%.1f%%"),
+                },
+                use_container_width=True,
+                height=360,
+            )
+
+    with col_chart:
+        with st.container(border=True), stage("future", "render"):
+            st.markdown('<div class="section-title">📊 도별 예상단가 Bar Chart</div>', unsafe_allow_html=True)
+            png = forecast_bar_chart(
+                (sel_g, sel_u, sel_m, sel_h, pred.version),
+                list(table.prices.index.astype(str)), table.prices["예상단가(원)"],
+            )
+            st.image(png, use_container_width=True)
+
+    st.markdown("---")
+    with st.container(border=True), stage("future", "render"):
+        st.markdown('<div class="section-title">📊 도별 예측 vs 실제 & 갭 분석</div>', unsafe_allow_html=True)
+        # 갭 강조 테이블: 미리 계산해 둔 색상을 입힌 HTML 을 예측 버전·조합별로 한 번만 만들어 재사용한다.
+        gaps = gaps_html(pred.version, (sel_g, sel_u, sel_m, sel_h), table)
+        st.markdown(f'<div class="gap-table">{gaps}</div>', unsafe_allow_html=True)
+
+    st.markdown("---")
+    with st.container(border=True):
+        report_section(snap, sel_g, sel_u, sel_m, sel_h, list(table.prices.index.astype(str)))
+
+    st.markdown('</div>', unsafe_allow_html=True)
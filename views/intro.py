@@ -0,0 +1,115 @@
+from io import BytesIO
+
+import qrcode
+import streamlit as st
+
+from shiitake.config import QR_URL
+
+# QR코드 PNG: URL(및 크기)별로 프로세스당 한 번만 생성
+@st.cache_resource(show_spinner=False)
+def qr_png(url, box_size=6, border=2):
+    qr = qrcode.QRCode(box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buf = BytesIO()
+    img.save(buf)
+    return buf.getvalue()
+
+# 인트로(유형 선택/QR)
+def main_intro_page():
+    st.markdown("""
+    <style>
+    /* 주요 기능 및 사용법 강조 */
+    .big-feature {
+        font-size: 1.28rem !important;
+        font-weight: 700;
+        color: #8B4513;
+        margin-bottom: 0.18rem;
+    }
+    .big-guide {
+        font-size: 1.14rem !important;
+        font-weight: 600;
+        color: #D2691E;
+        margin-bottom: 0.08rem;
+    }
+    /* 라디오 버튼(회원유형) 커스텀 */
+    .stRadio > div {
+        gap: 1.5rem !important;         /* 버튼 사이 가로 간격 */
+        justify-content: stretch;
+    }
+    .stRadio > div > label {
+        flex: 1 1 0;
+        width: 100%;
+        margin: 0 !important;
+        border-radius: 14px !important;
+        font-size: 2.0rem !important;  /* 👈 아주 크게! */
+        padding: 2.3rem 0 !important;  /* 버튼 높이도 큼 */
+        text-align: center !important;
+        vertical-align: middle !important;
+        background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%);
+        font-weight: 900 !important;
+        color: white !important;
+        box-shadow: 0 2px 12px rgba(139,69,19,0.10);
+        border: 2px solid #dcb68b33;
+        transition: 0.2s;
+        display: flex !important;
+        align-items: center !important;
+        justify-content: center !important;
+        line-height: 1.15 !important;
+        letter-spacing: -0.5px;
+    }
+    .stRadio > div > label[data-selected="true"] {
+        border: 3.2px solid #8B4513 !important;
+        background: linear-gradient(135deg, #D2691E 0%, #8B4513 100%);
+        color: #fff !important;
+        box-shadow: 0 4px 20px #d2691e33;
+        z-index: 2;
+    }
+    @media (max-width: 900px) {
+        .stRadio > div > label {
+            font-size: 1.15rem !important;
+            padding: 1.2rem 0 !important;
+        }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>🍄 표고버섯 종합 대시보드</h1>
+        <p><strong>가격·트렌드·예측·소셜데이터 분석을 한 번에!</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-title">주요 기능</div>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="big-feature">• 실시간 유통가격/AI예측 단가 시각화</div>
+    <div class="big-feature">• 지역·등급·유통구분별 비교 분석</div>
+    <div class="big-feature">• 소셜 빅데이터 트렌드/감성분석</div>
+    <div class="big-feature">• 맞춤형 리포트, 생산자/구매자 전용 서비스</div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-title">사용법</div>', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="big-guide">① 회원 유형(생산자, 구매자, 비회원)을 선택합니다.</div>
+    <div class="big-guide">② [입장하기]를 누르면 맞춤 서비스로 이동합니다.</div>
+    <div class="big-guide">③ 아래 QR코드로 모바일에서 바로 접속할 수 있습니다.</div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-title">접속 유형 선택</div>', unsafe_allow_html=True)
+    user_type = st.radio(
+        "회원 유형을 선택하세요:",
+        ["👩‍🌾 생산자", "🛍 구매자", "👀 비회원"],
+        horizontal=True,
+        key="main_user_type"
+    )
+    if st.button("🚪 입장하기", key="go_btn"):
+        st.session_state.entered = True
+        st.session_state.user_type = user_type.replace("👩‍🌾 ", "").replace("🛍 ", "").replace("👀 ", "")
+        st.rerun()
+
+    # QR코드
+    st.markdown('<div class="section-title">📱 모바일로 접속하기</div>', unsafe_allow_html=True)
+    st.image(qr_png(QR_URL), caption="QR코드로 스마트폰에서 바로 열기", width=200)
@@ -0,0 +1,14 @@
+import streamlit as st
+
+from shiitake.config import CSV_MACRO, PRED_GLOB, SOCIAL_STORE
+from shiitake.snapshot import Refresher
+
+# 데이터 로드는 백그라운드 워커가 맡는다 (프로세스당 하나, 모든 세션이 공유).
+# 페이지는 rerun 시작 시 get_snapshot() 을 한 번 불러 그 Snapshot 만 읽는다 (수정 금지).
+@st.cache_resource(show_spinner=False)
+def _refresher():
+    return Refresher(CSV_MACRO, PRED_GLOB, SOCIAL_STORE).start()
+
+
+def get_snapshot():
+    return _refresher().current()
@@ -0,0 +1,149 @@
+import streamlit as st
+
+from shiitake import queries
+from shiitake.charts import comparison_chart, daily_chart, monthly_chart
+from shiitake.perf import stage
+from views.loaders import get_snapshot
+
+# 비교 모드에서 한 차트에 그릴 최대 조합 수
+MAX_COMPARE_SERIES = 24
+
+
+def comparison_section(prices):
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        sel_do = st.multiselect("🏷️ 도 선택", prices.regions, default=prices.regions[:3], key="cmp_regions")
+    with c2:
+        sel_grade = st.multiselect("🎖️ 등급 선택", prices.grades, default=prices.grades[:1], key="cmp_grades")
+    with c3:
+        sel_dist = st.multiselect("🚚 유통구분 선택", prices.dists, default=prices.dists[:1], key="cmp_dists")
+
+    dmin = prices.date_min.date()
+    dmax = prices.date_max.date()
+    st.markdown('<div class="section-title">📊 월별 단가 비교</div>', unsafe_allow_html=True)
+    sm, em = st.columns(2)
+    with sm:
+        start_m = st.date_input("시작일 (월별)", dmin, min_value=dmin, max_value=dmax, key="cmp_start")
+    with em:
+        end_m = st.date_input("종료일 (월별)", dmax, min_value=dmin, max_value=dmax, key="cmp_end")
+
+    n_series = len(sel_do) * len(sel_grade) * len(sel_dist)
+    if n_series == 0:
+        st.info("도, 등급, 유통구분을 하나 이상 선택하세요.")
+        return
+    if n_series > MAX_COMPARE_SERIES:
+        st.warning(f"조합이 {n_series}개입니다. 한 번에 {MAX_COMPARE_SERIES}개까지 비교할 수 있습니다.")
+        return
+
+    # 선택한 모든 조합을 월별 집계에서 한 번에 모아 (기간 × 조합) 표로 만든다.
+    with stage("price_trend", "aggregate"):
+        wide = queries.compare(prices, sel_do, sel_grade, sel_dist, start_m, end_m)
+    if wide.empty:
+        st.warning("해당 조건의 월별 데이터가 없습니다.")
+        return
+
+    with st.container(border=True), stage("price_trend", "render"):
+        labels = [f"{r} · {g}등급 · 유통{d}" for r, g, d in wide.columns]
+        png = comparison_chart(
+            (prices.version, tuple(sel_do), tuple(sel_grade), tuple(sel_dist), start_m, end_m),
+            wide, labels,
+        )
+        st.image(png, use_container_width=True)
+
+
+def price_trend_page():
+    st.markdown("""
+    <style>
+    .section-headline {
+        font-size: 2rem;
+        font-weight: 900;
+        color: #8B4513;
+        margin-bottom: 5px;
+        margin-top: 5px;
+        letter-spacing: -0.5px;
+    }
+    .section-desc {
+        color: #98713D;
+        font-size: 1.08rem;
+        font-weight: 500;
+        margin-bottom: 24px;
+        margin-top: -8px;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-headline">💰 단가 트렌드</div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-desc">지역별 · 등급별 · 유통채널별 가격 분석</div>', unsafe_allow_html=True)
+    # (1) 데이터 로드 및 전처리
+    with stage("price_trend", "load"):
+        prices = get_snapshot().prices
+    if prices is None:
+        st.error("CSV 파일을 불러올 수 없습니다.")
+        return
+
+    # (2) 필터: 도 / 등급 / 유통구분
+    st.markdown('<div class="section-title">🎯 조건 선택</div>', unsafe_allow_html=True)
+    if st.toggle("🔀 비교 모드 (여러 도 · 등급 · 유통구분)", key="compare_mode"):
+        comparison_section(prices)
+        return
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        sel_do = st.selectbox("🏷️ 도 선택", prices.regions)
+    with c2:
+        sel_grade = st.selectbox("🎖️ 등급 선택", prices.grades)
+    with c3:
+        sel_dist = st.selectbox("🚚 유통구분 선택", prices.dists)
+
+    # 날짜 범위
+    dmin = prices.date_min.date()
+    dmax = prices.date_max.date()
+
+    # (3) 월별 단가
+    st.markdown('<div class="section-title">📊 월별 단가 트렌드</div>', unsafe_allow_html=True)
+    sm, em = st.columns(2)
+    with sm:
+        start_m = st.date_input("시작일 (월별)", dmin, min_value=dmin, max_value=dmax, key="start_month")
+    with em:
+        end_m = st.date_input("종료일 (월별)", dmax, min_value=dmin, max_value=dmax, key="end_month")
+
+    # 월별 집계 테이블에서 기간만 잘라 읽음 (같은 조회는 세션끼리 공유하는 결과 캐시에서)
+    with stage("price_trend", "filter"):
+        monthly = queries.select(prices, "M", sel_do, sel_grade, sel_dist, start_m, end_m)
+    
+    if monthly.empty:
+        st.warning("해당 조건의 월별 데이터가 없습니다.")
+    else:
+
+        # ✅ 흰색 박스 안에 그래프만 출력
+        with st.container(border=True), stage("price_trend", "render"):
+            png = monthly_chart(
+                (sel_do, sel_grade, sel_dist, prices.version, start_m, end_m),
+                monthly["기간"].dt.strftime("%Y-%m"), monthly["평균"],
+            )
+            st.image(png, use_container_width=True)
+
+    st.markdown("---")
+
+
+    # (4) 일별 단가 조회
+    st.markdown('<div class="section-title">📅 일별 단가 조회</div>', unsafe_allow_html=True)
+    sd, ed = st.columns(2)
+    with sd:
+        start_d = st.date_input("시작일 (일별)", dmin, min_value=dmin, max_value=dmax, key="start_day")
+    with ed:
+        end_d = st.date_input("종료일 (일별)", dmax, min_value=dmin, max_value=dmax, key="end_day")
+
+    with stage("price_trend", "filter"):
+        daily = queries.select(prices, "D", sel_do, sel_grade, sel_dist, start_d, end_d)
+    
+    if daily.empty:
+        st.warning("해당 조건의 일별 데이터가 없습니다.")
+    else:
+
+        # ✅ 흰색 박스 안에 그래프만 출력
+        with st.container(border=True), stage("price_trend", "render"):
+            png = daily_chart(
+                (sel_do, sel_grade, sel_dist, prices.version, start_d, end_d),
+                daily["기간"], daily["평균"],
+            )
+            st.image(png, use_container_width=True)
@@ -0,0 +1,29 @@
+import streamlit as st
+
+# 유통 대시보드, 생산자 전용 (탭 모듈은 선택된 탭만 import)
+# ================================
+# 페이지 2: 유통 정보 대시보드
+# ================================
+def producer_page():
+    st.markdown("""
+    <div class="main-header">
+        <h1>👩‍🌾 생산자 전용 페이지</h1>
+        <p><strong>표고버섯 생산 관련 종합 정보</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    tab = st.sidebar.radio(
+        "📋 메뉴 선택",
+        ["📈 사회경제 지표", "💰 단가 트렌드", "🔮 미래 단가 예측"],
+        key="producer_tab"
+    )
+    
+    if tab == "📈 사회경제 지표":
+        from views.socioecon import socioecon_page
+        socioecon_page()
+    elif tab == "💰 단가 트렌드":
+        from views.price_trend import price_trend_page
+        price_trend_page()
+    else:
+        from views.future import future_page
+        future_page()
@@ -0,0 +1,204 @@
+import streamlit as st
+
+from shiitake.figures import age_figure, seasonal_figure, sentiment_figure, topic_figure, usage_figure, yearly_figure
+from shiitake.keywords import cloud_html, keyword_tiers
+from shiitake.perf import stage
+from shiitake.social import default_social, figure_spec
+from views.loaders import get_snapshot
+
+AGE_ICONS = {"20~30대": "🔥", "40~50대": "💪", "60대+": "🌿"}
+
+# ================================
+# 페이지 1: 소셜 빅데이터 분석
+# ================================
+def social_bigdata_page():
+    # 집계 표 (백그라운드 워커가 읽은 SOCIAL_STORE, 없으면 기본 표)
+    with stage("social", "load"):
+        social = get_snapshot().social or default_social()
+    yearly_data = social.tables["yearly"]
+    seasonal_data = social.tables["seasonal"]
+    sentiment_data = social.tables["sentiment"]
+    topic_data = social.tables["topic"]
+    age_data = social.tables["age"]
+    usage_data = social.tables["usage"]
+    first_year, last_year = social.years
+    positive = sentiment_data.set_index("Sentiment").loc["긍정"]
+    topic_pct = topic_data.set_index("Topic")["Percentage"]
+    top_age = age_data.loc[age_data["Percentage"].idxmax()]
+
+    # Header
+    st.markdown(f"""
+    <div class="main-header">
+        <h1>🍄 표고버섯 소셜 빅데이터 분석</h1>
+        <p><strong>{first_year}-{last_year}년 | 총 언급량: {social.total:,}회 | {social.growth}% 증가 추세</strong></p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Row 1: Keywords, Yearly Trend, Seasonal Distribution
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown('<div class="section-title">🔍 주요 키워드</div>', unsafe_allow_html=True)
+        # 원문에서 센 상위 키워드를 빈도 비율로 큰/중간/작은 글씨로 나눈다.
+        st.markdown(cloud_html(keyword_tiers(social.tables["keywords"])), unsafe_allow_html=True)
+
+    # 그림은 데이터 버전마다 한 번만 만들고, 이후 rerun 은 캐시된 그림 JSON 을 쓴다.
+    with col2:
+        st.markdown('<div class="section-title">📈 연도별 언급량 추이</div>', unsafe_allow_html=True)
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "yearly", lambda: yearly_figure(yearly_data)), use_container_width=True)
+
+    with col3:
+        st.markdown('<div class="section-title">📅 계절별 언급 분포</div>', unsafe_allow_html=True)
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "seasonal", lambda: seasonal_figure(seasonal_data)), use_container_width=True)
+
+    # Row 2: Sentiment Analysis, Topic Modeling, Age Groups
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown('<div class="section-title">😊 감성 분석</div>', unsafe_allow_html=True)
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "sentiment", lambda: sentiment_figure(sentiment_data)), use_container_width=True)
+
+        st.markdown(f"""
+        <div class="metric-card">
+            <div class="metric-number">{positive["Percentage"]}%</div>
+            <div class="metric-label">긍정 ({positive["Count"]:,}회)</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="section-title">📊 토픽 모델링</div>', unsafe_allow_html=True)
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "topic", lambda: topic_figure(topic_data)), use_container_width=True)
+
+    with col3:
+        st.markdown('<div class="section-title">👥 연령대별 관심도</div>', unsafe_allow_html=True)
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "age", lambda: age_figure(age_data)), use_container_width=True)
+
+        # 연령대 × 토픽 교차 집계는 없으므로 연령대 표의 비율·언급량만 보여 준다.
+        age_rows = "".join(
+            f'<p style="margin-bottom: 0.5rem;"><strong>{AGE_ICONS.get(row.Age_Group, "👤")} {row.Age_Group}</strong>'
+            f'<br>관심도 {row.Percentage}%, 언급량 {row.Count:,}회</p>'
+            for row in age_data.itertuples()
+        )
+        st.markdown(f"""
+        <div class="insight-card">
+            <h4 style="font-size: 1.1rem; font-weight: bold; margin-bottom: 1rem;">📋 연령대별 특징</h4>
+            {age_rows}
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Row 3: Usage Analysis & Key Insights
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown('<div class="section-title">🍳 용도별 활용 분석</div>', unsafe_allow_html=True)
+
+        with stage("social", "render"):
+            st.plotly_chart(figure_spec(social.version, "usage", lambda: usage_figure(usage_data)), use_container_width=True)
+
+    with col2:
+        st.markdown('<div class="section-title">💡 핵심 인사이트</div>', unsafe_allow_html=True)
+
+        st.markdown(f"""
+        <div class="metric-card" style="background: linear-gradient(135deg, #8B4513 0%, #D2691E 100%);">
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 2rem;">📈</span>
+                <div>
+                    <div class="metric-number" style="font-size: 1.5rem;">성장률: {social.growth}%</div>
+                    <div class="metric-label">{len(yearly_data)}년간 언급량 증가</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+        <div class="metric-card" style="background: linear-gradient(135deg, #228B22 0%, #32CD32 100%);">
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 2rem;">😊</span>
+                <div>
+                    <div class="metric-number" style="font-size: 1.5rem;">긍정도: {positive["Percentage"]}%</div>
+                    <div class="metric-label">맛과 건강의 이중효과</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+        <div class="metric-card" style="background: linear-gradient(135deg, #CD853F 0%, #DEB887 100%);">
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 2rem;">🍳</span>
+                <div>
+                    <div class="metric-number" style="font-size: 1.5rem;">요리용도: {topic_pct["요리/레시피"]}%</div>
+                    <div class="metric-label">vs 건강효능 {topic_pct["건강/효능"]}%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+        <div class="metric-card" style="background: linear-gradient(135deg, #FF8C00 0%, #FFA500 100%);">
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="font-size: 2rem;">👑</span>
+                <div>
+                    <div class="metric-number" style="font-size: 1.5rem;">핵심층: {top_age["Percentage"]}%</div>
+                    <div class="metric-label">{top_age["Age_Group"]} 관심도 최고</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Trend Forecast & Strategy
+    st.markdown('<div class="section-title" style="font-size: 2rem; margin-top: 3rem;">🔮 표고버섯 소셜 트렌드 전망 & 마케팅 전략</div>', unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="insight-card">
+            <h4 style="font-size: 1.3rem; font-weight: bold; margin-bottom: 1rem;">🚀 성장 동력</h4>
+            <ul style="list-style: none; padding: 0;">
+                <li style="margin-bottom: 1rem;"><strong>건강식품 관심 증가</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">면역력 강화 트렌드</span></li>
+                <li style="margin-bottom: 1rem;"><strong>채식/비건 확산</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">MZ세대 주도</span></li>
+                <li><strong>스마트팜 연계</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">생산량 증가</span></li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="insight-card">
+            <h4 style="font-size: 1.3rem; font-weight: bold; margin-bottom: 1rem;">🎯 타겟별 마케팅</h4>
+            <ul style="list-style: none; padding: 0;">
+                <li style="margin-bottom: 1rem;"><strong>40~50대</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">면역·콜레스테롤 중심</span></li>
+                <li style="margin-bottom: 1rem;"><strong>20~30대</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">비건·레시피 콘텐츠</span></li>
+                <li><strong>60대+</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">전통요리·건강식품</span></li>
+            </ul>    
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="insight-card">
+            <h4 style="font-size: 1.3rem; font-weight: bold; margin-bottom: 1rem;">📱 콘텐츠 전략</h4>
+            <ul style="list-style: none; padding: 0;">
+                <li style="margin-bottom: 1rem;"><strong>균형 배치</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">요리 {topic_pct["요리/레시피"]}% vs 건강 {topic_pct["건강/효능"]}%</span></li>
+                <li style="margin-bottom: 1rem;"><strong>계절 맞춤</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">봄=레시피, 겨울=면역</span></li>
+                <li><strong>긍정 브랜딩</strong><br><span style="font-size: 0.9rem; opacity: 0.9;">{positive["Percentage"]}% 긍정 감성 활용</span></li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Footer
+    st.markdown("---")
+    st.markdown(f"""
+    <div style="text-align: center; color: #666; padding: 2rem 0;">
+        <p style="margin-bottom: 0.5rem;"><strong>📊 데이터 출처</strong>: 네이버·인스타그램·유튜브 | 
+        <strong>📅 분석 기간</strong>: {first_year}–{last_year}년 | 
+        <strong>🔬 분석 기법</strong>: 텍스트 마이닝·감성분석·토픽모델링</p>
+        <p style="font-size: 1.1rem;">🍄 <em>Made with ❤️ by Premium Data Analytics Team</em></p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,88 @@
+import streamlit as st
+
+from shiitake.charts import indicator_chart
+from shiitake.config import CSV_MACRO
+from shiitake.indicators import INDICATORS
+from shiitake.perf import stage
+from views.loaders import get_snapshot
+
+def socioecon_page():
+    st.markdown("""
+    <style>
+    .section-headline {
+        font-size: 2rem;
+        font-weight: 900;
+        color: #8B4513;
+        margin-bottom: 5px;
+        margin-top: 5px;
+        letter-spacing: -0.5px;
+    }
+    .section-desc {
+        color: #98713D;
+        font-size: 1.08rem;
+        font-weight: 500;
+        margin-bottom: 24px;
+        margin-top: -8px;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="section-headline">📈 사회경제 지표 (2022–2025)</div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-desc">표고버섯 생산에 영향을 미치는 주요 경제 지표</div>', unsafe_allow_html=True)
+
+
+
+    with stage("socioecon", "load"):
+        data = get_snapshot().indicators
+    if data is None:
+        st.error(f"❌ 파일 로드 실패: {CSV_MACRO}")
+        return
+    if data.df.empty:
+        return
+
+    dmin = data.df.index.min().date()
+    dmax = data.df.index.max().date()
+
+    # 전체 지표 공통 기간
+    c1, c2 = st.columns(2)
+    with c1:
+        start = st.date_input("시작일", value=dmin, min_value=dmin, max_value=dmax, key="socio_start")
+    with c2:
+        end = st.date_input("종료일", value=dmax, min_value=dmin, max_value=dmax, key="socio_end")
+
+    # 지표별 개별 기간 (선택)
+    ranges = {ind: (start, end) for ind in data.columns}
+    with st.expander("🗓️ 지표별 기간 따로 설정"):
+        for ind in data.columns:
+            if st.checkbox(ind, key=f"{ind}_custom"):
+                picked = st.date_input(
+                    f"{ind} 기간",
+                    value=(start, end),
+                    min_value=dmin,
+                    max_value=dmax,
+                    key=f"{ind}_range"
+                )
+                if len(picked) == 2:
+                    ranges[ind] = picked
+
+    # 여섯 지표의 기간을 한 번에 잘라냄 (복사 없음)
+    with stage("socioecon", "filter"):
+        series_by_ind = data.slices(ranges)
+
+    # 3×2 그리드
+    for row in [INDICATORS[:3], INDICATORS[3:]]:
+        cols = st.columns(3, gap="small")
+        for ind, col in zip(row, cols):
+            with col:
+                if ind not in series_by_ind:
+                    st.warning(f"⚠️ '{ind}' 컬럼이 없습니다.")
+                    continue
+
+                st.markdown(f'<div class="section-title">{ind}</div>', unsafe_allow_html=True)
+                series = series_by_ind[ind]
+                ind_start, ind_end = ranges[ind]
+
+                # 흰색 박스 내부에 그래프 출력 (같은 지표·기간·데이터 버전이면 캐시된 이미지 재사용)
+                with st.container(border=True), stage("socioecon", "render"):
+                    png = indicator_chart((ind, data.version, ind_start, ind_end), series.index, series, ind)
+                    st.image(png, use_container_width=True)